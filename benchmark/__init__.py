@@ -0,0 +1,3 @@
+from benchmark.generator import ConfigGenerator
+from benchmark.runner import (Benchmark, compare_reports, read_report,
+                              run_benchmarks, write_report)
@@ -0,0 +1,63 @@
+import logging
+import sys
+
+import click
+
+from benchmark.generator import ConfigGenerator
+from benchmark.runner import (compare_reports, read_report, run_benchmarks,
+                              write_report)
+from openhab_creator import logger
+
+
+@click.group()
+def cli():
+    logger.setLevel(logging.ERROR)
+
+
+@cli.command()
+@click.argument('configdir', type=click.Path())
+@click.option('--equipment', 'equipment_count', type=click.IntRange(min=1), default=100)
+def generate(configdir: str, equipment_count: int):
+    equipment = ConfigGenerator(configdir, equipment_count).generate()
+    click.echo(f'Generated {equipment} equipment in {configdir}')
+
+
+@cli.command()
+@click.option('--scale', 'scales', type=click.IntRange(min=1),
+              multiple=True, default=[10, 100, 1000])
+@click.option('--repeat', 'repeat', type=click.IntRange(min=1), default=3)
+@click.option('--report', 'reportfile', type=click.Path(), default='benchmark.json')
+@click.option('--compare', 'baselinefile', type=click.Path(exists=True), default=None)
+@click.option('--threshold', 'threshold', type=float, default=0.1)
+def run(scales, repeat: int, reportfile: str, baselinefile: str, threshold: float):
+    report = run_benchmarks(sorted(scales), repeat)
+    write_report(report, reportfile)
+
+    for scale, result in report['scales'].items():
+        click.echo(f'{scale:>6} ({result["equipment"]} equipment): '
+                   f'{result["timings"]["total"]:.3f} s')
+
+    if baselinefile is not None:
+        sys.exit(_compare(read_report(baselinefile), report, threshold))
+
+
+@cli.command()
+@click.argument('baselinefile', type=click.Path(exists=True))
+@click.argument('reportfile', type=click.Path(exists=True))
+@click.option('--threshold', 'threshold', type=float, default=0.1)
+def compare(baselinefile: str, reportfile: str, threshold: float):
+    sys.exit(_compare(read_report(baselinefile), read_report(reportfile), threshold))
+
+
+def _compare(baseline, current, threshold: float) -> int:
+    rows, regression = compare_reports(baseline, current, threshold)
+
+    click.echo(f'{baseline["version"]} -> {current["version"]}')
+    for scale, key, before, after, change in rows:
+        click.echo(f'{scale:>6} {key:<60} {before:9.3f} s {after:9.3f} s {change:+8.1%}')
+
+    return 1 if regression else 0
+
+
+if __name__ == '__main__':
+    cli(prog_name='benchmark')
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+FLOOR_TYPES = ['Basement', 'GroundFloor', 'FirstFloor',
+               'SecondFloor', 'ThirdFloor', 'Attic']
+
+ROOM_TYPES = ['LivingRoom', 'Kitchen', 'Bedroom', 'Bathroom', 'Office',
+              'DiningRoom', 'GuestRoom', 'FamilyRoom', 'Entry', 'Cellar',
+              'LaundryRoom', 'BoilerRoom']
+
+ROOMS_PER_FLOOR = 10
+EQUIPMENT_PER_ROOM = 8
+
+
+def _lightbulb(index: int) -> Dict[str, Any]:
+    variants = [
+        {'template': 'colortemperaturelight'},
+        {'typed': 'lightbulb', 'nightmode': True,
+         'thing': {'bridge': 'zigbee', 'thingtype': 'onofflight'},
+         'points': {'onoff': 'switch'}},
+        {'typed': 'lightbulb',
+         'thing': {'bridge': 'zigbee', 'thingtype': 'colorlight'},
+         'points': {'rgb': 'color', 'brightness': 'brightness'}},
+        {'typed': 'lightbulb', 'singlebulb': True,
+         'thing': {'bridge': 'zigbee', 'thingtype': 'dimmablelight'},
+         'points': {'brightness': 'brightness'}}
+    ]
+
+    return {'name': f'Licht {index}', **variants[index % len(variants)]}
+
+
+def _wallswitch(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'wallswitch',
+        'name': f'Schalter {index}',
+        'buttons': [
+            {'label': 'oben', 'events': ['1002', '1003']},
+            {'label': 'unten', 'events': ['2002', '2003']}
+        ],
+        'thing': {'bridge': 'zigbee', 'thingtype': 'switch'},
+        'points': {'button': 'buttonevent', 'trigger': 'buttonevent',
+                   'battery_level': 'battery_level'}
+    }
+
+
+def _motiondetector(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'motiondetector',
+        'name': f'Bewegung {index}',
+        'thing': {'bridge': 'zigbee', 'thingtype': 'presencesensor'},
+        'points': {'presence': 'presence', 'battery_low': 'battery_low'}
+    }
+
+
+def _sensor(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'sensor',
+        'name': f'Klima {index}',
+        'thing': {'bridge': 'zigbee', 'thingtype': 'temperaturesensor'},
+        'points': {'temperature': 'temperature', 'humidity': 'humidity',
+                   'pressure': 'pressure', 'battery_level': 'battery_level'}
+    }
+
+
+def _window(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'window',
+        'name': f'Fenster {index}',
+        'remindertime': index % 2 == 0,
+        'thing': {'bridge': 'zigbee', 'thingtype': 'openclosesensor'},
+        'points': {'open': 'open', 'battery_level': 'battery_level'}
+    }
+
+
+def _heating(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'heating',
+        'name': f'Heizung {index}',
+        'boost': True,
+        'heatmode': {'auto': 'auto', 'off': 'off'},
+        'thing': {'bridge': 'zigbee', 'thingtype': 'thermostat'},
+        'points': {'heatsetpoint': 'heatsetpoint', 'heatmode': 'mode',
+                   'valveposition': 'valve', 'temperature': 'temperature',
+                   'battery_level': 'battery_level'}
+    }
+
+
+def _poweroutlet(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'poweroutlet',
+        'name': f'Steckdose {index}',
+        'thing': {'bridge': 'zigbee', 'thingtype': 'onofflight'},
+        'points': {'onoff': 'switch', 'power': 'power'}
+    }
+
+
+def _whitegood(index: int) -> Dict[str, Any]:
+    typed = ['washingmachine', 'dryer',
+             'washingmachinedryer', 'dishwasher'][index % 4]
+
+    return {
+        'typed': typed,
+        'name': f'Geraet {index}',
+        'powerlimits': {'start': 5.0, 'standby': 1.5},
+        'reminder': {'typed': 'cycles', 'cycles': 20, 'message': 'Reinigen'},
+        'thing': {'bridge': 'zigbee', 'thingtype': 'onofflight'},
+        'points': {'onoff': 'switch', 'power': 'power'}
+    }
+
+
+def _warmwaterpump(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'warmwaterpump',
+        'name': f'Pumpe {index}',
+        'thing': {'bridge': 'zigbee', 'thingtype': 'onofflight'},
+        'points': {'onoff': 'switch', 'power': 'power'}
+    }
+
+
+def _networkappliance(index: int) -> Dict[str, Any]:
+    return {
+        'typed': 'networkappliance',
+        'name': f'Netzwerk {index}',
+        'thing': {'bridge': 'network', 'thingtype': 'pingdevice',
+                  'properties': {'hostname': f'10.0.{index // 250}.{index % 250 + 1}'}},
+        'points': {'online': 'online'}
+    }
+
+
+ROOM_EQUIPMENT: List[Callable[[int], Dict[str, Any]]] = [
+    _lightbulb, _wallswitch, _lightbulb, _motiondetector, _sensor, _window,
+    _heating, _poweroutlet, _lightbulb, _whitegood, _warmwaterpump,
+    _networkappliance
+]
+
+
+class ConfigGenerator():
+    def __init__(self, configdir: str, equipment_count: int, persons: Optional[int] = 2):
+        self.configdir: str = configdir
+        self.equipment_count: int = equipment_count
+        self.persons: int = persons
+
+        self.secrets: Dict[str, Any] = {}
+        self.generated: int = 0
+
+    def generate(self) -> int:
+        self.secrets = {
+            'influxdb': {'host': 'http://localhost:8086', 'token': 'benchmark',
+                         'organization': 'benchmark', 'url': 'http://localhost:8086'},
+            'ephemeris': {
+                'holidays': ['C EASTER', 'F 1.1. Neujahr', 'F 25.12. Weihnachten'],
+                'birthdays': []
+            },
+            'mapdb': {}
+        }
+        self.generated = 0
+
+        self._write_json(['bridges', 'zigbee.json'], {
+            'binding': 'deconz', 'name': 'Deconz',
+            'thing': {'thingtype': 'deconz', 'properties': {'host': '127.0.0.1'}}
+        })
+        self._write_json(['bridges', 'network.json'],
+                         {'binding': 'network', 'name': 'Network'})
+        self._write_json(['bridges', 'icalendar.json'],
+                         {'binding': 'icalendar', 'name': 'iCalendar'})
+        self._write_json(['bridges', 'gpstracker.json'],
+                         {'binding': 'gpstracker', 'name': 'GPSTracker'})
+        self._write_json(['bridges', 'dwdpollenflug.json'],
+                         {'binding': 'dwdpollenflug', 'name': 'DWD Pollenflug'})
+        self._write_json(['bridges', 'tr064.json'], {
+            'binding': 'tr064', 'name': 'FritzBox',
+            'thing': {'thingtype': 'fritzbox',
+                      'properties': {'host': '127.0.0.1', 'phonebookInterval:int': '600'}}
+        })
+        self._write_json(['bridges', 'avmfritz.json'],
+                         {'binding': 'avmfritz', 'name': 'AVM Fritz'})
+        self._write_json(['bridges', 'tankerkoenig.json'],
+                         {'binding': 'tankerkoenig', 'name': 'Tankerkoenig'})
+        self._write_json(['bridges', 'vwweconnect.json'],
+                         {'binding': 'vwweconnect', 'name': 'We Connect'})
+        self._write_json(['bridges', 'modbus.json'],
+                         {'binding': 'modbus', 'name': 'Modbus'})
+        self._write_json(['bridges', 'astro.json'],
+                         {'binding': 'astro', 'name': 'Astro'})
+        self._write_json(['bridges', 'openweathermap.json'],
+                         {'binding': 'openweathermap', 'name': 'OpenWeatherMap'})
+
+        self._write_json(['templates', 'colortemperaturelight.json'], {
+            'typed': 'lightbulb', 'min_colortemp': 2000, 'max_colortemp': 6500,
+            'secrets': ['uid'],
+            'thing': {'bridge': 'zigbee', 'thingtype': 'colortemperaturelight',
+                      'thinguid': '{uid}'},
+            'points': {'brightness': 'brightness',
+                       'colortemperature': 'color_temperature'}
+        })
+
+        self._write_json(['general.json'], self._general())
+        self._write_json(['persons.json'], self._persons())
+        self._write_json(['locations', 'outdoors.json'], self._outdoors())
+        self._write_json(['locations', 'cars.json'], self._cars())
+        self._write_json(['locations', 'energymanagement.json'],
+                         self._energymanagement())
+        self._write_locations()
+
+        for directory in ['ephemeris', 'html', 'icons']:
+            os.makedirs(os.path.join(self.configdir, directory), exist_ok=True)
+
+        self._write_file(['html', 'index.html'], '<html></html>\n')
+
+        with open(os.path.join(self.configdir, 'secrets.yaml'), 'w', encoding='utf-8') as fobj:
+            yaml.safe_dump(self.secrets, fobj, allow_unicode=True)
+
+        return self.generated
+
+    def _general(self) -> List[Dict[str, Any]]:
+        self.secrets['learninghouse'] = {
+            'windowopen': {'baseurl': 'http://localhost:5000'}}
+
+        general = [
+            {'typed': 'reminder', 'name': 'Filter', 'message': 'Filter wechseln',
+             'interval': 30, 'time': '18:00'},
+            {'typed': 'reminder', 'name': 'Zaehler', 'message': 'Zaehler ablesen',
+             'counter': 90},
+            {'typed': 'callmonitor', 'name': 'Telefon',
+             'thing': {'bridge': 'avmfritz', 'thingtype': 'callmonitor'},
+             'points': {'callstate': 'callstate', 'incoming': 'incoming'}},
+            {'typed': 'learninghouse', 'name': 'Fenster offen',
+             'identifier': 'windowopen', 'model_name': 'windowopen'}
+        ]
+
+        self.generated += len(general)
+
+        return general
+
+    def _outdoors(self) -> List[Dict[str, Any]]:
+        outdoors = [
+            {'typed': 'Terrace', 'name': 'Terrasse', 'equipment': [_sensor(0)]},
+            {'typed': 'Garden', 'name': 'Garten', 'equipment': [
+                {'typed': 'astro', 'name': 'Sonne',
+                 'thing': {'bridge': 'astro', 'thingtype': 'sun', 'thinguid': 'local'},
+                 'points': {'azimuth': 'position#azimuth', 'elevation': 'position#elevation',
+                            'rise': 'rise#start', 'set': 'set#start'}},
+                {'typed': 'astro', 'name': 'Mond',
+                 'thing': {'bridge': 'astro', 'thingtype': 'moon', 'thinguid': 'local'},
+                 'points': {'phase': 'phase#name', 'full': 'full#date'}},
+                {'typed': 'weatherstation', 'name': 'Wetter',
+                 'thing': {'bridge': 'openweathermap', 'thingtype': 'onecall',
+                           'thinguid': 'local'},
+                 'points': {'temperature': 'current#temperature',
+                            'humidity': 'current#humidity',
+                            'pressure': 'current#pressure',
+                            'condition_id': 'current#condition-id'}},
+                {'typed': 'pollencount', 'name': 'Pollenflug',
+                 'thing': {'bridge': 'dwdpollenflug', 'thingtype': 'region',
+                           'thinguid': '50'}}
+            ]},
+            {'typed': 'Driveway', 'name': 'Einfahrt', 'equipment': [
+                {'typed': 'garbagecan', 'name': 'Restmuell',
+                 'message': 'Restmuell rausstellen',
+                 'thing': {'bridge': 'icalendar', 'thingtype': 'eventfilter'},
+                 'points': {'title': 'result_0#title', 'begin': 'result_0#begin'}},
+                {'typed': 'garbagecan', 'name': 'Papier',
+                 'message': 'Papier rausstellen',
+                 'thing': {'bridge': 'icalendar', 'thingtype': 'eventfilter'},
+                 'points': {'title': 'result_0#title', 'begin': 'result_0#begin'}}
+            ]}
+        ]
+
+        self.generated += sum(len(location['equipment']) for location in outdoors)
+
+        return outdoors
+
+    def _cars(self) -> List[Dict[str, Any]]:
+        self.generated += 2
+
+        return [{'typed': 'Cars', 'name': 'Autos', 'equipment': [
+            {'typed': 'car', 'name': 'Auto',
+             'thing': {'bridge': 'vwweconnect', 'thingtype': 'vehicle'},
+             'points': {'odometer': 'odometer#totalAverageSpeed',
+                        'lastUpdate': 'lastTrip#tripEndTime',
+                        'vehicleLocked': 'doors#doorsLocked',
+                        'doorsClosed': 'doors#doorsClosed',
+                        'windowsClosed': 'windows#windowsClosed',
+                        'climaterControl': 'climater#remoteHeater',
+                        'climaterTargetTemperature': 'climater#targetTemperature',
+                        'chargerControl': 'charger#remoteCharger'}},
+            {'typed': 'gasstation', 'name': 'Tankstelle',
+             'thing': {'bridge': 'tankerkoenig', 'thingtype': 'station'},
+             'points': {'diesel': 'diesel', 'e10': 'e10', 'e5': 'e5', 'opened': 'station_open'}}
+        ]}]
+
+    def _energymanagement(self) -> List[Dict[str, Any]]:
+        self.generated += 2
+
+        return [{'typed': 'EnergyManagement', 'name': 'Energie', 'equipment': [
+            {'typed': 'pvsystem', 'name': 'PV',
+             'thing': {'bridge': 'modbus', 'thingtype': 'inverter'},
+             'points': {point: point for point in [
+                 'power_pv', 'energy_pv_today', 'energy_produced', 'power_grid',
+                 'power_grid_consumption', 'power_grid_delivery', 'power_battery',
+                 'power_battery_charge', 'power_battery_discharge', 'battery_soc',
+                 'power_house', 'power_inverter_production',
+                 'power_inverter_consumption', 'power_inverter_pv_production']}},
+            {'typed': 'smartmeter', 'name': 'Zaehler',
+             'thing': {'bridge': 'modbus', 'thingtype': 'meter'},
+             'points': {'consumed_total': 'consumed', 'delivered_total': 'delivered',
+                        'power_total': 'power'}}
+        ]}]
+
+    def _persons(self) -> List[List[Dict[str, Any]]]:
+        persons = []
+
+        for key in range(0, self.persons):
+            self.secrets[f'person{key}'] = {'identifier': f'Person{key}'}
+
+            persons.append([
+                {'typed': 'smartphone', 'name': 'Smartphone',
+                 'thing': {'bridge': 'gpstracker', 'thingtype': 'tracker'},
+                 'points': {'distance': 'distanceSystem', 'accuracy': 'gpsAccuracy',
+                            'position': 'lastLocation', 'lastseen': 'lastReport'}},
+                {'typed': 'personstate', 'name': 'Urlaub', 'statetype': 'holidays',
+                 'thing': {'bridge': 'icalendar', 'thingtype': 'eventfilter'},
+                 'points': {'begin': 'result_0#begin', 'begin_next': 'result_1#begin'}},
+                {'typed': 'personstate', 'name': 'Homeoffice',
+                 'statetype': 'homeoffice',
+                 'thing': {'bridge': 'icalendar', 'thingtype': 'eventfilter'},
+                 'points': {'begin': 'result_0#begin'}}
+            ])
+
+            self.generated += 3
+
+        return persons
+
+    def _write_locations(self) -> None:
+        remaining = max(self.equipment_count - self.generated, 0)
+        rooms = max((remaining + EQUIPMENT_PER_ROOM - 1) //
+                    EQUIPMENT_PER_ROOM, 1)
+        floors = (rooms + ROOMS_PER_FLOOR - 1) // ROOMS_PER_FLOOR
+
+        counter = 0
+
+        for floor_index in range(0, floors):
+            floor_id = f'F{floor_index:02d}'
+            floor = {
+                'typed': FLOOR_TYPES[floor_index % len(FLOOR_TYPES)],
+                'name': f'Etage {floor_index}',
+                'identifier': floor_id,
+                'rooms': []
+            }
+
+            for room_index in range(0, min(ROOMS_PER_FLOOR, rooms - floor_index * ROOMS_PER_FLOOR)):
+                room_id = f'{floor_id}R{room_index:02d}'
+                equipment = []
+
+                for index in range(0, min(EQUIPMENT_PER_ROOM, remaining)):
+                    factory = ROOM_EQUIPMENT[counter % len(ROOM_EQUIPMENT)]
+                    equipment.append(self._equipment(
+                        room_id, factory(index), counter))
+                    counter += 1
+                    remaining -= 1
+
+                floor['rooms'].append({
+                    'typed': ROOM_TYPES[(floor_index + room_index) % len(ROOM_TYPES)],
+                    'name': f'Raum {floor_index}.{room_index}',
+                    'identifier': room_id,
+                    'equipment': equipment
+                })
+
+            self._write_json(['locations', 'indoor', 'floors',
+                              f'{floor_index:03d}_{floor_id}.json'], floor)
+
+        self.generated += counter
+
+    def _equipment(self, room_id: str, equipment: Dict[str, Any], counter: int) -> Dict[str, Any]:
+        if equipment.get('template') == 'colortemperaturelight':
+            identifier = f'{room_id}{equipment["name"]}'.replace(' ', '')
+            self.secrets.setdefault('deconz', {}).setdefault('lightbulb', {})[
+                identifier.lower()] = {'uid': f'{counter:05d}'}
+
+        return equipment
+
+    def _write_json(self, path: List[str], content: Any) -> None:
+        self._write_file(path, json.dumps(content, indent=1, ensure_ascii=False))
+
+    def _write_file(self, path: List[str], content: str) -> None:
+        destination = os.path.join(self.configdir, *path)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+        with open(destination, 'w', encoding='utf-8') as fobj:
+            fobj.write(content)
+
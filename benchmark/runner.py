@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from openhab_creator import _, __version__
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.models.configuration import Configuration
+from openhab_creator.models.sitemap import Page, Sitemap
+from openhab_creator.output.content import EphemerisCreator
+from openhab_creator.output.items import ItemsCreatorPipeline
+from openhab_creator.output.sitemap import SitemapCreatorPipeline
+from openhab_creator.output.things import ThingsCreator
+
+from benchmark.generator import ConfigGenerator
+
+
+class Benchmark():
+    def __init__(self, equipment_count: int, repeat: Optional[int] = 3,
+                 workdir: Optional[str] = None):
+        self.equipment_count: int = equipment_count
+        self.repeat: int = repeat
+        self.workdir: Optional[str] = workdir
+
+        self.timings: Dict[str, List[float]] = {}
+
+    def run(self) -> Dict:
+        workdir = self.workdir or tempfile.mkdtemp(prefix='openhab_creator_')
+
+        try:
+            configdir = os.path.join(workdir, 'config')
+            outputdir = os.path.join(workdir, 'output')
+
+            equipment = ConfigGenerator(
+                configdir, self.equipment_count).generate()
+
+            for _repeat in range(0, self.repeat):
+                shutil.rmtree(outputdir, ignore_errors=True)
+                os.makedirs(outputdir)
+                self._run_once(configdir, outputdir)
+        finally:
+            if self.workdir is None:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+        return {
+            'equipment': equipment,
+            'repeat': self.repeat,
+            'timings': {key: min(values) for key, values in self.timings.items()}
+        }
+
+    def _run_once(self, configdir: str, outputdir: str) -> None:
+        with BuildContext.activate(BuildContext()), self._timed('total'):
+            with self._timed('configuration'):
+                configuration = Configuration(
+                    'Benchmark', configdir, False)
+
+            with self._timed('things'):
+                ThingsCreator(outputdir).build(configuration)
+
+            for creator in ItemsCreatorPipeline.creators(configuration):
+                creator_cls = creator['class']
+                with self._timed(f'items.{creator_cls.__name__}'):
+                    creator_cls(outputdir).build(configuration)
+
+            with self._timed('sitemap'):
+                self._build_sitemap(configuration)
+
+            with self._timed('ephemeris'):
+                EphemerisCreator(outputdir).build(configuration)
+
+    def _build_sitemap(self, configuration: Configuration) -> None:
+        pages = {
+            'mainpage': Sitemap('default', configuration.name),
+            'statuspage': Page(label=_('State')),
+            'configpage': Page(label=_('Configuration'))
+        }
+
+        for page_key in SitemapCreatorPipeline.PAGES:
+            for creator_cls in SitemapCreatorPipeline.creators(page_key, configuration):
+                with self._timed(f'sitemap.{page_key}.{creator_cls.__name__}'):
+                    getattr(creator_cls(), f'build_{page_key}')(
+                        pages[page_key], configuration)
+
+        pages['mainpage'].second_frame\
+            .element(pages['statuspage'])\
+            .element(pages['configpage'])
+
+        with self._timed('sitemap.dump'):
+            pages['mainpage'].dump()
+
+    @contextmanager
+    def _timed(self, key: str) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.timings.setdefault(key, []).append(time.perf_counter() - start)
+
+
+def run_benchmarks(scales: List[int], repeat: int) -> Dict:
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'scales': {str(scale): Benchmark(scale, repeat).run() for scale in scales}
+    }
+
+
+def read_report(reportfile: str) -> Dict:
+    with open(reportfile, encoding='utf-8') as fobj:
+        return json.load(fobj)
+
+
+def write_report(report: Dict, reportfile: str) -> None:
+    with open(reportfile, 'w', encoding='utf-8') as fobj:
+        json.dump(report, fobj, indent=2, sort_keys=True)
+
+
+def compare_reports(baseline: Dict, current: Dict,
+                    threshold: float) -> Tuple[List[Tuple[str, str, float, float, float]], bool]:
+    rows = []
+    regression = False
+
+    for scale, result in current['scales'].items():
+        if scale not in baseline['scales']:
+            continue
+
+        baseline_timings = baseline['scales'][scale]['timings']
+        for key, seconds in sorted(result['timings'].items()):
+            if key not in baseline_timings:
+                continue
+
+            before = baseline_timings[key]
+            change = (seconds - before) / before if before > 0 else 0.0
+            rows.append((scale, key, before, seconds, change))
+
+            if key == 'total' and change > threshold:
+                regression = True
+
+    return rows, regression
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, Optional
+
+from openhab_creator.creator import Creator
+from openhab_creator.exception import BuildException
+from openhab_creator.output.sinks import MemorySink, OutputSink
+
+VIRTUAL_OUTPUTDIR = '.openhab_creator_output'
+
+
+def render(configdir: str, sink: OutputSink,
+           name: Optional[str] = 'openHAB',
+           anonym: Optional[bool] = False,
+           offline: Optional[bool] = False,
+           icons: Optional[bool] = False,
+           icon_sizes: Optional[Iterable[int]] = (),
+           icon_sprite: Optional[bool] = False,
+           icon_cachedir: Optional[str] = None,
+           jobs: Optional[int] = 1) -> None:
+    #pylint: disable=too-many-arguments
+    outputdir = os.path.join(os.path.abspath(configdir), VIRTUAL_OUTPUTDIR)
+
+    sink.mount(outputdir)
+    sink.mount(os.path.join(configdir, 'documentation'), 'documentation/')
+
+    creator = Creator(name, configdir, outputdir,
+                      anonym=anonym, check_only=False,
+                      icons=icons, incremental=False,
+                      jobs=jobs, profile=False, staged=False,
+                      offline=offline, icon_sizes=tuple(icon_sizes),
+                      icon_sprite=icon_sprite,
+                      sink=sink, icon_cachedir=icon_cachedir)
+
+    try:
+        if not creator.run():
+            raise BuildException('Missing secrets')
+    finally:
+        sink.close()
+
+
+def build(configdir: str, name: Optional[str] = 'openHAB', **options) -> Dict[str, bytes]:
+    sink = MemorySink()
+    render(configdir, sink, name, **options)
+
+    return dict(sorted(sink.files.items()))
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from openhab_creator import logger
+from openhab_creator.exception import ConfigurationException
+from openhab_creator.plugins import PluginManifest
+
+
+class BatchSite():
+    OPTIONS = ('anonym', 'icons', 'incremental', 'offline', 'staged')
+
+    def __init__(self, name: str, configdir: str, outputdir: str,
+                 **options: Dict[str, bool]):
+        self.name: str = name
+        self.configdir: str = configdir
+        self.outputdir: str = outputdir
+
+        unknown = set(options) - set(self.OPTIONS)
+        if unknown:
+            raise ConfigurationException(
+                f'Unknown batch options for site {name}: {", ".join(sorted(unknown))}')
+
+        self.options: Dict[str, bool] = options
+
+
+class BatchBuilder():
+    templates: Optional[Dict[str, Dict]] = None
+
+    def __init__(self, manifestfile: str,
+                 jobs: Optional[int] = None,
+                 defaults: Optional[Dict[str, bool]] = None):
+        self.manifestfile: str = manifestfile
+        self.jobs: int = jobs or os.cpu_count() or 1
+        self.defaults: Dict[str, bool] = defaults or {}
+
+        self.templatesdir: Optional[str] = None
+        self.sites: List[BatchSite] = []
+
+        self._read()
+
+    def _read(self) -> None:
+        basedir = os.path.dirname(os.path.abspath(self.manifestfile))
+
+        with open(self.manifestfile, encoding='utf-8') as fobj:
+            manifest = yaml.safe_load(fobj) or {}
+
+        if 'templates' in manifest:
+            self.templatesdir = os.path.join(basedir, manifest['templates'])
+
+        for site in manifest.get('sites', []):
+            site = {**self.defaults, **site}
+            for key in ('configdir', 'outputdir'):
+                site[key] = os.path.join(basedir, site[key])
+
+            self.sites.append(BatchSite(**site))
+
+        names = [site.name for site in self.sites]
+        if len(names) != len(set(names)):
+            raise ConfigurationException(
+                f'Duplicate site names in batch manifest {self.manifestfile}')
+
+    def run(self) -> bool:
+        start = time.perf_counter()
+        jobs = min(self.jobs, len(self.sites)) or 1
+
+        logger.info('Batch build of %d sites with %d workers',
+                    len(self.sites), jobs)
+
+        with multiprocessing.Pool(jobs, self._init_worker, (self.templatesdir,)) as pool:
+            results = {name: (duration, error) for name, duration, error
+                       in pool.imap_unordered(self._build, self.sites)}
+
+        failed = 0
+        for site in self.sites:
+            duration, error = results[site.name]
+            if error is None:
+                logger.info('%-24s %8.2f s  ok', site.name, duration)
+            else:
+                failed += 1
+                logger.error('%-24s %8.2f s  FAILED: %s',
+                             site.name, duration, error.strip().splitlines()[-1])
+                logger.debug(error)
+
+        logger.info('Batch finished in %.2f s: %d built, %d failed',
+                    time.perf_counter() - start, len(self.sites) - failed, failed)
+
+        return failed == 0
+
+    @classmethod
+    def _init_worker(cls, templatesdir: Optional[str]) -> None:
+        #pylint: disable=import-outside-toplevel
+        from openhab_creator.models.configuration import Configuration
+
+        PluginManifest.preload()
+
+        if templatesdir is not None:
+            cls.templates = Configuration.read_jsons_from_dir(templatesdir, '')
+
+    @classmethod
+    def _build(cls, site: BatchSite) -> Tuple[str, float, Optional[str]]:
+        #pylint: disable=import-outside-toplevel,broad-except
+        from openhab_creator.creator import Creator
+
+        start = time.perf_counter()
+        error = None
+
+        try:
+            if not os.path.isdir(site.configdir):
+                raise ConfigurationException(
+                    f'Configuration directory {site.configdir} does not exist')
+
+            os.makedirs(site.outputdir, exist_ok=True)
+
+            creator = Creator(site.name, site.configdir, site.outputdir,
+                              anonym=site.options.get('anonym', False),
+                              check_only=False,
+                              icons=site.options.get('icons', False),
+                              incremental=site.options.get(
+                                  'incremental', False),
+                              jobs=1, profile=False,
+                              staged=site.options.get('staged', False),
+                              offline=site.options.get('offline', False),
+                              icon_sizes=(), icon_sprite=False,
+                              templates=cls.templates)
+
+            if not creator.run():
+                error = 'Build aborted, see log for missing secrets'
+        except Exception:
+            error = traceback.format_exc()
+
+        return site.name, time.perf_counter() - start, error
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    from openhab_creator.output.buildcache import BuildCache
+    from openhab_creator.output.outputstream import OutputStream
+    from openhab_creator.output.sinks import OutputSink
+    from openhab_creator.profiler import Profiler
+
+
+class BuildContext():
+    REGISTRIES = ('influxdb_series', 'influxdb_measurements',
+                  'aisensors', 'icons')
+
+    _current: ContextVar[Optional[BuildContext]] = ContextVar(
+        'build_context', default=None)
+    _default: Optional[BuildContext] = None
+
+    def __init__(self, sink: Optional[OutputSink] = None,
+                 build_cache: Optional[BuildCache] = None,
+                 profiler: Optional[Profiler] = None):
+        self.sink: Optional[OutputSink] = sink
+        self.build_cache: Optional[BuildCache] = build_cache
+        self.profiler: Optional[Profiler] = profiler
+        self.streams: List[OutputStream] = []
+
+        self.influxdb_series: Dict[str, Dict] = {}
+        self.influxdb_measurements: Dict[str, bool] = {}
+        self.aisensors: Dict[str, str] = {}
+        self.icons: Dict[str, str] = {}
+
+    @classmethod
+    def current(cls) -> BuildContext:
+        context = cls._current.get()
+
+        if context is None:
+            if cls._default is None:
+                cls._default = BuildContext()
+            context = cls._default
+
+        return context
+
+    @classmethod
+    @contextmanager
+    def activate(cls, context: BuildContext) -> Iterator[BuildContext]:
+        token = cls._current.set(context)
+        try:
+            yield context
+        finally:
+            cls._current.reset(token)
+
+    def registries(self) -> Dict[str, Dict]:
+        return {name: getattr(self, name) for name in self.REGISTRIES}
+
+    def merge(self, other: Union[BuildContext, Dict[str, Dict]]) -> None:
+        registries = other.registries() if isinstance(other, BuildContext)\
+            else other
+
+        for name, registry in self.registries().items():
+            registry.update(registries[name])
@@ -1,8 +1,8 @@
+import sys
+
 import click
 import click_log
 
-from openhab_creator.creator import Creator
-
 from . import __version__, logger
 
 click_log.basic_config(logger)
@@ -15,10 +15,52 @@ click_log.basic_config(logger)
 @click.option('--anonym', 'anonym', is_flag=True, default=False)
 @click.option('--check-only', 'check_only', is_flag=True, default=False)
 @click.option('--icons', 'icons', is_flag=True, default=False)
+@click.option('--icon-size', 'icon_sizes', type=click.IntRange(min=1), multiple=True)
+@click.option('--icon-sprite', 'icon_sprite', is_flag=True, default=False)
+@click.option('--incremental', 'incremental', is_flag=True, default=False)
+@click.option('--jobs', 'jobs', type=click.IntRange(min=1), default=1)
+@click.option('--watch', 'watch', is_flag=True, default=False)
+@click.option('--profile', 'profile', is_flag=True, default=False)
+@click.option('--staged', 'staged', is_flag=True, default=False)
+@click.option('--offline', 'offline', is_flag=True, default=False)
 @click_log.simple_verbosity_option(logger)
-def cli(**kwargs):
+def cli(watch: bool, **kwargs):
+    #pylint: disable=import-outside-toplevel
+    if kwargs['check_only'] and not watch:
+        from openhab_creator.validator import ConfigValidator
+
+        validator = ConfigValidator(
+            kwargs['configdir'], kwargs['anonym'], kwargs['jobs'])
+        if not validator.run():
+            sys.exit(1)
+        return
+
+    from openhab_creator.creator import Creator
+    from openhab_creator.watcher import Watcher
+
     creator = Creator(**kwargs)
-    creator.run()
+
+    if watch:
+        Watcher(creator).run()
+    else:
+        creator.run()
+
+
+@click.command()
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.option('--jobs', 'jobs', type=click.IntRange(min=1), default=None)
+@click.option('--anonym', 'anonym', is_flag=True, default=False)
+@click.option('--icons', 'icons', is_flag=True, default=False)
+@click.option('--incremental', 'incremental', is_flag=True, default=False)
+@click.option('--staged', 'staged', is_flag=True, default=False)
+@click.option('--offline', 'offline', is_flag=True, default=False)
+@click_log.simple_verbosity_option(logger)
+def batch_cli(manifest: str, jobs: int, **defaults):
+    #pylint: disable=import-outside-toplevel
+    from openhab_creator.batch import BatchBuilder
+
+    if not BatchBuilder(manifest, jobs, defaults).run():
+        sys.exit(1)
 
 
 if __name__ == '__main__':
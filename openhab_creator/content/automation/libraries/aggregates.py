@@ -0,0 +1,217 @@
+# pylint: skip-file
+import math
+import threading
+import time
+
+from core.log import LOG_PREFIX, logging
+from personal.influxdbquery import InfluxDBQuery
+from personal.item import Group
+
+
+class RollingWindow(object):
+    def __init__(self, window, buckets):
+        self.window = window
+        self.buckets = buckets
+        self.bucket_seconds = float(window) / buckets
+        self.size = buckets + 2
+
+        self.index = [None] * self.size
+        self.integral = [0.0] * self.size
+        self.duration = [0.0] * self.size
+        self.last = [None] * self.size
+
+        self.value = None
+        self.since = None
+        self.seeded = None
+
+    def _bucket(self, timestamp):
+        return int(math.floor(timestamp / self.bucket_seconds))
+
+    def _slot(self, bucket):
+        slot = bucket % self.size
+
+        if self.index[slot] != bucket:
+            self.index[slot] = bucket
+            self.integral[slot] = 0.0
+            self.duration[slot] = 0.0
+            self.last[slot] = None
+
+        return slot
+
+    def _advance(self, until):
+        start = max(self.since, until - self.size * self.bucket_seconds)
+        bucket = self._bucket(start)
+
+        while start < until:
+            end = min(until, (bucket + 1) * self.bucket_seconds)
+            slot = self._slot(bucket)
+
+            if self.value is not None:
+                self.integral[slot] += self.value * (end - start)
+                self.duration[slot] += end - start
+            self.last[slot] = self.value
+
+            start = end
+            bucket += 1
+
+        self.since = max(self.since, until)
+
+    def seed(self, value, start, now):
+        self.index = [None] * self.size
+        self.value = value
+        self.since = start
+        self.seeded = now
+
+    def update(self, value, timestamp):
+        self._advance(timestamp)
+        self.value = value
+        self.last[self._slot(self._bucket(timestamp))] = value
+
+    def average(self, now):
+        self._advance(now)
+        first = self._bucket(now) - self.buckets
+
+        total = 0.0
+        duration = 0.0
+        for slot in range(self.size):
+            if self.index[slot] is not None and self.index[slot] >= first:
+                total += self.integral[slot]
+                duration += self.duration[slot]
+
+        return None if duration == 0.0 else total / duration
+
+    def delta(self, now):
+        self._advance(now)
+        bucket = self._bucket(now - self.window) - 1
+        slot = bucket % self.size
+
+        if self.index[slot] != bucket:
+            return None
+
+        historic = self.last[slot]
+        if historic is None or self.value is None:
+            return None
+
+        return self.value - historic
+
+
+class RollingAggregates(object):
+    log = logging.getLogger('{}.RollingAggregates'.format(LOG_PREFIX))
+
+    AGGREGATES = ('delta', 'average')
+    BUCKETS = 120
+    RESEED_SECONDS = 86400
+    UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+    __instance = None
+
+    @staticmethod
+    def instance():
+        if RollingAggregates.__instance is None:
+            RollingAggregates()
+
+        return RollingAggregates.__instance
+
+    def __init__(self):
+        if RollingAggregates.__instance is None:
+            self.windows = {}
+            self.lock = threading.RLock()
+
+            RollingAggregates.__instance = self
+        else:
+            raise RuntimeError('This class is a singleton')
+
+    @classmethod
+    def parse_window(cls, window):
+        return int(window[:-1]) * cls.UNITS[window[-1]]
+
+    def delta(self, item):
+        with self.lock:
+            window = self._window(item, 'delta')
+            return None if window is None else window.delta(time.time())
+
+    def average(self, item):
+        with self.lock:
+            window = self._window(item, 'average')
+            return None if window is None else window.average(time.time())
+
+    def update(self, item):
+        now = time.time()
+        value = item.get_float()
+
+        with self.lock:
+            for aggregate in self.AGGREGATES:
+                window = self.windows.get((item.name, aggregate))
+                if window is not None:
+                    window.update(value, now)
+
+    def reconcile(self):
+        with self.lock:
+            now = time.time()
+
+            drifted = []
+            for item in Group('Aggregate'):
+                value = item.get_float()
+                windows = [self.windows.get((item.name, aggregate))
+                           for aggregate in self.AGGREGATES
+                           if item.is_scripting('aggregate_{}'.format(aggregate))]
+
+                if any(window is None or window.value != value
+                       or now - window.seeded >= self.RESEED_SECONDS
+                       for window in windows):
+                    drifted.append(item)
+
+            if len(drifted) > 0:
+                self.seed(drifted)
+
+        self.log.info('Reconciled rolling aggregates, %d items seeded', len(drifted))
+
+    def seed(self, items):
+        with self.lock:
+            self._seed(items)
+
+    def _seed(self, items):
+        requested = {}
+        for item in items:
+            for aggregate in self.AGGREGATES:
+                key = 'aggregate_{}'.format(aggregate)
+                if item.is_scripting(key):
+                    seconds = self.parse_window(item.scripting(key))
+                    requested.setdefault((aggregate, seconds), []).append(item)
+
+        now = time.time()
+        query = InfluxDBQuery.instance()
+
+        for (aggregate, seconds), aggregate_items in requested.items():
+            if aggregate == 'delta':
+                seeds = query.delta_since(aggregate_items, seconds)
+            else:
+                seeds = query.average_since(aggregate_items, seconds)
+
+            for item in aggregate_items:
+                value = item.get_float()
+                seed = seeds.get(item.name)
+
+                if aggregate == 'delta':
+                    seed = None if seed is None or value is None else value - seed
+
+                window = RollingWindow(seconds, self.BUCKETS)
+                window.seed(seed, now - seconds - 2 * window.bucket_seconds, now)
+                window.update(value, now)
+
+                self.windows[(item.name, aggregate)] = window
+
+        self.log.debug('Seeded %d rolling aggregates from persistence',
+                       sum(len(x) for x in requested.values()))
+
+    def _window(self, item, aggregate):
+        window = self.windows.get((item.name, aggregate))
+
+        if window is None and item.is_scripting('aggregate_{}'.format(aggregate)):
+            self.reconcile()
+            window = self.windows.get((item.name, aggregate))
+
+        if window is not None and window.value != item.get_float():
+            self.update(item)
+
+        return window
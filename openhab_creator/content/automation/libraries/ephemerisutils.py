@@ -1,7 +1,10 @@
 # pylint: skip-file
 import glob
 import hashlib
+import json
 import re
+from bisect import bisect_left
+from datetime import date, timedelta
 from os import mkdir, path, remove
 from shutil import copyfile
 
@@ -11,6 +14,7 @@ from core.log import LOG_PREFIX, logging
 
 class EphemerisUtils(object):
     holiday_map = {}
+    day_indexes = {}
     _initialized = False
     log = logging.getLogger(u"{}.ephemeris".format(LOG_PREFIX))
 
@@ -62,6 +66,14 @@ class EphemerisUtils(object):
 
     @classmethod
     def name_day(cls, file_key, offset=0):
+        index = cls._day_index(file_key)
+        day = date.today() + timedelta(days=offset)
+        if index is not None and index['from'] <= day <= index['until']:
+            position = bisect_left(index['dates'], day)
+            if position < len(index['dates']) and index['dates'][position] == day:
+                return index['names'][position][0]
+            return None
+
         filename = cls._init_file(file_key)
         dayname = Ephemeris.getBankHolidayName(offset, filename)
         return dayname
@@ -73,6 +85,17 @@ class EphemerisUtils(object):
 
     @classmethod
     def next_day(cls, file_key, offset=0):
+        index = cls._day_index(file_key)
+        today = date.today()
+        day = today + timedelta(days=offset)
+        if index is not None and index['from'] <= day:
+            position = bisect_left(index['dates'], day)
+            if position < len(index['dates']):
+                dayname = index['names'][position][0]
+                until = cls._until_indexed(index, dayname, today)
+                if until is not None:
+                    return {"name": dayname, "until": until}
+
         filename = cls._init_file(file_key)
         dayname = Ephemeris.getNextBankHoliday(offset, filename)
         until = Ephemeris.getDaysUntil(dayname, filename)
@@ -80,9 +103,52 @@ class EphemerisUtils(object):
 
     @classmethod
     def until_day(cls, dayname, file_key):
+        index = cls._day_index(file_key)
+        if index is not None:
+            until = cls._until_indexed(index, dayname, date.today())
+            if until is not None:
+                return until
+
         filename = cls._init_file(file_key)
         return Ephemeris.getDaysUntil(dayname, filename)
 
+    @staticmethod
+    def _until_indexed(index, dayname, today):
+        position = bisect_left(index['dates'], today)
+        for day, names in zip(index['dates'][position:], index['names'][position:]):
+            if dayname in names:
+                return (day - today).days
+
+        return None
+
+    @classmethod
+    def _day_index(cls, file_key):
+        index_file = cls.CONFIGDIR + file_key + '.json'
+        if not path.exists(index_file):
+            return None
+
+        modified = path.getmtime(index_file)
+        cached = cls.day_indexes.get(file_key)
+        if cached is None or cached['modified'] != modified:
+            with open(index_file, 'rt') as f:
+                data = json.load(f)
+
+            cached = {
+                'modified': modified,
+                'from': cls._parse_date(data['from']),
+                'until': cls._parse_date(data['until']),
+                'dates': [cls._parse_date(day) for day, _ in data['days']],
+                'names': [names for _, names in data['days']]
+            }
+            cls.day_indexes[file_key] = cached
+
+        return cached
+
+    @staticmethod
+    def _parse_date(isodate):
+        year, month, day = isodate.split('-')
+        return date(int(year), int(month), int(day))
+
     @classmethod
     def _init_file(cls, file_key):
         cache_directory = cls.CONFIGDIR + '/cache/'
@@ -3,7 +3,7 @@ import personal.autoitemmanager
 from core.log import LOG_PREFIX, logging
 from personal.autoitemmanager import AutoItemManager
 from personal.dateutils import DateUtils
-from personal.item import Group, Item
+from personal.item import Group, Item, ItemTransaction
 
 reload(personal.autoitemmanager)
 
@@ -35,15 +35,16 @@ class HeatingUtils(object):
 
     @classmethod
     def command(cls, heating_item, command):
-        is_thing = heating_item.scripting('is_thing')
+        with ItemTransaction():
+            is_thing = heating_item.scripting('is_thing')
 
-        if is_thing:
-            cls.__handle_single_command(heating_item, command)
-        else:
-            cls.__handle_group_command(heating_item, command)
+            if is_thing:
+                cls.__handle_single_command(heating_item, command)
+            else:
+                cls.__handle_group_command(heating_item, command)
 
-        heatingcontrol_item = heating_item.from_scripting('control_item')
-        heatingcontrol_item.post_update(command)
+            heatingcontrol_item = heating_item.from_scripting('control_item')
+            heatingcontrol_item.post_update(command)
 
     @classmethod
     def __handle_single_command(cls, heating_item, command):
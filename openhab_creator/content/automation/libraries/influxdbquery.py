@@ -0,0 +1,216 @@
+# pylint: skip-file
+import json
+import time
+from os import path
+
+from urllib import quote
+
+from core.actions import HTTP
+from core.log import LOG_PREFIX, logging
+from personal.dateutils import DateUtils
+
+
+class InfluxDBQuery(object):
+    log = logging.getLogger('{}.InfluxDBQuery'.format(LOG_PREFIX))
+
+    CONFIG_FILE = '/openhab/conf/services/influxdb.cfg'
+    SERIES_FILE = '/openhab/conf/automation/lib/python/personal/influxdbseries.json'
+    TIMEOUT_MS = 10000
+    CACHE_SECONDS = 300
+    HISTORIC_LOOKBACK = 2
+
+    __instance = None
+
+    @staticmethod
+    def instance():
+        if InfluxDBQuery.__instance is None:
+            InfluxDBQuery()
+
+        return InfluxDBQuery.__instance
+
+    def __init__(self):
+        if InfluxDBQuery.__instance is None:
+            self.connection = None
+            self.connection_modified = None
+            self.series = None
+            self.series_modified = None
+            self.cache = {}
+
+            InfluxDBQuery.__instance = self
+        else:
+            raise RuntimeError('This class is a singleton')
+
+    def delta_since(self, items, seconds):
+        historic_states = self._query(
+            'historic', items, seconds, self._historic_flux)
+
+        deltas = {}
+        for item in items:
+            current = item.get_float()
+            if item.name in historic_states:
+                historic = historic_states[item.name]
+                if current is None or historic is None:
+                    deltas[item.name] = None
+                else:
+                    deltas[item.name] = current - historic
+            else:
+                deltas[item.name] = item.delta_since(
+                    DateUtils.now().minusSeconds(seconds))
+
+        return deltas
+
+    def average_since(self, items, seconds):
+        averages = self._query('average', items, seconds, self._average_flux)
+
+        for item in items:
+            if item.name not in averages:
+                averages[item.name] = item.average_since(
+                    DateUtils.now().minusSeconds(seconds))
+
+        return averages
+
+    def invalidate(self):
+        self.cache = {}
+
+    def _query(self, kind, items, seconds, flux):
+        names = set(item.name for item in items)
+
+        cached = self.cache.get((kind, seconds))
+        if cached is not None:
+            queried, cached_names, values = cached
+            if time.time() - queried < self.CACHE_SECONDS and names <= cached_names:
+                return dict((name, values[name]) for name in names if name in values)
+            names |= cached_names
+
+        series = self.influxdb_series()
+        connection = self.influxdb_connection()
+
+        known = sorted(name for name in names if name in series)
+        if connection is None or len(known) == 0:
+            return {}
+
+        values = self._post(connection, flux(connection, series, known, seconds))
+        if values is None:
+            return {}
+
+        self.cache[(kind, seconds)] = (time.time(), names, values)
+        self.log.debug('Queried %s of %d items over %d s', kind, len(known), seconds)
+
+        return dict((item.name, values[item.name]) for item in items if item.name in values)
+
+    @staticmethod
+    def _filter(series, names):
+        conditions = []
+        for name in names:
+            conditions.append('(r._measurement == {} and r.item == {})'.format(
+                json.dumps(series[name]['measurement']), json.dumps(name)))
+
+        return ' or '.join(conditions)
+
+    def _historic_flux(self, connection, series, names, seconds):
+        return '\n'.join([
+            'from(bucket: {})'.format(json.dumps(connection['bucket'])),
+            '  |> range(start: -{}s, stop: -{}s)'.format(
+                self.HISTORIC_LOOKBACK * seconds, seconds),
+            '  |> filter(fn: (r) => {})'.format(self._filter(series, names)),
+            '  |> filter(fn: (r) => r._field == "value")',
+            '  |> last()',
+            '  |> group(columns: ["item"])',
+            '  |> sort(columns: ["_time"])',
+            '  |> last()',
+            '  |> keep(columns: ["item", "_value"])'
+        ])
+
+    def _average_flux(self, connection, series, names, seconds):
+        return '\n'.join([
+            'from(bucket: {})'.format(json.dumps(connection['bucket'])),
+            '  |> range(start: -{}s)'.format(seconds),
+            '  |> filter(fn: (r) => {})'.format(self._filter(series, names)),
+            '  |> filter(fn: (r) => r._field == "value")',
+            '  |> group(columns: ["item"])',
+            '  |> mean()',
+            '  |> keep(columns: ["item", "_value"])'
+        ])
+
+    def _post(self, connection, flux):
+        query = {
+            'query': flux,
+            'type': 'flux',
+            'dialect': {'header': True, 'annotations': [], 'delimiter': ','}
+        }
+
+        response = HTTP.sendHttpPostRequest(
+            '{}/api/v2/query?org={}'.format(connection['url'].rstrip('/'),
+                                            quote(connection['org'])),
+            'application/json',
+            json.dumps(query),
+            {'Authorization': 'Token {}'.format(connection['token']),
+             'Accept': 'application/csv'},
+            self.TIMEOUT_MS)
+
+        values = None if response is None else self._parse(response)
+        if values is None:
+            self.log.warn('InfluxDB query failed, falling back to persistence')
+
+        return values
+
+    @staticmethod
+    def _parse(response):
+        values = {}
+        columns = None
+
+        for line in u'{}'.format(response).splitlines():
+            row = line.strip().split(',')
+            if len(row) < 2:
+                columns = None
+            elif columns is None:
+                columns = dict((column, index) for index, column in enumerate(row))
+                if '_value' not in columns or 'item' not in columns:
+                    return None
+            elif row[columns['_value']] != '':
+                values[row[columns['item']]] = float(row[columns['_value']])
+
+        return values
+
+    def influxdb_series(self):
+        if not path.exists(self.SERIES_FILE):
+            return {}
+
+        modified = path.getmtime(self.SERIES_FILE)
+        if self.series is None or self.series_modified != modified:
+            with open(self.SERIES_FILE, 'rt') as f:
+                self.series = json.load(f)
+            self.series_modified = modified
+            self.cache = {}
+            self.log.info('InfluxDB series for %d items loaded', len(self.series))
+
+        return self.series
+
+    def influxdb_connection(self):
+        if not path.exists(self.CONFIG_FILE):
+            self.connection = None
+            self.connection_modified = None
+            return None
+
+        modified = path.getmtime(self.CONFIG_FILE)
+        if self.connection_modified != modified:
+            self.connection = None
+            self.connection_modified = modified
+            self.cache = {}
+
+            config = {}
+            with open(self.CONFIG_FILE, 'rt') as f:
+                for line in f:
+                    if '=' in line:
+                        key, value = line.split('=', 1)
+                        config[key.strip()] = value.strip()
+
+            if config.get('Version', 'V2') == 'V2':
+                self.connection = {
+                    'url': config['url'],
+                    'token': config['token'],
+                    'org': config['db'],
+                    'bucket': config['retentionPolicy']
+                }
+
+        return self.connection
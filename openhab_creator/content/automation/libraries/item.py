@@ -1,4 +1,7 @@
 # pylint: skip-file
+import threading
+from collections import OrderedDict
+
 from core.actions import PersistenceExtensions, Transformation
 from core.date import format_date, to_java_zoneddatetime
 from core.jsr223.scope import (CLOSED, NULL, OFF, ON, OPEN, UNDEF, StringType,
@@ -6,27 +9,115 @@ from core.jsr223.scope import (CLOSED, NULL, OFF, ON, OPEN, UNDEF, StringType,
 from core.log import LOG_PREFIX, logging
 from core.metadata import get_metadata
 from java.time import ZonedDateTime
+from org.openhab.core.types import State, TypeParser
+
+
+class ItemCache(object):
+    log = logging.getLogger('{}.ItemCache'.format(LOG_PREFIX))
+
+    entries = {}
+
+    @classmethod
+    def entry(cls, item_name, item=None):
+        entry = cls.entries.get(item_name)
+
+        if entry is None:
+            if item is None:
+                item = itemRegistry.getItem(item_name)
+
+            metadata = get_metadata(item_name, 'scripting')
+            metadata = {} if metadata is None else dict(metadata.configuration)
+
+            expires = get_metadata(item_name, 'expire') is not None
+
+            entry = (item, metadata, expires)
+            cls.entries[item_name] = entry
+
+        return entry
+
+    @classmethod
+    def invalidate(cls, item_name=None):
+        if item_name is None:
+            cls.log.debug('Invalidate %d cached items', len(cls.entries))
+            cls.entries.clear()
+        else:
+            cls.entries.pop(item_name, None)
+
+
+class ItemTransaction(object):
+    log = logging.getLogger('{}.ItemTransaction'.format(LOG_PREFIX))
+
+    _local = threading.local()
+
+    def __init__(self):
+        self.updates = OrderedDict()
+        self.outer = None
+
+    @classmethod
+    def current(cls):
+        return getattr(cls._local, 'transaction', None)
+
+    def __enter__(self):
+        self.outer = self.current()
+        if self.outer is None:
+            self._local.transaction = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.outer is None:
+            self._local.transaction = None
+            self.flush()
+
+        return False
+
+    def post_update(self, item, value):
+        self.updates.pop(item.name, None)
+        self.updates[item.name] = (item, value)
+
+    def pending(self, item_name):
+        pending = self.updates.get(item_name)
+        return None if pending is None else pending[1]
+
+    def flush_item(self, item_name):
+        pending = self.updates.pop(item_name, None)
+        if pending is not None:
+            item, value = pending
+            item._post_update(value)
+
+    def flush(self):
+        posted = 0
+        skipped = 0
+
+        while self.updates:
+            _, (item, value) = self.updates.popitem(last=False)
+
+            if item.is_unchanged(value):
+                skipped += 1
+            else:
+                item._post_update(value)
+                posted += 1
+
+        self.log.debug('Posted %d updates, skipped %d unchanged', posted, skipped)
 
 
 class Item(object):
     def __init__(self, item_or_item_name, event=None):
         if isinstance(item_or_item_name, basestring):
-            self._item = itemRegistry.getItem(item_or_item_name)
+            self._item, self.metadata, self.expires = ItemCache.entry(
+                item_or_item_name)
             self.name = item_or_item_name
         else:
             self._item = item_or_item_name
             self.name = item_or_item_name.name
+            _, self.metadata, self.expires = ItemCache.entry(
+                self.name, self._item)
 
         self.event = event
 
         self.logger = logging.getLogger('{}.Item'.format(LOG_PREFIX))
 
-        metadata = get_metadata(self.name, 'scripting')
-        self.metadata = {} if metadata is None else metadata.configuration
-
-        self.location = None
-        if self.is_scripting('location_item'):
-            self.location = self.from_scripting('location_item')
+        self._location = None
 
     @classmethod
     def from_event(cls, event):
@@ -51,11 +142,23 @@ class Item(object):
     def item(self):
         return self._item
 
+    @property
+    def location(self):
+        if self._location is None and self.is_scripting('location_item'):
+            self._location = self.from_scripting('location_item')
+
+        return self._location
+
     def _get_state(self, event=None):
         if event is None:
             event = self.event
 
-        if event is not None and hasattr(event, 'itemName') and event.itemName == self.name:
+        transaction = ItemTransaction.current()
+        pending = None if transaction is None else transaction.pending(self.name)
+
+        if pending is not None:
+            new_state = self._parse_state(pending)
+        elif event is not None and hasattr(event, 'itemName') and event.itemName == self.name:
             new_state = event.itemCommand if hasattr(
                 event, 'itemCommand') else event.itemState
         else:
@@ -66,6 +169,18 @@ class Item(object):
 
         return new_state
 
+    def _parse_state(self, value):
+        if isinstance(value, State):
+            return value
+
+        if isinstance(value, ZonedDateTime):
+            value = format_date(value)
+
+        state = TypeParser.parseState(
+            self._item.getAcceptedDataTypes(), u'{}'.format(value))
+
+        return self._item.state if state is None else state
+
     def _update_empty(self, state, typed_state, update_empty):
         if update_empty and state is None:
             self.post_update(typed_state)
@@ -133,12 +248,37 @@ class Item(object):
         self._item.setCategory(u'{}'.format(icon))
 
     def post_update(self, value):
+        transaction = ItemTransaction.current()
+
+        if transaction is None:
+            self._post_update(value)
+        else:
+            transaction.post_update(self, value)
+
+    def _post_update(self, value):
         if isinstance(value, ZonedDateTime):
             events.postUpdate(self._item, format_date(value))
         else:
             events.postUpdate(self._item, value)
 
+    def is_unchanged(self, value):
+        if self.expires:
+            return False
+
+        state = self._item.state
+        if state in [NULL, UNDEF]:
+            return False
+
+        if isinstance(value, ZonedDateTime):
+            value = format_date(value)
+
+        return u'{}'.format(state) == u'{}'.format(value)
+
     def send_command(self, value, actual_value=None):
+        transaction = ItemTransaction.current()
+        if transaction is not None:
+            transaction.flush_item(self.name)
+
         if actual_value is None or actual_value != value:
             if isinstance(value, ZonedDateTime):
                 events.sendCommand(self._item, format_date(value))
@@ -6,7 +6,7 @@ from core.jsr223.scope import OFF, ON, DecimalType, HSBType, PercentType
 from core.log import LOG_PREFIX, logging
 from personal.autoitemmanager import AutoItemManager
 from personal.dateutils import DateUtils
-from personal.item import Group, Item
+from personal.item import Group, Item, ItemTransaction
 
 reload(personal.autoitemmanager)
 
@@ -53,21 +53,22 @@ class LightUtils(object):
 
     @classmethod
     def command(cls, lightbulb_item, command):
-        is_thing = lightbulb_item.scripting('is_thing')
-        cls.log.debug('Command %s: %s', lightbulb_item, command)
-        if is_thing:
-            if lightbulb_item.is_scripting('brightnessgroup_item'):
-                cls.log.debug('Brightnessgroup: %s', lightbulb_item)
-                cls._handle_groupthing_command(lightbulb_item, command)
+        with ItemTransaction():
+            is_thing = lightbulb_item.scripting('is_thing')
+            cls.log.debug('Command %s: %s', lightbulb_item, command)
+            if is_thing:
+                if lightbulb_item.is_scripting('brightnessgroup_item'):
+                    cls.log.debug('Brightnessgroup: %s', lightbulb_item)
+                    cls._handle_groupthing_command(lightbulb_item, command)
+                else:
+                    cls.log.debug('Single: %s', lightbulb_item)
+                    cls._handle_single_command(lightbulb_item, command)
             else:
-                cls.log.debug('Single: %s', lightbulb_item)
-                cls._handle_single_command(lightbulb_item, command)
-        else:
-            cls.log.debug('Group: %s', lightbulb_item)
-            cls._handle_group_command(lightbulb_item, command)
+                cls.log.debug('Group: %s', lightbulb_item)
+                cls._handle_group_command(lightbulb_item, command)
 
-        lightcontrol_item = lightbulb_item.from_scripting('control_item')
-        lightcontrol_item.post_update(command)
+            lightcontrol_item = lightbulb_item.from_scripting('control_item')
+            lightcontrol_item.post_update(command)
 
     @classmethod
     def _handle_groupthing_command(cls, lightbulb_item, command):
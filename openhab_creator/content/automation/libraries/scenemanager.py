@@ -1,10 +1,13 @@
 # pylint: skip-file
+import json
+from os import path
+
 from core.jsr223.scope import (NULL, OFF, ON, UNDEF, DecimalType, HSBType,
                                PercentType, events, itemRegistry)
 from core.log import LOG_PREFIX, logging
 from personal.dateutils import DateUtils
 from personal.ephemerisutils import EphemerisUtils
-from personal.item import Group, Item
+from personal.item import Group, Item, ItemTransaction
 from personal.timermanager import TimerManager
 from personal.lightutils import LightUtils
 from personal.heatingutils import HeatingUtils
@@ -109,6 +112,8 @@ class SceneItem(object):
 class SceneManager(object):
     log = logging.getLogger('{}.SceneManager'.format(LOG_PREFIX))
 
+    PLAN_FILE = '/openhab/conf/automation/lib/python/personal/sceneplan.json'
+
     __instance = None
 
     @staticmethod
@@ -123,6 +128,8 @@ class SceneManager(object):
             self.timers = TimerManager('SceneManager')
             self.scenes = {}
             self.scene_members = None
+            self.plan = None
+            self.plan_modified = None
             self.auto = False
 
             SceneManager.__instance = self
@@ -186,10 +193,29 @@ class SceneManager(object):
         SceneItem.auto_scene_active.post_update(actual_scene.identifier)
         self.log.info('Actual scene: %s', actual_scene)
 
-        self.scene_members = Group('sceneAssignment{}'.format(actual_scene))
-        self.log.debug(self.scene_members)
+        plan = self.scene_plan()
+        if plan is None:
+            self.scene_members = [(assigned_item, None) for assigned_item
+                                  in Group('sceneAssignment{}'.format(actual_scene))]
+        else:
+            self.scene_members = [(Item(location['assignments'][str(actual_scene)]), location)
+                                  for location in plan]
+        self.log.debug([str(assigned_item) for assigned_item, _ in self.scene_members])
         self.activate_scene(event)
 
+    def scene_plan(self):
+        if not path.exists(self.PLAN_FILE):
+            return None
+
+        modified = path.getmtime(self.PLAN_FILE)
+        if self.plan is None or self.plan_modified != modified:
+            with open(self.PLAN_FILE, 'rt') as f:
+                self.plan = json.load(f)['locations']
+            self.plan_modified = modified
+            self.log.info('Scene plan with %d locations loaded', len(self.plan))
+
+        return self.plan
+
     def actual_scene(self):
         if self.auto or self.wayhome():
             actual_scene = self.actual_timescene()
@@ -268,11 +294,12 @@ class SceneManager(object):
             is_homeoffice_states[homeoffice_key] = homeoffice_item.get_onoff(
                 OFF)
 
-        for assigned_item in self.scene_members:
-            is_location_active = self.is_location_active(
-                assigned_item, guest_stayed, is_weekend, is_homeoffice_states, event)
-            self._handle_location(
-                assigned_item, is_location_active, is_night, is_presences, is_wayhome, is_darkness, is_heating, event)
+        with ItemTransaction():
+            for assigned_item, location in self.scene_members:
+                is_location_active = self.is_location_active(
+                    assigned_item, guest_stayed, is_weekend, is_homeoffice_states, event)
+                self._handle_location(
+                    assigned_item, location, is_location_active, is_night, is_presences, is_wayhome, is_darkness, is_heating, event)
 
     def is_location_active(self, assigned_item, guest_stayed, is_weekend, is_homeoffice_states, event=None):
         assigned = assigned_item.get_string('OFF', True, event)
@@ -283,39 +310,56 @@ class SceneManager(object):
                 or (guest_stayed and assigned == 'GUEST')
                 or (assigned in is_homeoffice_states and is_homeoffice_states[assigned]))
 
-    def _handle_location(self, assigned_item,
+    def _handle_location(self, assigned_item, location,
                          is_location_active, is_night,
                          is_presences, is_wayhome,
                          is_darkness, is_heating,
                          event=None):
-        active_item = assigned_item.from_scripting('active_item', event)
+        if location is None:
+            location = self._location_from_scripting(assigned_item, event)
+
+        active_item = Item(location['active_item'], event)
         if is_location_active:
             active_item.post_update(ON)
         else:
             active_item.post_update(OFF)
 
-        for auto_item in Group(assigned_item.scripting('equipment_group'), event):
+        for equipment in location['equipment']:
+            auto_item = Item(equipment['auto_item'], event)
             automodus = AutoItemManager.instance().change_auto(auto_item, event)
             self.log.debug('%s: %s', auto_item.name, automodus)
 
             if not automodus:
                 continue
 
-            self._handle_autoitem(auto_item, is_location_active, is_night,
-                                  is_presences, is_darkness, is_heating, is_wayhome)
+            self._handle_autoitem(equipment, is_location_active, is_night,
+                                  is_presences, is_darkness, is_heating, is_wayhome, event)
 
-    def _handle_autoitem(self, auto_item, is_location_active, is_night, is_presences, is_darkness, is_heating, is_wayhome):
-        if auto_item.is_scripting('lightbulb_item'):
-            lightbulb_item = auto_item.from_scripting('lightbulb_item')
+    @staticmethod
+    def _location_from_scripting(assigned_item, event=None):
+        equipment = []
+        for auto_item in Group(assigned_item.scripting('equipment_group'), event):
+            scene_items = dict(auto_item.scripting())
+            scene_items['auto_item'] = auto_item.name
+            equipment.append(scene_items)
+
+        return {
+            'active_item': assigned_item.scripting('active_item'),
+            'equipment': equipment
+        }
+
+    def _handle_autoitem(self, equipment, is_location_active, is_night, is_presences, is_darkness, is_heating, is_wayhome, event=None):
+        if 'lightbulb_item' in equipment:
+            lightbulb_item = Item(equipment['lightbulb_item'], event)
             LightUtils.automation(
                 lightbulb_item, is_location_active, is_night, is_presences, is_darkness)
-        elif auto_item.is_scripting('heating_item'):
-            heating_item = auto_item.from_scripting('heating_item')
+        elif 'heating_item' in equipment:
+            heating_item = Item(equipment['heating_item'], event)
             HeatingUtils.automation(
                 heating_item, is_location_active, is_heating, is_presences, is_wayhome)
-        elif auto_item.is_scripting('pump_item'):
-            control_item = auto_item.from_scripting('control_item')
-            presences_item = auto_item.from_scripting('presences_item')
+        elif 'pump_item' in equipment:
+            control_item = Item(equipment['control_item'], event)
+            presences_item = Item(equipment['presences_item'], event)
 
             is_precenses_or_always_configuration = (
                 is_presences or is_wayhome or presences_item.get_onoff(True))
@@ -0,0 +1,21 @@
+# pylint: skip-file
+from core.log import LOG_PREFIX, logging
+from core.rules import rule
+from core.triggers import when
+from personal.aggregates import RollingAggregates
+from personal.item import Item
+
+logger = logging.getLogger('{}.Aggregates'.format(LOG_PREFIX))
+
+
+@rule('Rolling aggregates')
+@when('Member of Aggregate changed')
+def update_aggregates(event):
+    RollingAggregates.instance().update(Item.from_event(event))
+
+
+@rule('Rolling aggregates reconciliation')
+@when('System started')
+@when("Time cron 17 3 0/6 * * ?")
+def reconcile_aggregates(event):
+    RollingAggregates.instance().reconcile()
@@ -5,9 +5,6 @@ from core.triggers import when
 from personal.dateutils import DateUtils
 from personal.item import Item, Group
 
-import personal.item
-reload(personal.item)
-
 logger = logging.getLogger('{}.GasStation'.format(LOG_PREFIX))
 
 FUELTYPE_GROUPS = ['DieselPrices', 'E10Prices', 'E5Prices']
@@ -0,0 +1,46 @@
+# pylint: skip-file
+from core.log import LOG_PREFIX, logging
+from core.osgi import get_service
+from core.rules import rule
+from core.triggers import when
+from org.openhab.core.common.registry import RegistryChangeListener
+
+from personal.item import ItemCache
+
+logger = logging.getLogger('{}.ItemCache'.format(LOG_PREFIX))
+
+metadata_registry = get_service('org.openhab.core.items.MetadataRegistry')
+
+
+class ScriptingMetadataListener(RegistryChangeListener):
+    def added(self, element):
+        self._invalidate(element)
+
+    def removed(self, element):
+        self._invalidate(element)
+
+    def updated(self, old_element, element):
+        self._invalidate(element)
+
+    @staticmethod
+    def _invalidate(element):
+        if element.UID.namespace in ['scripting', 'expire']:
+            ItemCache.invalidate(element.UID.itemName)
+
+
+metadata_listener = ScriptingMetadataListener()
+metadata_registry.addRegistryChangeListener(metadata_listener)
+
+
+@rule('Item cache invalidation')
+@when('System started')
+@when('Item added')
+@when('Item removed')
+@when('Item updated')
+def invalidate_item_cache(event):
+    ItemCache.invalidate()
+
+
+def scriptUnloaded():  # NOSONAR
+    metadata_registry.removeRegistryChangeListener(metadata_listener)
+    ItemCache.invalidate()
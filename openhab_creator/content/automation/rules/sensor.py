@@ -3,6 +3,7 @@ from core.log import LOG_PREFIX, logging
 from core.rules import rule
 from core.triggers import when
 from personal.dateutils import DateUtils
+from personal.aggregates import RollingAggregates
 from personal.item import Group, Item
 from personal.signalmessenger import SignalMessenger
 
@@ -14,8 +15,10 @@ logger = logging.getLogger('{}.Sensor'.format(LOG_PREFIX))
 @when("Time cron 41 0/15 * * * ?")
 @when("System started")
 def trends(event):
+    aggregates = RollingAggregates.instance()
+
     for item in Group('Trend'):
-        delta = item.delta_since(DateUtils.now().minusHours(1))
+        delta = aggregates.delta(item)
 
         trend_item = item.from_scripting('trend_item')
 
@@ -94,5 +97,5 @@ def average7days(event_or_itemname):
         sensor_item = Item.from_event(event_or_itemname)
 
     average_item = sensor_item.from_scripting('average_item')
-    average = sensor_item.average_since(DateUtils.now().minusDays(7))
+    average = RollingAggregates.instance().average(sensor_item)
     average_item.post_update(average)
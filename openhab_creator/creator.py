@@ -1,54 +1,208 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
 from openhab_creator import __version__, logger
+from openhab_creator.buildcontext import BuildContext
 from openhab_creator.models.configuration import Configuration
-from openhab_creator.models.items.baseitem import BaseItem
+from openhab_creator.output.buildcache import BuildCache
 from openhab_creator.output.content import (AutomationCreator,
                                             BasicConfigCreator,
                                             EphemerisCreator, IconsCreator,
                                             MapTransformationCreator)
+from openhab_creator.output.content.contentsync import ContentSync
 from openhab_creator.output.documentationcreator import DocumentationCreator
 from openhab_creator.output.items import ItemsCreator
+from openhab_creator.output.outputstream import OutputStream
 from openhab_creator.output.sitemap import SitemapCreator
+from openhab_creator.output.staging import StagedOutput
 from openhab_creator.output.things import ThingsCreator
+from openhab_creator.profiler import Profiler
+from openhab_creator.validator import ConfigValidator
+from openhab_creator.watcher import Watcher
+
+if TYPE_CHECKING:
+    from openhab_creator.models.grafana import Dashboard
+    from openhab_creator.output.sinks import OutputSink
 
 
 class Creator():
+    STAGES = ('basicconfig', 'things', 'items', 'sitemap', 'ephemeris',
+              'maptransformation', 'automation', 'icons', 'documentation')
+
     def __init__(self, name: str,
                  configdir: str, outputdir: str,
                  anonym: bool, check_only: bool,
-                 icons: bool):
+                 icons: bool, incremental: bool,
+                 jobs: int, profile: bool, staged: bool,
+                 offline: bool, icon_sizes: Tuple[int],
+                 icon_sprite: bool,
+                 templates: Optional[Dict[str, Dict]] = None,
+                 sink: Optional[OutputSink] = None,
+                 icon_cachedir: Optional[str] = None):
+        #pylint: disable=too-many-arguments,too-many-locals
 
         self.name: str = name
         self.configdir: str = configdir
         self.outputdir: str = outputdir
+        self.builddir: str = outputdir
         self.anonym: bool = anonym
         self.check_only: bool = check_only
         self.icons: bool = icons
+        self.incremental: bool = incremental
+        self.jobs: int = jobs
+        self.profile: bool = profile
+        self.staged: bool = staged
+        self.offline: bool = offline
+        self.icon_sizes: Tuple[int] = icon_sizes
+        self.icon_sprite: bool = icon_sprite
+        self.templates: Optional[Dict[str, Dict]] = templates
+        self.sink: Optional[OutputSink] = sink
+        self.icon_cachedir: Optional[str] = icon_cachedir
 
-    def run(self) -> None:
+    def run(self) -> bool:
         logger.info("openHAB Configuration Creator (%s)", __version__)
         logger.info("Output directory: %s", self.outputdir)
 
-        configuration = Configuration(self.name, self.configdir, self.anonym)
+        if self.check_only:
+            return ConfigValidator(self.configdir, self.anonym,
+                                   self.jobs, self.templates).run()
+
+        profiler = Profiler() if self.profile else None
+        if profiler is not None:
+            Profiler.start()
+
+        try:
+            with BuildContext.activate(BuildContext(self.sink, profiler=profiler)):
+                with Profiler.stage('configuration'):
+                    configuration = self.configure()
+
+                if configuration.secrets.handle_missing():
+                    return False
+
+                if self.staged:
+                    self._build_staged(configuration)
+                else:
+                    self._build_live(configuration)
+        finally:
+            if profiler is not None:
+                Profiler.stop()
+
+        if profiler is not None:
+            profiler.save(self.configdir)
+
+        return True
+
+    def rebuild(self, configuration: Configuration,
+                stages: Optional[Set[str]] = None) -> None:
+        if self.staged:
+            self._build_staged(configuration)
+        else:
+            self.build(configuration, stages)
+
+    def _build_live(self, configuration: Configuration) -> None:
+        context = BuildContext.current()
+        stages = None
+
+        if self.incremental:
+            build_cache = BuildCache(self.outputdir)
+            previous_build = len(build_cache.inputs) > 0
+            changed = build_cache.update_inputs(self.configdir)
+            same_generator = build_cache.update_generator()
+            same_options = build_cache.update_options(
+                self.build_options(configuration))
+
+            if same_generator and same_options and previous_build\
+                    and build_cache.outputs_exist()\
+                    and ContentSync(self.outputdir).outputs_exist():
+                stages = Watcher.affected_stages(changed)[1]
+                logger.info('Incremental build of stages: %s',
+                            ', '.join(sorted(stages)) or 'none')
 
-        if configuration.secrets.handle_missing() or self.check_only:
-            return
+            context.build_cache = build_cache
 
-        BasicConfigCreator(self.outputdir).build(configuration)
+        try:
+            self.build(configuration, stages)
+        finally:
+            context.build_cache = None
 
-        ThingsCreator(self.outputdir).build(configuration)
-        ItemsCreator(self.outputdir).build(configuration)
+        if self.incremental:
+            build_cache.save()
 
-        SitemapCreator(self.outputdir).build(configuration)
+    def build_options(self, configuration: Configuration) -> Dict[str, Any]:
+        return {
+            'anonym': self.anonym,
+            'icons': self.icons,
+            'icon_sizes': list(self.icon_sizes),
+            'icon_sprite': self.icon_sprite,
+            'offline': self.offline,
+            'dashboard': configuration.dashboard.version
+        }
 
-        EphemerisCreator(self.outputdir).build(configuration)
-        MapTransformationCreator(self.outputdir).build()
-        AutomationCreator(self.outputdir).build(self.configdir, configuration)
+    def _build_staged(self, configuration: Configuration) -> None:
+        staging = StagedOutput(self.outputdir)
+        self.builddir = staging.prepare()
 
+        try:
+            self.build(configuration)
+        except BaseException:
+            staging.discard()
+            raise
+        finally:
+            self.builddir = self.outputdir
+
+        with Profiler.stage('deploy'):
+            staging.deploy(keep=() if self.icons
+                           else ('icons/', f'{IconsCreator.HTML_DIR}/'))
+
+    def configure(self, dashboard: Optional[Dashboard] = None) -> Configuration:
+        return Configuration(self.name, self.configdir, self.anonym,
+                             dashboard, self.offline, self.templates)
+
+    def build(self, configuration: Configuration,
+              stages: Optional[Set[str]] = None) -> None:
+        try:
+            for stage in self.STAGES:
+                if stages is None or stage in stages:
+                    with Profiler.stage(stage):
+                        getattr(self, f'_build_{stage}')(configuration)
+        except BaseException:
+            OutputStream.discard_open()
+            raise
+
+    def _build_basicconfig(self, configuration: Configuration) -> None:
+        BasicConfigCreator(self.builddir).build(configuration)
+
+    def _build_things(self, configuration: Configuration) -> None:
+        ThingsCreator(self.builddir).build(configuration)
+
+    def _build_items(self, configuration: Configuration) -> None:
+        ItemsCreator(self.builddir, self.jobs).build(configuration)
+
+    def _build_sitemap(self, configuration: Configuration) -> None:
+        SitemapCreator(self.builddir).build(configuration)
+
+    def _build_ephemeris(self, configuration: Configuration) -> None:
+        EphemerisCreator(self.builddir).build(configuration)
+
+    def _build_maptransformation(self, configuration: Configuration) -> None:
+        #pylint: disable=unused-argument
+        MapTransformationCreator(self.builddir).build()
+
+    def _build_automation(self, configuration: Configuration) -> None:
+        AutomationCreator(self.builddir).build(self.configdir, configuration)
+
+    def _build_icons(self, configuration: Configuration) -> None:
+        #pylint: disable=unused-argument
         if self.icons:
-            icons_creator = IconsCreator(self.outputdir)
+            cachedir = self.icon_cachedir
+            if cachedir is None and self.sink is None:
+                cachedir = IconsCreator.default_cachedir(self.outputdir)
+
+            icons_creator = IconsCreator(self.builddir, self.jobs, cachedir,
+                                         self.icon_sizes, self.icon_sprite)
             icons_creator.build(self.configdir)
-            icons_creator.check_icons_exist(BaseItem.icons)
+            icons_creator.check_icons_exist(BuildContext.current().icons)
 
+    def _build_documentation(self, configuration: Configuration) -> None:
         DocumentationCreator(self.configdir).build(configuration)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import csv
 import json
 import os
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -17,11 +17,19 @@ from openhab_creator.models.configuration.location import (Location,
                                                            LocationFactory)
 from openhab_creator.models.configuration.person import Person
 from openhab_creator.models.grafana.dashboard import Dashboard
+from openhab_creator.output.buildcache import BuildCache
+from openhab_creator.profiler import Profiler
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration.equipment import Equipment
+    from openhab_creator.models.configuration.equipment.types.lightbulb import \
+        Lightbulb
+    from openhab_creator.models.configuration.equipment.types.motiondetector import \
+        MotionDetector
     from openhab_creator.models.configuration.equipment.types.networkappliance import \
         NetworkAppliance
+    from openhab_creator.models.configuration.equipment.types.wallswitch import \
+        WallSwitch
 
 
 class SecretsStorage():
@@ -35,24 +43,16 @@ class SecretsStorage():
 
     def __read_secrets(self, configdir: str) -> None:
         with open(os.path.join(configdir, 'secrets.yaml'), encoding="utf-8") as secretsfile:
-            self.storage = yaml.safe_load(secretsfile)
-            self.storage = self.__keys_to_lower(self.storage)
+            self.storage = self.keys_to_lower(yaml.safe_load(secretsfile))
             logger.debug(self.storage)
 
     @classmethod
-    def __keys_to_lower(cls, iterable):
-        if isinstance(iterable, dict):
-            new_dict = {}
-            for key in iterable.keys():
-                key_lower = key.lower()
-                new_dict[key_lower] = iterable[key]
-                if isinstance(new_dict[key_lower], dict):
-                    new_dict[key_lower] = cls.__keys_to_lower(
-                        new_dict[key_lower])
+    def keys_to_lower(cls, tree: Any) -> Any:
+        if isinstance(tree, dict):
+            tree = {str(key).lower(): cls.keys_to_lower(value)
+                    for key, value in tree.items()}
 
-            iterable = new_dict
-
-        return iterable
+        return tree
 
     def secret(self, *args: List[str]) -> str:
         value = self.secret_optional(*args)
@@ -67,22 +67,16 @@ class SecretsStorage():
         return value
 
     def secret_optional(self, *args: List[str]) -> Optional[str]:
-        value = None
-        tree = self.storage
-
-        for key in args[:-1]:
-            key = key.lower()
-            if key in tree:
-                tree = tree[key]
-            else:
-                tree = None
-                break
+        return self.lookup(self.storage, *args)
 
-        key = args[-1].lower()
-        if tree is not None and key in tree:
-            value = tree[key]
+    @staticmethod
+    def lookup(tree: Any, *args: List[str]) -> Optional[Any]:
+        for key in args:
+            if not isinstance(tree, dict):
+                return None
+            tree = tree.get(key.lower())
 
-        return value
+        return tree
 
     @staticmethod
     def secret_key(*args: List[str]) -> str:
@@ -102,18 +96,15 @@ class SecretsStorage():
 
 
 class EquipmentRegistry():
-    WITHOUT_CHILDS = 'without_childs'
-    WITH_CHILDS = 'with_childs'
-
     def __init__(self, configuration: Configuration):
         self.configuration: Configuration = configuration
 
-        self.registry: Dict[str, Dict[str, List[Equipment]]] = {
-            'battery': {
-                self.WITHOUT_CHILDS: [],
-                self.WITH_CHILDS: []
-            }
-        }
+        self.all: List[Equipment] = []
+        self.categories: Dict[str, int] = {'battery': 0}
+        self.locations: Dict[str, int] = {}
+        self.without_childs: int = 0
+
+        self._cache: Dict[Tuple, List[Equipment]] = {}
 
         self._init_bridges(configuration.configdir)
         self.macs: Dict[str, Equipment] = {}
@@ -141,48 +132,68 @@ class EquipmentRegistry():
         return self.bridges[bridge_key]
 
     def add(self, equipment: Equipment):
+        bit = 1 << len(self.all)
+        self.all.append(equipment)
+
         for category in equipment.categories:
-            if category not in self.registry:
-                self.registry[category] = {
-                    self.WITHOUT_CHILDS: [],
-                    self.WITH_CHILDS: []
-                }
+            self.categories[category] = self.categories.get(category, 0) | bit
+
+        if not equipment.is_child:
+            self.without_childs |= bit
 
-            self.registry[category][self.WITH_CHILDS].append(
-                equipment)
+        if equipment.has_location:
+            location_id = equipment.location.identifier
+            self.locations[location_id] = self.locations.get(
+                location_id, 0) | bit
 
-            if not equipment.is_child:
-                self.registry[category][self.WITHOUT_CHILDS].append(
-                    equipment)
+        self._cache.clear()
 
     def has(self, category: str,
             filter_childs: Optional[bool] = True,
-            filter_categories: Optional[List[str]] = None) -> Tuple[bool, List[Equipment]]:
-        equipment = self.equipment(category, filter_childs, filter_categories)
+            filter_categories: Optional[List[str]] = None,
+            location: Optional[Location] = None) -> Tuple[bool, List[Equipment]]:
+        equipment = self.equipment(
+            category, filter_childs, filter_categories, location)
 
         return len(equipment) > 0, equipment
 
     def equipment(self, category: str,
                   filter_childs: Optional[bool] = True,
-                  filter_categories: Optional[List[str]] = None) -> List[Equipment]:
-        if category in self.registry:
-            equipment_registry = self.registry[category]
-        else:
-            equipment_registry = {
-                self.WITHOUT_CHILDS: [],
-                self.WITH_CHILDS: []
-            }
+                  filter_categories: Optional[List[str]] = None,
+                  location: Optional[Location] = None) -> List[Equipment]:
+        key = (category, filter_childs,
+               None if filter_categories is None else tuple(filter_categories),
+               None if location is None else location.identifier)
+
+        if key not in self._cache:
+            self._cache[key] = self._members(self._query(*key))
+
+        return self._cache[key]
+
+    def _query(self, category: str,
+               filter_childs: bool,
+               filter_categories: Optional[Tuple[str]],
+               location_id: Optional[str]) -> int:
+        bits = self.categories.get(category, 0)
 
         if filter_childs:
-            equipment = equipment_registry[self.WITHOUT_CHILDS]
-        else:
-            equipment = equipment_registry[self.WITH_CHILDS]
+            bits &= self.without_childs
 
-        if filter_categories is not None:
-            for filter_category in filter_categories:
-                equipment = list(
-                    filter(lambda x, filter_category=filter_category: filter_category
-                           in x.categories, equipment))
+        for filter_category in filter_categories or ():
+            bits &= self.categories.get(filter_category, 0)
+
+        if location_id is not None:
+            bits &= self.locations.get(location_id, 0)
+
+        return bits
+
+    def _members(self, bits: int) -> List[Equipment]:
+        equipment = []
+
+        while bits:
+            lowest = bits & -bits
+            equipment.append(self.all[lowest.bit_length() - 1])
+            bits ^= lowest
 
         return equipment
 
@@ -272,6 +283,71 @@ class LocationRegistry():
         return self.registry['outdoors']
 
 
+class ButtonAssignment():
+    def __init__(self, wallswitch: WallSwitch, button_key: int):
+        self.wallswitch: WallSwitch = wallswitch
+        self.button_key: int = button_key
+        self.name: str = wallswitch.buttonassignment_name(button_key)
+        self.group: str = wallswitch.item_ids.buttonassignment(button_key)
+
+    def item_id(self, lightbulb: Lightbulb) -> str:
+        return f'{self.group}_{lightbulb.identifier}'
+
+
+class AssignmentRegistry():
+    def __init__(self, configuration: Configuration):
+        self.configuration: Configuration = configuration
+
+        self.wallswitches: Dict[str, List[WallSwitch]] = {}
+        self.buttons: Dict[str, List[ButtonAssignment]] = {}
+        self.motiondetectors: Dict[str, List[MotionDetector]] = {}
+
+    def read_configuration(self) -> None:
+        equipment = self.configuration.equipment
+
+        lightbulbs = [lightbulb.identifier
+                      for lightbulb in equipment.equipment('lightbulb')]
+
+        for lightbulb_id in lightbulbs:
+            self.wallswitches[lightbulb_id] = []
+            self.buttons[lightbulb_id] = []
+            self.motiondetectors[lightbulb_id] = []
+
+        for wallswitch in equipment.equipment('wallswitch'):
+            buttons = [ButtonAssignment(wallswitch, button_key)
+                       for button_key in range(0, wallswitch.buttons_count)]
+
+            for lightbulb_id in self._targets(wallswitch, lightbulbs):
+                self.wallswitches[lightbulb_id].append(wallswitch)
+                self.buttons[lightbulb_id].extend(buttons)
+
+        for motiondetector in equipment.equipment('motiondetector'):
+            for lightbulb_id in self._targets(motiondetector, lightbulbs):
+                self.motiondetectors[lightbulb_id].append(motiondetector)
+
+    @staticmethod
+    def _targets(equipment: Union[WallSwitch, MotionDetector],
+                 lightbulbs: List[str]) -> List[str]:
+        if equipment.lightbulbs is None:
+            return lightbulbs
+
+        unknown = sorted(set(equipment.lightbulbs) - set(lightbulbs))
+        if len(unknown) > 0:
+            raise ConfigurationException(
+                f'Unknown lightbulbs {", ".join(unknown)} assigned to {equipment.identifier}')
+
+        return list(dict.fromkeys(equipment.lightbulbs))
+
+    def lightbulb_wallswitches(self, lightbulb: Lightbulb) -> List[WallSwitch]:
+        return self.wallswitches.get(lightbulb.identifier, [])
+
+    def lightbulb_buttons(self, lightbulb: Lightbulb) -> List[ButtonAssignment]:
+        return self.buttons.get(lightbulb.identifier, [])
+
+    def lightbulb_motiondetectors(self, lightbulb: Lightbulb) -> List[MotionDetector]:
+        return self.motiondetectors.get(lightbulb.identifier, [])
+
+
 class GeneralRegistry():
     def __init__(self, configuration: Configuration):
         self.configuration: Configuration = configuration
@@ -315,28 +391,49 @@ class GeneralRegistry():
 
 class Configuration():
     #pylint: disable=too-many-instance-attributes
-    def __init__(self, name: str, configdir: str, anonym: bool):
+    def __init__(self, name: str, configdir: str, anonym: bool,
+                 dashboard: Optional[Dashboard] = None,
+                 offline: Optional[bool] = False,
+                 templates: Optional[Dict[str, Dict]] = None):
         self.configdir: str = configdir
         self.name: str = name
-        self.secrets: SecretsStorage = SecretsStorage(configdir, anonym)
 
-        os.makedirs(os.path.join(
-            configdir, 'documentation'), exist_ok=True)
+        with Profiler.stage('secrets'):
+            self.secrets: SecretsStorage = SecretsStorage(configdir, anonym)
+
+        BuildCache.makedirs(os.path.join(configdir, 'documentation'))
 
-        self.dashboard: Dashboard = Dashboard(self)
+        with Profiler.stage('dashboard'):
+            self.dashboard: Dashboard = dashboard or Dashboard(self, offline)
 
-        self._init_templates(configdir)
+        with Profiler.stage('templates'):
+            self._init_templates(configdir, templates)
 
         self.general: GeneralRegistry = GeneralRegistry(self)
-        self.equipment: EquipmentRegistry = EquipmentRegistry(self)
+
+        with Profiler.stage('bridges'):
+            self.equipment: EquipmentRegistry = EquipmentRegistry(self)
+
         self.locations: LocationRegistry = LocationRegistry(self)
 
-        self.general.read_configuration()
-        self.locations.read_configuration()
+        with Profiler.stage('general'):
+            self.general.read_configuration()
+
+        with Profiler.stage('locations'):
+            self.locations.read_configuration()
+
+        with Profiler.stage('persons'):
+            self._init_persons(configdir)
 
-        self._init_persons(configdir)
+        with Profiler.stage('lan'):
+            self.equipment.init_lan()
 
-        self.equipment.init_lan()
+        with Profiler.stage('assignments'):
+            self.assignments: AssignmentRegistry = AssignmentRegistry(self)
+            self.assignments.read_configuration()
+
+        with Profiler.stage('dashboard_wait'):
+            self.dashboard.wait()
 
     def _init_persons(self, configdir: str) -> None:
         self.persons: List[Person] = []
@@ -347,9 +444,12 @@ class Configuration():
                 self.persons.append(Person(self, key, person_equipment))
                 key += 1
 
-    def _init_templates(self, configdir: str) -> None:
-        EquipmentType.init(self.read_jsons_from_dir(
-            configdir, 'templates'))
+    def _init_templates(self, configdir: str,
+                        templates: Optional[Dict[str, Dict]] = None) -> None:
+        self.templates: Dict[str, Dict] = {
+            **(templates or {}),
+            **self.read_jsons_from_dir(configdir, 'templates')
+        }
 
     @staticmethod
     def read_json_from_file(configdir: str, filename: str) -> List[Dict]:
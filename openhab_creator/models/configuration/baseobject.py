@@ -18,10 +18,13 @@ class BaseObject(ABC):
 
     @identifier.setter
     def identifier(self, identifier: str) -> BaseObject:
-        identifier = Formatter.format_id(identifier)
-        self._identifier: str = Formatter.ucfirst(identifier)
+        self._identifier: str = self.format_identifier(identifier)
         return self
 
+    @staticmethod
+    def format_identifier(identifier: str) -> str:
+        return Formatter.ucfirst(Formatter.format_id(identifier))
+
     @property
     def semantic(self) -> str:
         return self.__class__.__name__
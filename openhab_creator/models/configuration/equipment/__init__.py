@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from importlib import import_module
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from openhab_creator import logger
-from openhab_creator.exception import (BuildException, ConfigurationException,
-                                       RegistryException)
+from openhab_creator.exception import BuildException, ConfigurationException
 from openhab_creator.models.configuration.baseobject import BaseObject
 from openhab_creator.models.configuration.equipment.thing import Thing
+from openhab_creator.plugins import PluginManifest
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
@@ -245,15 +244,13 @@ class Equipment(BaseObject):
     def items_for_location(self) -> Dict[str, str]:
         return {}
 
+    @property
+    def scene_items(self) -> Dict[str, str]:
+        return {}
+
 
 class EquipmentType():
     registry: Dict[str, Type['Equipment']] = {}
-    templates: Dict[str, Dict] = {}
-
-    @classmethod
-    def init(cls, templates: Dict[str, Dict]):
-        import_module('openhab_creator.models.configuration.equipment.types')
-        cls.templates = templates
 
     def __call__(self, equipment_cls: Type[Equipment]):
         EquipmentType._register(equipment_cls)
@@ -268,13 +265,13 @@ class EquipmentType():
             configuration: Configuration,
             **equipment_configuration: Dict) -> Equipment:
 
-        equipment_configuration = cls._merge_template(equipment_configuration)
+        equipment_configuration = cls.merge_template(configuration.templates,
+                                                     equipment_configuration)
 
         equipment_type = equipment_configuration.pop('typed').lower()
 
         if equipment_type not in cls.registry:
-            raise RegistryException(
-                f'No class for equipment type: {equipment_type}')
+            PluginManifest.equipment(equipment_type)
 
         equipment = cls.registry[equipment_type.lower()](configuration=configuration,
                                                          **equipment_configuration)
@@ -284,19 +281,20 @@ class EquipmentType():
         return equipment
 
     @classmethod
-    def _merge_template(cls, equipment_configuration: Dict) -> Dict:
+    def merge_template(cls, templates: Dict[str, Dict],
+                       equipment_configuration: Dict) -> Dict:
         template = equipment_configuration.pop('template', None)
         if template is not None:
             equipment_configuration = {
-                **cls._template(template), **equipment_configuration}
+                **cls._template(templates, template), **equipment_configuration}
 
         return equipment_configuration
 
-    @classmethod
-    def _template(cls, template_key: str) -> Dict:
-        template_key = template_key.lower()
-        if template_key not in cls.templates:
+    @staticmethod
+    def _template(templates: Dict[str, Dict], template_key: str) -> Dict:
+        template_key = str(template_key).lower()
+        if template_key not in templates:
             raise ConfigurationException(
                 f'No template "{template_key}" in configuration')
 
-        return deepcopy(cls.templates[template_key])
+        return deepcopy(templates[template_key])
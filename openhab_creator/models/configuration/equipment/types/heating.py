@@ -113,6 +113,13 @@ class Heating(Sensor):
     def is_timecontrolled(self) -> bool:
         return True
 
+    @property
+    def scene_items(self) -> Dict[str, str]:
+        return {
+            'auto_item': self.item_ids.auto,
+            'heating_item': self.item_ids.heating
+        }
+
     @property
     def semantic(self) -> str:
         return 'HVAC'
@@ -195,6 +195,13 @@ class Lightbulb(Equipment):
     def is_timecontrolled(self) -> bool:
         return True
 
+    @property
+    def scene_items(self) -> Dict[str, str]:
+        return {
+            'auto_item': self.item_ids.auto,
+            'lightbulb_item': self.item_ids.lightbulb
+        }
+
     @property
     def name_with_type(self) -> str:
         typed = _("Lightbulb")
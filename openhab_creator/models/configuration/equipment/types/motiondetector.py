@@ -33,12 +33,18 @@ class MotionDetectorItemIdentifiers(EquipmentItemIdentifiers):
 
 @EquipmentType()
 class MotionDetector(Equipment):
-    def __init__(self, **equipment_configuration: Dict):
+    def __init__(self,
+                 lightbulbs: Optional[List[str]] = None,
+                 **equipment_configuration: Dict):
         super().__init__(**equipment_configuration)
 
         self._item_ids: MotionDetectorItemIdentifiers = MotionDetectorItemIdentifiers(
             self)
 
+        # Identifiers of the lightbulbs this detector can be assigned to,
+        # None allows every lightbulb
+        self.lightbulbs: Optional[List[str]] = lightbulbs
+
     @property
     def item_ids(self) -> MotionDetectorItemIdentifiers:
         return self._item_ids
@@ -43,6 +43,7 @@ class WallSwitch(Equipment):
 
     def __init__(self,
                  buttons: List[Dict],
+                 lightbulbs: Optional[List[str]] = None,
                  **equipment_configuration: Dict):
         super().__init__(**equipment_configuration)
 
@@ -50,6 +51,9 @@ class WallSwitch(Equipment):
             self)
 
         self.buttons: List[Dict] = buttons
+        # Identifiers of the lightbulbs this switch can be assigned to,
+        # None allows every lightbulb
+        self.lightbulbs: Optional[List[str]] = lightbulbs
 
     @property
     def item_ids(self) -> WallSwitchItemIdentifiers:
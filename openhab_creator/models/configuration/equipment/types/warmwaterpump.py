@@ -58,6 +58,15 @@ class WarmWaterPump(PowerOutlet):
     def is_timecontrolled(self) -> bool:
         return True
 
+    @property
+    def scene_items(self) -> Dict[str, str]:
+        return {
+            'auto_item': self.item_ids.auto,
+            'pump_item': self.item_ids.warmwaterpump,
+            'control_item': self.item_ids.onoff,
+            'presences_item': self.item_ids.autoabsence
+        }
+
     @property
     def name_with_type(self) -> str:
         typed = _("Pump")
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from importlib import import_module
 from typing import TYPE_CHECKING, Dict, Final, List, Optional, Type
 
-from openhab_creator.exception import RegistryException
 from openhab_creator.models.configuration.baseobject import BaseObject
 from openhab_creator.models.configuration.equipment import EquipmentType
+from openhab_creator.plugins import PluginManifest
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
@@ -105,37 +104,17 @@ class Location(BaseObject):
 class LocationFactory():
     registry: Dict[str, Type['Location']] = {}
 
-    initialized: bool = False
-
-    @classmethod
-    def _init(cls):
-        if not cls.initialized:
-            import_module(
-                'openhab_creator.models.configuration.location.indoor')
-            import_module(
-                'openhab_creator.models.configuration.location.indoor.floors')
-            import_module(
-                'openhab_creator.models.configuration.location.indoor.rooms')
-            import_module(
-                'openhab_creator.models.configuration.location.indoor.buildings')
-            import_module(
-                'openhab_creator.models.configuration.location.outdoors')
-
-            cls.initialized = True
-
     @classmethod
     def register(cls, location_cls: Type[Location]) -> None:
         cls.registry[location_cls.__name__.lower()] = location_cls
 
     @classmethod
     def new(cls, configuration: Configuration, **args: Dict) -> Location:
-        cls._init()
-
         location_type = args.pop('typed').lower()
-        if location_type in cls.registry:
-            return cls.registry[location_type.lower()](configuration=configuration, **args)
+        if location_type not in cls.registry:
+            PluginManifest.location(location_type)
 
-        raise RegistryException(f'No class for location type: {location_type}')
+        return cls.registry[location_type](configuration=configuration, **args)
 
 
 class LocationType():
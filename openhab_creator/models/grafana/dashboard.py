@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import contextvars
+import json
+import os
+import threading
 from typing import TYPE_CHECKING, Optional, Dict
 
-import requests
-
 from openhab_creator import _, logger, CreatorEnum
+from openhab_creator.output.buildcache import BuildCache
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
@@ -40,31 +43,134 @@ class Period(CreatorEnum):
 
 
 class Dashboard():
-    def __init__(self, configuration: Configuration):
+    #pylint: disable=too-many-instance-attributes
+    SNAPSHOT = 'grafana_dashboard.json'
+    SNAPSHOT_META = 'grafana_dashboard.meta.json'
+    TIMEOUT = 2
+
+    def __init__(self, configuration: Configuration, offline: Optional[bool] = False):
         self.host: Optional[str] = configuration.secrets.secret_optional(
             'grafana', 'host')
+        self.offline: bool = offline
+
+        self.documentationdir: str = os.path.join(
+            configuration.configdir, 'documentation')
 
         self.panels = {}
+        self.online: Optional[Dict] = None
+        self._success: Optional[bool] = None
+
+        self._loader: Optional[threading.Thread] = None
+        if self.host is not None and not self.offline:
+            self._loader = threading.Thread(target=contextvars.copy_context().run,
+                                            args=(self._load,),
+                                            name='grafana', daemon=True)
+            self._loader.start()
+        else:
+            self._load()
 
-        self.success: bool = self.init_from_grafana()
+    @property
+    def success(self) -> bool:
+        self.wait()
+        return self._success
 
-    def init_from_grafana(self) -> bool:
+    @property
+    def version(self) -> Optional[int]:
+        self.wait()
+        return None if self.online is None else self.online.get('version')
+
+    def wait(self) -> None:
+        if self._loader is not None:
+            self._loader.join()
+            self._loader = None
+
+    def _load(self) -> None:
         success = False
         if self.host is not None:
-            try:
-                response = requests.get(
-                    f'{self.host}/api/dashboards/uid/openhab3', timeout=2)
-                if response.status_code == 200:
-                    self.online = response.json()['dashboard']
-                    success = True
-                    self.__init_panels()
-                else:
-                    logger.error(response.json()['message'])
-            except requests.exceptions.ConnectionError:
-                logger.error('Could not connect to grafana on %s', self.host)
+            if self.offline:
+                success = self.init_from_snapshot()
+            else:
+                success = self.init_from_grafana() or self.init_from_snapshot()
+
+        self._success = success
+
+    def init_from_grafana(self) -> bool:
+        import requests  # pylint: disable=import-outside-toplevel
+
+        success = False
+        meta = self._read_json(self.SNAPSHOT_META) or {}
+        headers = {}
+        if 'etag' in meta:
+            headers['If-None-Match'] = meta['etag']
+
+        try:
+            response = requests.get(
+                f'{self.host}/api/dashboards/uid/openhab3',
+                headers=headers, timeout=self.TIMEOUT)
+            if response.status_code == 304:
+                logger.info('Grafana dashboard not modified (ETag %s)',
+                            meta['etag'])
+                success = self.init_from_snapshot()
+            elif response.status_code == 200:
+                self.online = response.json()['dashboard']
+                success = True
+                self.__init_panels()
+                self._save_snapshot(response.headers.get('ETag'), meta)
+            else:
+                logger.error(response.json()['message'])
+        except requests.exceptions.RequestException:
+            logger.error('Could not connect to grafana on %s', self.host)
 
         return success
 
+    def init_from_snapshot(self) -> bool:
+        success = False
+        snapshot = self._read_json(self.SNAPSHOT)
+
+        if snapshot is None:
+            logger.warning('No Grafana dashboard snapshot in %s',
+                           self.documentationdir)
+        else:
+            logger.info('Using Grafana dashboard snapshot (version %s)',
+                        snapshot.get('version'))
+            self.online = snapshot
+            success = True
+            self.__init_panels()
+
+        return success
+
+    def _save_snapshot(self, etag: Optional[str], meta: Dict) -> None:
+        version = self.online.get('version')
+        if version is not None and version == meta.get('version')\
+                and os.path.exists(os.path.join(self.documentationdir, self.SNAPSHOT)):
+            logger.info('Grafana dashboard unchanged (version %s)', version)
+        else:
+            self._write_json(self.SNAPSHOT, self.online)
+
+        meta = {'version': version}
+        if etag is not None:
+            meta['etag'] = etag
+
+        self._write_json(self.SNAPSHOT_META, meta)
+
+    def _read_json(self, filename: str) -> Optional[Dict]:
+        content = None
+        srcfile = os.path.join(self.documentationdir, filename)
+
+        if os.path.exists(srcfile):
+            try:
+                with open(srcfile, encoding='utf-8') as fobj:
+                    content = json.load(fobj)
+            except (OSError, ValueError):
+                logger.warning('Ignoring unreadable %s', srcfile)
+
+        return content
+
+    def _write_json(self, filename: str, content: Dict) -> None:
+        BuildCache.makedirs(self.documentationdir)
+        BuildCache.write(os.path.join(self.documentationdir, filename),
+                         json.dumps(content, indent=4))
+
     def __init_panels(self) -> None:
         for row in self.online['panels']:
             if 'panels' in row:
@@ -86,6 +192,7 @@ class Dashboard():
                    identifier: str,
                    aggregations: Optional[Dict[Period, AggregateWindow]] = None) \
             -> Optional[Dict[str, str]]:
+        self.wait()
         urls = {}
 
         if identifier in self.panels:
@@ -4,6 +4,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from openhab_creator import CreatorEnum
+from openhab_creator.buildcontext import BuildContext
 from openhab_creator.models.common.maptransformation import BaseMapTransformation
 from openhab_creator.models.configuration.baseobject import BaseObject
 from openhab_creator.models.configuration.equipment import Equipment
@@ -81,11 +82,6 @@ class ExpireType(CreatorEnum):
 
 
 class BaseItem():
-    influxdb_series = {}
-    influxdb_measurements = {}
-    aisensors = {}
-    icons = {}
-
     def __init__(self, name: str):
         self._name: str = name
         self._label: str = ''
@@ -116,7 +112,7 @@ class BaseItem():
 
     def icon(self, icon: str) -> BaseItem:
         self._icon = icon.lower()
-        BaseItem.icons[self._icon] = self._icon
+        BuildContext.current().icons[self._icon] = self._icon
         return self
 
     def groups(self, *groups: List[str]) -> BaseItem:
@@ -169,12 +165,14 @@ class BaseItem():
 
         series_tags['item'] = self._name
 
-        BaseItem.influxdb_series[self._name] = {
+        context = BuildContext.current()
+
+        context.influxdb_series[self._name] = {
             'measurement': measurement,
             'tags': series_tags
         }
 
-        BaseItem.influxdb_measurements[measurement] = True
+        context.influxdb_measurements[measurement] = True
 
         return self
 
@@ -182,12 +180,12 @@ class BaseItem():
         self.remove_group('Sensor')
         self.remove_group('SensorRestore')
         self._metadata.pop('influxdb', None)
-        BaseItem.influxdb_series.pop(self._name, None)
+        BuildContext.current().influxdb_series.pop(self._name, None)
 
         return self
 
     def aisensor(self, datatype: AISensorDataType) -> BaseItem:
-        BaseItem.aisensors[self._name] = str(datatype)
+        BuildContext.current().aisensors[self._name] = str(datatype)
         return self.groups('AISensor')
 
     def expire(self, duration: str,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
 from openhab_creator.output.formatter import Formatter
 
@@ -75,6 +75,9 @@ class BaseElement():
         return self
 
     def dump(self) -> str:
+        return "\n".join(self.dump_lines())
+
+    def dump_lines(self, indent: Optional[str] = '') -> Iterator[str]:
         element_attributes = Formatter.key_value_pairs(
             self.attributes, separator="\n  ", escape=False)
 
@@ -83,21 +86,19 @@ class BaseElement():
         element_attributes = re.sub(
             '^', ' '*length, element_attributes, flags=re.MULTILINE)
 
-        return f'{self.elementtype} {element_attributes[length:]}{self.dump_elements()}'
+        header = f'{self.elementtype} {element_attributes[length:]}'
 
-    def dump_elements(self) -> str:
-        output = ''
         if self.has_elements:
-            lines = []
-            for element in self.elements:
-                lines.append(element.dump())
+            header += ' {'
 
-            block = "\n".join(lines)
-            block = re.sub('^', ' '*4, block, flags=re.MULTILINE)
+        for line in header.split('\n'):
+            yield indent + line
 
-            output = " {\n" + block + "\n}"
+        if self.has_elements:
+            for element in self.elements:
+                yield from element.dump_lines(indent + ' '*4)
 
-        return output
+            yield indent + '}'
 
     @property
     def has_elements(self) -> bool:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
 
 from openhab_creator import _
 from openhab_creator.models.sitemap.baseelement import BaseElement
@@ -18,12 +18,11 @@ class Frame(BaseElement):
     def elementtype(self) -> str:
         return 'Frame'
 
-    def dump(self) -> str:
-        output = ''
+    def dump_lines(self, indent: Optional[str] = '') -> Iterator[str]:
         if self.has_elements:
-            output = super().dump()
-
-        return output
+            yield from super().dump_lines(indent)
+        else:
+            yield indent
 
 
 class Page(Text):
@@ -47,12 +46,11 @@ class Page(Text):
     def has_elements(self) -> bool:
         return self.main_frame.has_elements or len(self.frames) > 0
 
-    def dump(self) -> str:
-        output = ''
+    def dump_lines(self, indent: Optional[str] = '') -> Iterator[str]:
         if self.has_elements:
-            output = super().dump()
-
-        return output
+            yield from super().dump_lines(indent)
+        else:
+            yield indent
 
 
 class Sitemap(Page):
@@ -1,9 +1,10 @@
-import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pathlib import Path
 
 from openhab_creator import logger
+from openhab_creator.output.buildcache import BuildCache
+from openhab_creator.output.outputstream import OutputStream
 
 
 class BaseCreator():
@@ -16,20 +17,48 @@ class BaseCreator():
             self.subdir = self.typed
 
         self.lines: List[str] = []
+        self.stream: Optional[OutputStream] = None
+        self.deferred: Optional[List[Tuple[str, str]]] = None
 
     def append(self, lines: str) -> None:
-        self.lines.append(lines)
+        if self.deferred is None:
+            if self.stream is None:
+                self.stream = OutputStream(self.outputdir / self.subdir)
+
+            self.stream.write(lines)
+        else:
+            self.lines.append(lines)
+
+    def defer(self) -> None:
+        self.deferred = []
 
     def write_file(self, filename: str) -> None:
+        if self.deferred is None:
+            stream = self.stream or OutputStream(self.outputdir / self.subdir)
+            self.stream = None
+
+            if stream.commit(self._destination(filename)):
+                self._log_written(filename)
+        else:
+            self.deferred.append((filename, "\n".join(self.lines)))
+            self.lines.clear()
+
+    def write_deferred(self, deferred: List[Tuple[str, str]]) -> None:
+        for filename, content in deferred:
+            self._write_content(filename, content)
+
+    def _write_content(self, filename: str, content: str) -> None:
         self._create_outputdir_if_not_exists()
 
-        with open(self.outputdir / self.subdir / f'{filename}.{self.typed}', 'w', encoding='utf-8') as f:
-            f.writelines("\n".join(self.lines))
+        if BuildCache.write(self._destination(filename), content):
+            self._log_written(filename)
+
+    def _destination(self, filename: str) -> Path:
+        return self.outputdir / self.subdir / f'{filename}.{self.typed}'
 
+    def _log_written(self, filename: str) -> None:
         logger.info('File %s/%s.%s written',
                     self.subdir, filename, self.typed)
 
-        self.lines.clear()
-
     def _create_outputdir_if_not_exists(self) -> None:
-        os.makedirs(self.outputdir / self.subdir, exist_ok=True)
+        BuildCache.makedirs(self.outputdir / self.subdir)
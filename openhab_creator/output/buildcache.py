@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+
+
+class BuildCache():
+    FILENAME = '.openhab_creator_cache.json'
+    EXCLUDED_INPUTS = ('documentation',)
+
+    def __init__(self, outputdir: str):
+        self.cachefile: Path = Path(outputdir) / self.FILENAME
+
+        self.inputs: Dict[str, str] = {}
+        self.generator: Optional[str] = None
+        self.options: Dict[str, Any] = {}
+        self.outputs: Dict[str, Dict[str, Union[str, int]]] = {}
+
+        self.written: int = 0
+        self.skipped: int = 0
+
+        self._read()
+
+    def _read(self) -> None:
+        if self.cachefile.exists():
+            try:
+                with open(self.cachefile, encoding='utf-8') as fobj:
+                    cache = json.load(fobj)
+                    self.inputs = cache.get('inputs', {})
+                    self.generator = cache.get('generator')
+                    self.options = cache.get('options', {})
+                    self.outputs = cache.get('outputs', {})
+            except (OSError, ValueError):
+                logger.warning('Ignoring unreadable build cache %s',
+                               self.cachefile)
+
+    def save(self) -> None:
+        with open(self.cachefile, 'w', encoding='utf-8') as fobj:
+            json.dump({'inputs': self.inputs, 'generator': self.generator,
+                       'options': self.options, 'outputs': self.outputs},
+                      fobj, indent=1, sort_keys=True)
+
+        logger.info('Build cache: %d files written, %d unchanged',
+                    self.written, self.skipped)
+
+        self.written = 0
+        self.skipped = 0
+
+    @staticmethod
+    def current() -> Optional[BuildCache]:
+        return BuildContext.current().build_cache
+
+    def update_inputs(self, configdir: str) -> List[str]:
+        inputs = self.digest_inputs(configdir)
+
+        changed = sorted(
+            path for path in {**self.inputs, **inputs}
+            if self.inputs.get(path) != inputs.get(path))
+
+        for path in changed:
+            logger.info('Changed input: %s', path)
+
+        self.inputs = inputs
+
+        return changed
+
+    def update_generator(self) -> bool:
+        generator = self.digest_generator()
+        unchanged = generator == self.generator
+        self.generator = generator
+
+        return unchanged
+
+    def update_options(self, options: Dict[str, Any]) -> bool:
+        options = json.loads(json.dumps(options))
+        changed = sorted(
+            option for option in {**self.options, **options}
+            if self.options.get(option) != options.get(option))
+
+        for option in changed:
+            logger.info('Changed build option: %s', option)
+
+        self.options = options
+
+        return len(changed) == 0
+
+    def outputs_exist(self) -> bool:
+        return len(self.outputs) > 0\
+            and all(os.path.exists(destination) for destination in self.outputs)
+
+    @staticmethod
+    def digest_generator() -> str:
+        sha = hashlib.sha256()
+        packagedir = Path(__file__).resolve().parents[1]
+
+        for root, dirs, files in os.walk(packagedir):
+            dirs[:] = sorted(directory for directory in dirs
+                             if directory != '__pycache__')
+
+            for filename in sorted(files):
+                srcfile = os.path.join(root, filename)
+                stat = os.stat(srcfile)
+                sha.update(f'{os.path.relpath(srcfile, packagedir)}:'
+                           f'{stat.st_size}:{stat.st_mtime_ns}\n'.encode('utf-8'))
+
+        return sha.hexdigest()
+
+    @classmethod
+    def digest_inputs(cls, configdir: str) -> Dict[str, str]:
+        inputs = {}
+
+        for root, dirs, files in os.walk(configdir):
+            if os.path.samefile(root, configdir):
+                dirs[:] = [directory for directory in dirs
+                           if directory not in cls.EXCLUDED_INPUTS]
+
+            for filename in files:
+                srcfile = os.path.join(root, filename)
+                relpath = Path(os.path.relpath(srcfile, configdir)).as_posix()
+                inputs[relpath] = cls.digest_file(srcfile)
+
+        return inputs
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def digest_file(srcfile: Union[str, Path]) -> str:
+        sha = hashlib.sha256()
+
+        with open(srcfile, 'rb') as fobj:
+            for chunk in iter(lambda: fobj.read(65536), b''):
+                sha.update(chunk)
+
+        return sha.hexdigest()
+
+    @staticmethod
+    def _key(destination: Union[str, Path]) -> str:
+        return str(Path(destination).resolve())
+
+    def unchanged(self, destination: Union[str, Path],
+                  data: Union[bytes, str, Path], digest: str) -> bool:
+        if not os.path.exists(destination):
+            return False
+
+        entry = self.outputs.get(self._key(destination))
+        stat = os.stat(destination)
+
+        if entry is not None and entry['digest'] == digest\
+                and entry['size'] == stat.st_size\
+                and entry['mtime'] == stat.st_mtime_ns:
+            return True
+
+        if isinstance(data, bytes):
+            with open(destination, 'rb') as fobj:
+                same = fobj.read() == data
+        else:
+            same = filecmp.cmp(data, destination, shallow=False)
+
+        if same:
+            self.register(destination, digest)
+
+        return same
+
+    def register(self, destination: Union[str, Path], digest: str) -> None:
+        stat = os.stat(destination)
+        self.outputs[self._key(destination)] = {
+            'digest': digest,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns
+        }
+
+    @staticmethod
+    def makedirs(directory: Union[str, Path]) -> None:
+        if BuildContext.current().sink is None:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def write(cls,
+              destination: Union[str, Path],
+              content: Union[str, bytes],
+              encoding: Optional[str] = 'utf-8') -> bool:
+        data = content if isinstance(content, bytes) else content.encode(
+            encoding or 'utf-8')
+
+        sink = BuildContext.current().sink
+        if sink is not None:
+            sink.write(destination, data)
+            return True
+
+        digest = cls.digest(data)
+        build_cache = cls.current()
+
+        if build_cache is not None and build_cache.unchanged(destination, data, digest):
+            build_cache.skipped += 1
+            logger.debug('Unchanged %s', destination)
+            return False
+
+        with open(destination, 'wb') as fobj:
+            fobj.write(data)
+
+        if build_cache is not None:
+            build_cache.written += 1
+            build_cache.register(destination, digest)
+
+        return True
+
+    @classmethod
+    def commit(cls, tmpfile: str, destination: Union[str, Path], digest: str) -> bool:
+        build_cache = cls.current()
+
+        if build_cache is not None and build_cache.unchanged(destination, tmpfile, digest):
+            os.remove(tmpfile)
+            build_cache.skipped += 1
+            logger.debug('Unchanged %s', destination)
+            return False
+
+        os.replace(tmpfile, destination)
+
+        if build_cache is not None:
+            build_cache.written += 1
+            build_cache.register(destination, digest)
+
+        return True
+
+    @classmethod
+    def copy(cls, srcfile: str, destination: str) -> bool:
+        sink = BuildContext.current().sink
+        if sink is not None:
+            with open(srcfile, 'rb') as fobj:
+                sink.write(destination, fobj.read())
+            return True
+
+        build_cache = cls.current()
+
+        if build_cache is not None\
+                and os.path.exists(destination)\
+                and filecmp.cmp(srcfile, destination, shallow=False):
+            build_cache.skipped += 1
+            return False
+
+        shutil.copy2(srcfile, destination)
+
+        if build_cache is not None:
+            build_cache.written += 1
+
+        return True
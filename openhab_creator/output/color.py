@@ -1,3 +1,5 @@
+from typing import Dict
+
 from openhab_creator import CreatorEnum
 
 
@@ -14,3 +16,7 @@ class Color(CreatorEnum):
     GREY = "#cecece"
     VIOLETT = "#8942f4"
     BLACK = "#000000"
+
+    @classmethod
+    def palette(cls) -> Dict[str, str]:
+        return {color.name: str(color) for color in cls}
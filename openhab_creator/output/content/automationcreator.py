@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
+from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.models.common import Scene
+from openhab_creator.output.buildcache import BuildCache
 from openhab_creator.output.content.basecontentcreator import \
     BaseContentCreator
 
@@ -11,6 +16,8 @@ if TYPE_CHECKING:
 
 class AutomationCreator(BaseContentCreator):
     BASESRCPATH = 'automation/helper/Core/automation/'
+    SCENEPLAN = 'automation/lib/python/personal/sceneplan.json'
+    INFLUXDBSERIES = 'automation/lib/python/personal/influxdbseries.json'
 
     def build(self, configdir: str, configuration: Configuration):
         self._copy_all_files_from_subdir('scripts')
@@ -23,11 +30,14 @@ class AutomationCreator(BaseContentCreator):
         self._copy_all_files_from_subdir(
             f'{self.BASESRCPATH}jsr223/python/core', 'automation/jsr223/core')
 
+        self.write_sceneplan(configuration)
+        self.write_influxdb_series()
+
         self._copy_all_files_from_subdir(
             'automation/libraries', 'automation/lib/python/personal')
 
         self._copy_all_files_from_subdir(
-            'automation/rules', 'automation/jsr223/personal', only_updated=False)
+            'automation/rules', 'automation/jsr223/personal')
 
     def prepare_and_copy_configuration(self,
                                        configdir: str,
@@ -35,3 +45,33 @@ class AutomationCreator(BaseContentCreator):
         self._copy_file_with_secrets(
             configdir, 'configuration.py',
             secrets, 'automation/lib/python/configuration.py')
+
+    def write_sceneplan(self, configuration: Configuration) -> None:
+        locations = []
+
+        for location in configuration.locations.timecontrolled.values():
+            locations.append({
+                'location': location.identifier,
+                'active_item': location.autoactive_id,
+                'assignments': {scene.identifier: location.sceneassignment_id(scene)
+                                for scene in Scene},
+                'equipment': [equipment.scene_items for equipment in location.equipment
+                              if equipment.is_timecontrolled]
+            })
+
+        self._write_json(self.SCENEPLAN, {'locations': locations})
+
+    def write_influxdb_series(self) -> None:
+        series = {item: {'measurement': entry['measurement']}
+                  for item, entry in sorted(BuildContext.current().influxdb_series.items())}
+
+        self._write_json(self.INFLUXDBSERIES, series)
+
+    def _write_json(self, relpath: str, raw_object) -> None:
+        destfile = self._outputdir / relpath
+
+        BuildCache.makedirs(destfile.parent)
+        self._written.append(destfile)
+
+        if BuildCache.write(destfile, json.dumps(raw_object, ensure_ascii=False)):
+            logger.info('Write %s/%s', self._outputdir, relpath)
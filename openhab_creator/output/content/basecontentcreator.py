@@ -1,14 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pathlib import Path
 import os
-import re
-
-import shutil
 
 from openhab_creator import logger
 from openhab_creator.exception import BuildException
+from openhab_creator.output.buildcache import BuildCache
+from openhab_creator.output.content.contentsync import ContentSync
+from openhab_creator.output.placeholders import Placeholders
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import SecretsStorage
@@ -21,10 +21,12 @@ class BaseContentCreator():
         pwd = Path(__file__).resolve().parent.parent.parent
         self._srcdir: str = pwd / 'content'
 
+        self._content_sync: Optional[ContentSync] = None
+        self._written: List[Path] = []
+
     def _copy_all_files_from_subdir(self,
                                     subdir: str, destination: Optional[str] = None,
-                                    configdir: Optional[str] = None,
-                                    only_updated: Optional[bool] = True) -> None:
+                                    configdir: Optional[str] = None) -> None:
         if destination is None:
             dest_dir = self._create_outputdir_if_not_exists(subdir)
         else:
@@ -32,28 +34,14 @@ class BaseContentCreator():
 
         srcdir = Path(configdir or self._srcdir)
 
-        self.copytree(str(srcdir / subdir), str(dest_dir), only_updated)
-
-    @classmethod
-    def copytree(cls, srcdir: str, destdir: str, only_updated: bool) -> None:
-        if not os.path.exists(destdir):
-            os.makedirs(destdir)
-        for item in os.listdir(srcdir):
-            src = os.path.join(srcdir, item)
-            dest = os.path.join(destdir, item)
-            if os.path.isdir(src):
-                cls.copytree(src, dest, only_updated)
-            else:
-                if not only_updated\
-                        or not os.path.exists(dest)\
-                        or os.stat(src).st_mtime - os.stat(dest).st_mtime > 1:
-                    logger.info('Copy %s -> %s', src, dest)
-                    shutil.copy2(src, dest)
+        if self._content_sync is None:
+            self._content_sync = ContentSync(self._outputdir)
+
+        self._content_sync.sync(srcdir / subdir, dest_dir, self._written)
 
     def _create_outputdir_if_not_exists(self, subdir: str) -> Path:
         destination = self._outputdir / subdir
-        if not os.path.exists(destination):
-            os.makedirs(destination)
+        BuildCache.makedirs(destination)
 
         return destination
 
@@ -69,7 +57,7 @@ class BaseContentCreator():
         if os.path.exists(srcfile):
             with open(srcfile, 'r', encoding='utf-8') as fobj:
                 content = fobj.read()
-                content = self.__replace_secrets(content, secrets)
+                content = self.__replace_secrets(content, secrets, input_file)
 
                 if secrets.handle_missing():
                     raise BuildException('Missing secrets')
@@ -77,19 +65,27 @@ class BaseContentCreator():
                 self.__write_configuration(output_file, content)
 
     @staticmethod
-    def __replace_secrets(content: str, secrets_storage: SecretsStorage) -> str:
-        secrets = re.findall('__([A-Z0-9_]*)__', content, re.MULTILINE)
-        for secret in secrets:
-            replace = secrets_storage.secret(*secret.split('_'))
-            content = content.replace(f'__{secret}__', replace)
+    def __replace_secrets(content: str,
+                          secrets_storage: SecretsStorage,
+                          source: str) -> str:
+        placeholders = Placeholders(
+            resolver=lambda secret: secrets_storage.secret_optional(*secret.split('_')))
+
+        content = placeholders.render(content, source)
+
+        for secret in placeholders.unknown:
+            secrets_storage.secret(*secret.split('_'))
+
+        if not secrets_storage.anonym:
+            placeholders.report('secret')
 
         return content
 
     def __write_configuration(self, output_file: str, content: str) -> None:
         destfile = self._outputdir / output_file
 
-        os.makedirs(os.path.dirname(os.path.abspath(destfile)), exist_ok=True)
+        BuildCache.makedirs(os.path.dirname(os.path.abspath(destfile)))
+        self._written.append(destfile)
 
-        with open(destfile, 'w') as fobj:
+        if BuildCache.write(destfile, content, encoding=None):
             logger.info('Write %s/%s', self._outputdir, output_file)
-            fobj.write(content)
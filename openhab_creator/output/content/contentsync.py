@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import filecmp
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.output.buildcache import BuildCache
+
+
+class ContentSync():
+    MANIFEST = '.openhab_creator_content.json'
+    PARALLEL_THRESHOLD = 32
+    WORKERS = 8
+
+    def __init__(self, outputdir: Union[str, Path]):
+        self.outputdir: Path = Path(outputdir)
+        self.manifestfile: Path = self.outputdir / self.MANIFEST
+        self.manifest: Dict[str, Dict[str, Union[str, int]]] = {}
+
+        if BuildContext.current().sink is None:
+            self.manifest = self._read()
+
+    def sync(self, srcdir: Union[str, Path], destdir: Union[str, Path],
+             exclude: Optional[Iterable[Path]] = ()) -> None:
+        destprefix = Path(os.path.relpath(destdir, self.outputdir)).as_posix()
+        excluded = {Path(path).resolve() for path in exclude}
+
+        sources = {}
+        for srcfile in self._walk(srcdir):
+            relpath = Path(os.path.relpath(srcfile, srcdir)).as_posix()
+            destination = Path(destdir) / relpath
+            if destination.resolve() not in excluded:
+                sources[f'{destprefix}/{relpath}'] = srcfile
+
+        sink = BuildContext.current().sink
+        if sink is not None:
+            for relpath, srcfile in sources.items():
+                with open(srcfile, 'rb') as fobj:
+                    sink.write(self.outputdir / relpath, fobj.read())
+            return
+
+        changed = []
+        for relpath, srcfile in sources.items():
+            entry = self._entry(relpath, srcfile)
+            if not self._in_sync(relpath, entry):
+                changed.append((srcfile, self.outputdir / relpath))
+
+            self.manifest[relpath] = entry
+
+        copied = self._copy_all(changed)
+
+        orphans = sorted(relpath for relpath in self.manifest
+                         if relpath.startswith(f'{destprefix}/')
+                         and relpath not in sources)
+
+        for relpath in orphans:
+            del self.manifest[relpath]
+            destination = self.outputdir / relpath
+            if destination.is_file() and destination.resolve() not in excluded:
+                os.remove(destination)
+                logger.info('Remove orphaned %s', destination)
+
+        build_cache = BuildCache.current()
+        if build_cache is not None:
+            build_cache.written += copied
+            build_cache.skipped += len(sources) - copied
+
+        self._write()
+
+    def outputs_exist(self) -> bool:
+        return all((self.outputdir / relpath).is_file() for relpath in self.manifest)
+
+    @staticmethod
+    def _walk(srcdir: Union[str, Path]) -> List[str]:
+        srcfiles = []
+
+        for root, dirs, files in os.walk(srcdir):
+            dirs.sort()
+            for filename in sorted(files):
+                srcfiles.append(os.path.join(root, filename))
+
+        return srcfiles
+
+    def _entry(self, relpath: str, srcfile: str) -> Dict[str, Union[str, int]]:
+        stat = os.stat(srcfile)
+        previous = self.manifest.get(relpath)
+
+        if previous is not None\
+                and previous['source'] == srcfile\
+                and previous['size'] == stat.st_size\
+                and previous['mtime'] == stat.st_mtime_ns:
+            digest = previous['digest']
+        else:
+            digest = BuildCache.digest_file(srcfile)
+
+        return {
+            'source': srcfile,
+            'digest': digest,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns
+        }
+
+    def _in_sync(self, relpath: str, entry: Dict[str, Union[str, int]]) -> bool:
+        previous = self.manifest.get(relpath)
+        destination = self.outputdir / relpath
+
+        if previous is None or previous['digest'] != entry['digest']\
+                or not destination.is_file():
+            return False
+
+        return os.stat(destination).st_size == entry['size']
+
+    def _copy_all(self, changed: List[Tuple[str, Path]]) -> int:
+        if len(changed) >= self.PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(self.WORKERS) as executor:
+                results = list(executor.map(lambda x: self._copy(*x), changed))
+        else:
+            results = [self._copy(*x) for x in changed]
+
+        return sum(results)
+
+    @staticmethod
+    def _copy(srcfile: str, destination: Path) -> bool:
+        if destination.is_file() and filecmp.cmp(srcfile, destination, shallow=False):
+            return False
+
+        os.makedirs(destination.parent, exist_ok=True)
+        shutil.copy2(srcfile, destination)
+        logger.info('Copy %s -> %s', srcfile, destination)
+
+        return True
+
+    def _read(self) -> Dict[str, Dict[str, Union[str, int]]]:
+        manifest = {}
+
+        if self.manifestfile.exists():
+            try:
+                with open(self.manifestfile, encoding='utf-8') as fobj:
+                    manifest = json.load(fobj)
+            except (OSError, ValueError):
+                logger.warning('Ignoring unreadable content manifest %s',
+                               self.manifestfile)
+
+        return manifest
+
+    def _write(self) -> None:
+        with open(self.manifestfile, 'w', encoding='utf-8') as fobj:
+            json.dump(self.manifest, fobj, indent=1, sort_keys=True)
@@ -1,15 +1,61 @@
 from __future__ import annotations
 
+import json
 import re
-from typing import TYPE_CHECKING, Optional
-from xml.dom import minidom
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+from xml.sax.saxutils import escape
 
+from openhab_creator import logger
 from openhab_creator.output.basecreator import BaseCreator
+from openhab_creator.output.buildcache import BuildCache
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
 
 
+class XmlStream():
+    ATTRIBUTE_ENTITIES = {'"': '&quot;'}
+
+    def __init__(self, append: Callable[[str], None], indent: Optional[str] = '\t'):
+        self.append: Callable[[str], None] = append
+        self.indent: str = indent
+        self.depth: int = 0
+
+    def declaration(self) -> None:
+        self.append('<?xml version="1.0" ?>')
+
+    def start(self, tag: str, attributes: Optional[Dict[str, str]] = None) -> None:
+        self._line(f'<{tag}{self._attributes(attributes)}>')
+        self.depth += 1
+
+    def end(self, tag: str) -> None:
+        self.depth -= 1
+        self._line(f'</{tag}>')
+
+    def empty(self, tag: str, attributes: Optional[Dict[str, str]] = None) -> None:
+        self._line(f'<{tag}{self._attributes(attributes)}/>')
+
+    def text(self, tag: str, text: str,
+             attributes: Optional[Dict[str, str]] = None) -> None:
+        self._line(
+            f'<{tag}{self._attributes(attributes)}>{escape(text)}</{tag}>')
+
+    def close(self) -> None:
+        self.append('')
+
+    def _line(self, line: str) -> None:
+        self.append(self.indent * self.depth + line)
+
+    @classmethod
+    def _attributes(cls, attributes: Optional[Dict[str, str]]) -> str:
+        if not attributes:
+            return ''
+
+        return ''.join(f' {name}="{escape(value, cls.ATTRIBUTE_ENTITIES)}"'
+                       for name, value in attributes.items())
+
+
 class Event():
     MONTHS = {
         1: 'JANUARY',
@@ -26,6 +72,9 @@ class Event():
         12: 'DECEMBER'
     }
 
+    WEEKDAYS = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY',
+                'FRIDAY', 'SATURDAY', 'SUNDAY')
+
     def __init__(self, typed: str):
         self.typed = typed
         self.names = []
@@ -34,6 +83,14 @@ class Event():
     def description(self) -> str:
         return ', '.join(self.names)
 
+    @property
+    def index_name(self) -> str:
+        return self.description
+
+    def dates(self, year: int) -> Iterator[date]:
+        #pylint: disable=unused-argument
+        yield from ()
+
 
 class FixedDay(Event):
     ANNUAL_FLAG = 'A'
@@ -73,17 +130,28 @@ class FixedDay(Event):
     def event_key(self) -> str:
         return f'{self.day}.{self.month}.'
 
-    def add_as_node(self, xml_document, root_node):
-        day_node = xml_document.createElement('tns:Fixed')
-        day_node.setAttribute('month', self.MONTHS[self.month])
-        day_node.setAttribute('day', str(self.day))
-        day_node.setAttribute('descriptionPropertiesKey', self.description)
+    @property
+    def valid_from(self) -> Optional[int]:
+        return self.year if self.typed == self.FIXED_FLAG else None
+
+    def write(self, xml: XmlStream) -> None:
+        attributes = {
+            'month': self.MONTHS[self.month],
+            'day': str(self.day),
+            'descriptionPropertiesKey': self.description
+        }
 
-        if self.typed == self.FIXED_FLAG and self.year:
-            day_node.setAttribute('validFrom', str(self.year))
+        if self.valid_from:
+            attributes['validFrom'] = str(self.valid_from)
 
-        root_node.appendChild(day_node)
-        return root_node
+        xml.empty('tns:Fixed', attributes)
+
+    def dates(self, year: int) -> Iterator[date]:
+        if self.valid_from is None or year >= self.valid_from:
+            try:
+                yield date(year, self.month, self.day)
+            except ValueError:
+                pass
 
 
 class RelativeToFixedDay(Event):
@@ -108,25 +176,29 @@ class RelativeToFixedDay(Event):
     def event_key(self) -> str:
         return f'R{self.day}.{self.month}.'
 
-    def add_as_node(self, xml_document, root_node):
-        day_node = xml_document.createElement('tns:RelativeToFixed')
-        day_node.setAttribute('descriptionPropertiesKey', self.description)
+    def write(self, xml: XmlStream) -> None:
+        xml.start('tns:RelativeToFixed',
+                  {'descriptionPropertiesKey': self.description})
+        xml.text('tns:Weekday', self.weekday)
+        xml.text('tns:When', self.direction)
+        xml.empty('tns:Date', {
+            'month': self.MONTHS[self.month],
+            'day': str(self.day)
+        })
+        xml.end('tns:RelativeToFixed')
 
-        weekday_node = xml_document.createElement('tns:Weekday')
-        weekday_node.appendChild(xml_document.createTextNode(self.weekday))
-        day_node.appendChild(weekday_node)
+    def dates(self, year: int) -> Iterator[date]:
+        if self.weekday not in self.WEEKDAYS:
+            return
 
-        direction_node = xml_document.createElement('tns:When')
-        direction_node.appendChild(xml_document.createTextNode(self.direction))
-        day_node.appendChild(direction_node)
+        step = timedelta(days=-1 if self.direction == 'BEFORE' else 1)
+        weekday = self.WEEKDAYS.index(self.weekday)
 
-        date_node = xml_document.createElement('tns:Date')
-        date_node.setAttribute('month', self.MONTHS[self.month])
-        date_node.setAttribute('day', str(self.day))
-        day_node.appendChild(date_node)
+        day = date(year, self.month, self.day) + step
+        while day.weekday() != weekday:
+            day += step
 
-        root_node.appendChild(day_node)
-        return root_node
+        yield day
 
 
 class FixedWeekday(Event):
@@ -151,15 +223,33 @@ class FixedWeekday(Event):
     def event_key(self) -> str:
         return self.description
 
-    def add_as_node(self, xml_document, root_node):
-        day_node = xml_document.createElement('tns:FixedWeekday')
-        day_node.setAttribute('which', self.which)
-        day_node.setAttribute('weekday', self.weekday)
-        day_node.setAttribute('month', self.MONTHS[self.month])
-        day_node.setAttribute('descriptionPropertiesKey', self.description)
+    WHICH = ('FIRST', 'SECOND', 'THIRD', 'FOURTH')
+
+    def write(self, xml: XmlStream) -> None:
+        xml.empty('tns:FixedWeekday', {
+            'which': self.which,
+            'weekday': self.weekday,
+            'month': self.MONTHS[self.month],
+            'descriptionPropertiesKey': self.description
+        })
 
-        root_node.appendChild(day_node)
-        return root_node
+    def dates(self, year: int) -> Iterator[date]:
+        if self.weekday not in self.WEEKDAYS:
+            return
+
+        weekday = self.WEEKDAYS.index(self.weekday)
+
+        if self.which == 'LAST':
+            following = date(year + self.month // 12, self.month % 12 + 1, 1)
+            day = following - timedelta(days=1)
+            day -= timedelta(days=(day.weekday() - weekday) % 7)
+            yield day
+        elif self.which in self.WHICH:
+            day = date(year, self.month, 1)
+            day += timedelta(days=(weekday - day.weekday()) % 7
+                             + 7 * self.WHICH.index(self.which))
+            if day.month == self.month:
+                yield day
 
 
 class ChristianHoliday(Event):
@@ -169,36 +259,83 @@ class ChristianHoliday(Event):
         super().__init__(self.FLAG)
         self.name = event_str[2:]
 
+    EASTER_OFFSETS = {
+        'CLEAN_MONDAY': -48,
+        'SHROVE_MONDAY': -48,
+        'MARDI_GRAS': -47,
+        'CARNIVAL': -47,
+        'ASH_WEDNESDAY': -46,
+        'MAUNDY_THURSDAY': -3,
+        'GOOD_FRIDAY': -2,
+        'EASTER_SATURDAY': -1,
+        'EASTER': 0,
+        'EASTER_MONDAY': 1,
+        'EASTER_TUESDAY': 2,
+        'GENERAL_PRAYER_DAY': 26,
+        'ASCENSION_DAY': 39,
+        'PENTECOST': 49,
+        'WHIT_SUNDAY': 49,
+        'WHIT_MONDAY': 50,
+        'PENTECOST_MONDAY': 50,
+        'CORPUS_CHRISTI': 60,
+        'SACRED_HEART': 68
+    }
+
     @property
     def event_key(self) -> str:
         return self.name
 
-    def add_as_node(self, xml_document, root_node):
-        day_node = xml_document.createElement('tns:ChristianHoliday')
-        day_node.setAttribute('type', self.name)
+    @property
+    def index_name(self) -> str:
+        return f'christian.{self.name}'
+
+    def write(self, xml: XmlStream) -> None:
+        xml.empty('tns:ChristianHoliday', {'type': self.name})
 
-        root_node.appendChild(day_node)
-        return root_node
+    def dates(self, year: int) -> Iterator[date]:
+        if self.name in self.EASTER_OFFSETS:
+            yield self.easter(year) + timedelta(days=self.EASTER_OFFSETS[self.name])
+        else:
+            logger.warning('No date calculation for christian holiday %s',
+                           self.name)
+
+    @staticmethod
+    def easter(year: int) -> date:
+        #pylint: disable=invalid-name
+        a = year % 19
+        b, c = divmod(year, 100)
+        d, e = divmod(b, 4)
+        g = (8 * b + 13) // 25
+        h = (19 * a + b - d - g + 15) % 30
+        i, k = divmod(c, 4)
+        l = (32 + 2 * e + 2 * i - h - k) % 7
+        m = (a + 11 * h + 19 * l) // 433
+        month = (h + l - 7 * m + 90) // 25
+        day = (h + l - 7 * m + 33 * month + 19) % 32
+
+        return date(year, month, day)
 
 
 class EphemerisCreator(BaseCreator):
+    EVENT_TYPES = ('birthdays', 'holidays', 'specialdays')
+    INDEX_YEARS = 2
 
     def __init__(self, outputdir):
         super().__init__('xml', outputdir, 'ephemeris')
 
-    def build(self, configuration: Configuration) -> None:
-        for event_type in ['birthdays', 'holidays', 'specialdays']:
+    def build(self, configuration: Configuration, today: Optional[date] = None) -> None:
+        today = today or date.today()
+
+        for event_type in self.EVENT_TYPES:
             data = self._read_data_from_secrets(configuration, event_type)
 
             if data:
-                xml_document, root_node = self._get_holiday_base_xml()
-
-                for event in data.values():
-                    root_node = event.add_as_node(xml_document, root_node)
-
-                self.append(xml_document.toprettyxml(indent="\t"))
+                xml = XmlStream(self.append)
+                self._write_holiday_xml(xml, data.values())
                 self.write_file(event_type)
 
+                self._write_index(event_type, data.values(), today.year)
+
     @staticmethod
     def _read_data_from_secrets(configuration: Configuration, events_type: str):
         events = configuration.secrets.secret_optional(
@@ -231,19 +368,40 @@ class EphemerisCreator(BaseCreator):
         return data
 
     @staticmethod
-    def _get_holiday_base_xml():
-        xml_document = minidom.Document()
-        config = xml_document.createElement('tns:Configuration')
-        config.setAttribute('hierarchy', 'de')
-        config.setAttribute('description', 'Germany')
-        config.setAttribute('xmlns:tns', 'http://www.example.org/Holiday')
-        config.setAttribute(
-            'xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
-        config.setAttribute('xsi:schemaLocation',
-                            'http://www.example.org/Holiday /Holiday.xsd')
-
-        xml_document.appendChild(config)
-
-        root_node = xml_document.createElement('tns:Holidays')
-        config.appendChild(root_node)
-        return xml_document, root_node
+    def _write_holiday_xml(xml: XmlStream, events: Iterator[Event]) -> None:
+        xml.declaration()
+        xml.start('tns:Configuration', {
+            'hierarchy': 'de',
+            'description': 'Germany',
+            'xmlns:tns': 'http://www.example.org/Holiday',
+            'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+            'xsi:schemaLocation': 'http://www.example.org/Holiday /Holiday.xsd'
+        })
+        xml.start('tns:Holidays')
+
+        for event in events:
+            event.write(xml)
+
+        xml.end('tns:Holidays')
+        xml.end('tns:Configuration')
+        xml.close()
+
+    def _write_index(self, event_type: str, events: Iterator[Event], year: int) -> None:
+        days: Dict[date, List[str]] = {}
+
+        for event in events:
+            for indexed_year in range(year, year + self.INDEX_YEARS):
+                for day in event.dates(indexed_year):
+                    days.setdefault(day, []).append(event.index_name)
+
+        index = {
+            'from': date(year, 1, 1).isoformat(),
+            'until': date(year + self.INDEX_YEARS - 1, 12, 31).isoformat(),
+            'days': [[day.isoformat(), names] for day, names in sorted(days.items())]
+        }
+
+        destination = self.outputdir / self.subdir / f'{event_type}.json'
+        self._create_outputdir_if_not_exists()
+
+        if BuildCache.write(destination, json.dumps(index, ensure_ascii=False)):
+            logger.info('File %s/%s.json written', self.subdir, event_type)
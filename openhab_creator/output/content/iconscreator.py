@@ -1,23 +1,64 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import math
+import multiprocessing
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
-from cairosvg import svg2png
 from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.output.buildcache import BuildCache
 from openhab_creator.output.color import Color
 from openhab_creator.output.content.basecontentcreator import \
     BaseContentCreator
+from openhab_creator.output.placeholders import Placeholders
 
 if TYPE_CHECKING:
     from posix import DirEntry
 
 
+def render_png(task: Tuple[str, int, int]) -> bytes:
+    from cairosvg import svg2png  # pylint: disable=import-outside-toplevel
+
+    content, width, height = task
+    return svg2png(bytestring=content, output_height=height, output_width=width)
+
+
 class IconsCreator(BaseContentCreator):
-    def __init__(self, outputdir: str):
+    #pylint: disable=too-many-instance-attributes
+    CACHE_DIR = '.openhab_creator_icons'
+    SIZE = 32
+    HTML_DIR = 'html/icons'
+    SPRITE_CLASS = 'oh-icon'
+
+    def __init__(self, outputdir: str,
+                 jobs: Optional[int] = 1,
+                 cachedir: Optional[str] = None,
+                 sizes: Optional[Iterable[int]] = (),
+                 sprite: Optional[bool] = False):
+        #pylint: disable=too-many-arguments
         super().__init__(outputdir)
         self.icons = []
+        self.jobs: int = jobs
+        self.cachedir: Optional[Path] = None
+        if cachedir is not None or BuildContext.current().sink is None:
+            self.cachedir = Path(cachedir or self.default_cachedir(outputdir))\
+                / self.CACHE_DIR
+        self.sizes: List[int] = sorted({self.SIZE, *sizes})
+        self.sprite: bool = sprite
+
+        self.variants: Dict[str, Tuple[str, List[str]]] = {}
+        self.cached: Set[str] = set()
+        self.palette: Placeholders = Placeholders(Color.palette())
+
+        self.sprite_svg: Optional[str] = None
+        self.sprite_cells: Dict[str, Tuple[int, int]] = {}
+        self.sprite_columns: int = 0
+        self.sprite_rows: int = 0
 
     def build(self, configdir: str) -> None:
         self._create_outputdir_if_not_exists('icons/classic')
@@ -28,45 +69,226 @@ class IconsCreator(BaseContentCreator):
                 icon_basename = category.name
                 for srcfile in os.scandir(category.path):
                     if srcfile.name == 'default.svg':
-                        self._createfiles(srcfile, icon_basename)
+                        self._collect(srcfile, [icon_basename])
                     elif srcfile.name.endswith('.svg'):
-                        self._createfiles(
-                            srcfile, f'{icon_basename}-{srcfile.name}'[0:-4])
-                        self._createfiles(
-                            srcfile, f'{icon_basename}{srcfile.name}'[0:-4])
+                        self._collect(srcfile, [
+                            f'{icon_basename}-{srcfile.name}'[0:-4],
+                            f'{icon_basename}{srcfile.name}'[0:-4]
+                        ])
             elif category.name.endswith('.svg'):
-                self._createfiles(category, category.name[0:-4])
+                self._collect(category, [category.name[0:-4]])
+
+        self.palette.report('icon')
+
+        if self.sprite:
+            self._layout_sprite()
+
+        pngs = self._render_pngs()
+
+        for digest, (content, icon_names) in self.variants.items():
+            for icon_name in icon_names:
+                self._write_svg(icon_name, content)
+                self._write_png(f'icons/classic/{icon_name}.png',
+                                pngs[(digest, self.SIZE)])
+
+                for size in self.sizes:
+                    if size != self.SIZE:
+                        self._write_png(f'{self.HTML_DIR}/{size}/{icon_name}.png',
+                                        pngs[(digest, size)])
+
+        if self.sprite:
+            self._write_sprite(pngs)
+
+        self._prune_cache()
 
     def check_icons_exist(self, icons: List[str]) -> None:
         for icon in icons:
             if not icon in self.icons:
                 logger.warning('Missing icon: %s', icon)
 
-    def _createfiles(self, srcfile: DirEntry, icon_name: str):
-        self.icons.append(icon_name)
-
-        logger.info('Create icon: %s', icon_name)
+    def _collect(self, srcfile: DirEntry, icon_names: List[str]) -> None:
+        content = self.generate_output_icons(srcfile, self.palette)
+        digest = self.digest(content)
 
-        content = self.generate_output_icons(srcfile)
+        if digest not in self.variants:
+            self.variants[digest] = (content, [])
 
-        self._write_svg(icon_name, content)
-        self._convert_write_png(icon_name, content)
+        for icon_name in icon_names:
+            self.icons.append(icon_name)
+            self.variants[digest][1].append(icon_name)
+            logger.info('Create icon: %s', icon_name)
 
     @staticmethod
-    def generate_output_icons(srcpath: DirEntry) -> str:
+    def generate_output_icons(srcpath: DirEntry,
+                              palette: Optional[Placeholders] = None) -> str:
+        if palette is None:
+            palette = Placeholders(Color.palette())
+
         with open(srcpath, 'r') as srcfile:
-            content = srcfile.read()
-            for color in Color:
-                content = content.replace(f'__{color.name}__', str(color))
+            return palette.render(srcfile.read(), srcpath.path)
+
+    @staticmethod
+    def digest(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def default_cachedir(outputdir: str) -> Path:
+        cachehome = os.environ.get('XDG_CACHE_HOME')\
+            or os.path.join(os.path.expanduser('~'), '.cache')
+        target = IconsCreator.digest(os.path.abspath(outputdir))[0:16]
+
+        return Path(cachehome) / 'openhab_creator' / target
+
+    def _layout_sprite(self) -> None:
+        digests = sorted(self.variants, key=lambda x: self.variants[x][1][0])
+        columns = max(math.ceil(math.sqrt(len(digests))), 1)
+        rows = max(math.ceil(len(digests) / columns), 1)
+
+        lines = [
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{columns}" height="{rows}" viewBox="0 0 {columns} {rows}">'
+        ]
+
+        for index, digest in enumerate(digests):
+            column, row = index % columns, index // columns
+            self.sprite_cells[digest] = (column, row)
+
+            content = base64.b64encode(
+                self.variants[digest][0].encode('utf-8')).decode('ascii')
+            lines.append(f'<image x="{column}" y="{row}" width="1" height="1" '
+                         f'xlink:href="data:image/svg+xml;base64,{content}"/>')
 
-        return content
+        lines.append('</svg>')
+
+        self.sprite_svg = '\n'.join(lines)
+        self.sprite_columns = columns
+        self.sprite_rows = rows
+
+    def _render_pngs(self) -> Dict[Tuple[str, int], bytes]:
+        tasks = []
+        for digest, (content, _icon_names) in self.variants.items():
+            for size in self.sizes:
+                tasks.append((digest, size, (content, size, size)))
+
+        if self.sprite_svg is not None:
+            sprite_digest = self.digest(self.sprite_svg)
+            for size in self.sizes:
+                tasks.append((sprite_digest, size,
+                              (self.sprite_svg, self.sprite_columns * size, self.sprite_rows * size)))
+
+        pngs = {}
+        missing = []
+
+        for digest, size, args in tasks:
+            cachefile = self._cachefile(digest, size)
+            if cachefile is not None and cachefile.exists():
+                self.cached.add(cachefile.name)
+                pngs[(digest, size)] = cachefile.read_bytes()
+            else:
+                missing.append((digest, size, args))
+
+        if self.jobs > 1 and len(missing) > 1:
+            with multiprocessing.Pool(min(self.jobs, len(missing))) as pool:
+                rendered = pool.map(render_png, [args for _digest, _size, args in missing])
+        else:
+            rendered = map(render_png, [args for _digest, _size, args in missing])
+
+        if self.cachedir is not None:
+            os.makedirs(self.cachedir, exist_ok=True)
+
+        for (digest, size, _args), png in zip(missing, rendered):
+            cachefile = self._cachefile(digest, size)
+            if cachefile is not None:
+                self.cached.add(cachefile.name)
+                cachefile.write_bytes(png)
+            pngs[(digest, size)] = png
+
+        logger.info('Icons: %d variants in %d sizes, %d rendered, %d from cache',
+                    len(self.variants), len(self.sizes), len(missing),
+                    len(tasks) - len(missing))
+
+        return pngs
+
+    def _write_sprite(self, pngs: Dict[Tuple[str, int], bytes]) -> None:
+        sprite_digest = self.digest(self.sprite_svg)
+
+        for size in self.sizes:
+            self._write_png(f'{self.HTML_DIR}/sprite-{size}.png',
+                            pngs[(sprite_digest, size)])
+
+        icons = {}
+        for digest, (column, row) in self.sprite_cells.items():
+            for icon_name in self.variants[digest][1]:
+                icons[icon_name] = {
+                    'x': column * self.SIZE,
+                    'y': row * self.SIZE
+                }
+
+        index = {
+            'size': self.SIZE,
+            'width': self.sprite_columns * self.SIZE,
+            'height': self.sprite_rows * self.SIZE,
+            'sprites': {size: f'sprite-{size}.png' for size in self.sizes},
+            'icons': dict(sorted(icons.items()))
+        }
+
+        self._write_text(f'{self.HTML_DIR}/sprite.json',
+                         json.dumps(index, indent=4))
+        self._write_text(f'{self.HTML_DIR}/sprite.css',
+                         self._sprite_css(index))
+
+    def _sprite_css(self, index: Dict) -> str:
+        lines = [
+            f'.{self.SPRITE_CLASS} {{',
+            '    display: inline-block;',
+            f'    width: {self.SIZE}px;',
+            f'    height: {self.SIZE}px;',
+            f'    background-image: url("sprite-{self.SIZE}.png");',
+            f'    background-size: {index["width"]}px {index["height"]}px;',
+            '}'
+        ]
+
+        for size in self.sizes:
+            if size > self.SIZE:
+                lines.extend([
+                    f'@media (min-resolution: {size / self.SIZE:g}dppx) {{',
+                    f'    .{self.SPRITE_CLASS} {{',
+                    f'        background-image: url("sprite-{size}.png");',
+                    '    }',
+                    '}'
+                ])
+
+        for icon_name, position in index['icons'].items():
+            lines.append(f'.{self.SPRITE_CLASS}-{icon_name} {{ '
+                         f'background-position: {-position["x"]}px {-position["y"]}px; }}')
+
+        return '\n'.join(lines) + '\n'
+
+    def _cachefile(self, digest: str, size: int) -> Optional[Path]:
+        if self.cachedir is None:
+            return None
+
+        return self.cachedir / f'{digest}-{size}.png'
+
+    def _prune_cache(self) -> None:
+        if self.cachedir is None:
+            return
+
+        for cachefile in os.scandir(self.cachedir):
+            if cachefile.name not in self.cached:
+                os.remove(cachefile.path)
 
     def _write_svg(self, icon_basename: str, content: str) -> None:
         destination = self._outputdir / f'icons/classic/{icon_basename}.svg'
-        with open(destination, 'w') as destfile:
-            destfile.write(content)
+        BuildCache.write(destination, content, encoding=None)
+
+    def _write_png(self, filename: str, png: bytes) -> None:
+        destination = self._outputdir / filename
+        BuildCache.makedirs(destination.parent)
+        BuildCache.write(destination, png)
 
-    def _convert_write_png(self, icon_basename, content: str) -> None:
-        destination = self._outputdir / f'icons/classic/{icon_basename}.png'
-        svg2png(bytestring=content, write_to=str(destination),
-                output_height=32, output_width=32)
+    def _write_text(self, filename: str, content: str) -> None:
+        destination = self._outputdir / filename
+        BuildCache.makedirs(destination.parent)
+        BuildCache.write(destination, content)
@@ -3,12 +3,11 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from openhab_creator.models.items.baseitem import BaseItem
+from openhab_creator.buildcontext import BuildContext
 from openhab_creator.output.basecreator import BaseCreator
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
-    from openhab_creator.models.grafana import Dashboard
 
 
 class DocumentationCreator(BaseCreator):
@@ -16,23 +15,20 @@ class DocumentationCreator(BaseCreator):
         super().__init__('json', configdir, 'documentation')
 
     def build(self, configuration: Configuration) -> None:
-        self._build_influxdb_series()
-        self._build_aisensors()
-        self._save_grafana_dashboard(configuration.dashboard)
+        context = BuildContext.current()
 
-    def _build_influxdb_series(self) -> None:
-        self._write_json(BaseItem.influxdb_series, 'influxdb_series')
-        self._write_json(list(BaseItem.influxdb_measurements.keys()),
+        self._build_influxdb_series(context)
+        self._build_aisensors(context)
+
+    def _build_influxdb_series(self, context: BuildContext) -> None:
+        self._write_json(context.influxdb_series, 'influxdb_series')
+        self._write_json(list(context.influxdb_measurements.keys()),
                          'influxdb_measurements')
 
-    def _build_aisensors(self) -> None:
-        aisensors = [{"name": name, "typed": typed} for name, typed in BaseItem.aisensors.items()]
+    def _build_aisensors(self, context: BuildContext) -> None:
+        aisensors = [{"name": name, "typed": typed} for name, typed in context.aisensors.items()]
         self._write_json(aisensors, 'aisensors')
 
-    def _save_grafana_dashboard(self, dashboard: Dashboard) -> None:
-        if dashboard.success:
-            self._write_json(dashboard.online, 'grafana_dashboard')
-
     def _write_json(self, raw_object, filename: str) -> None:
         self.append(json.dumps(raw_object, indent=4))
         self.write_file(filename)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import os
-from importlib import import_module
-from typing import TYPE_CHECKING, List, Type, Dict, Union
+import multiprocessing
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
 from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.plugins import PluginManifest
+from openhab_creator.profiler import Profiler
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
@@ -12,16 +14,19 @@ if TYPE_CHECKING:
 
 
 class ItemsCreator(object):
-    def __init__(self, outputdir: str):
+    def __init__(self, outputdir: str, jobs: Optional[int] = 1):
         self.outputdir: str = outputdir
+        self.jobs: int = jobs
 
     def build(self, configuration: Configuration) -> None:
-        ItemsCreatorPipeline.build(self.outputdir, configuration)
+        ItemsCreatorPipeline.build(self.outputdir, configuration, self.jobs)
 
 
 class ItemsCreatorPipeline(object):
     pipeline: List[Dict[str, Union[int, Type[BaseItemsCreator]]]] = []
-    initialized: bool = False
+
+    running: Optional[Tuple[str, Configuration,
+                            List[Dict[str, Union[int, Type[BaseItemsCreator]]]]]] = None
 
     def __init__(self, order_id: int):
         self.order_id: int = order_id
@@ -32,20 +37,65 @@ class ItemsCreatorPipeline(object):
             'class': itemscreator_cls
         })
 
+        return itemscreator_cls
+
+    @classmethod
+    def creators(cls, configuration: Optional[Configuration] = None)\
+            -> List[Dict[str, Union[int, Type[BaseItemsCreator]]]]:
+        return sorted(PluginManifest.items_creators(configuration),
+                      key=lambda x: x['order'])
+
     @classmethod
-    def _init(cls):
-        if not cls.initialized:
-            import_module(
-                'openhab_creator.output.items.creators')
+    def build(cls, outputdir: str,
+              configuration: Configuration,
+              jobs: Optional[int] = 1) -> None:
+        if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                'Parallel item creators need the fork start method, building serially')
+            jobs = 1
 
-            cls.initialized = True
+        if jobs > 1:
+            cls._build_parallel(outputdir, configuration, jobs)
+        else:
+            for creator in cls.creators(configuration):
+                logger.info(
+                    f'Item creator: {creator["class"].__name__} ({creator["order"]})')
+                with Profiler.stage(creator['class'].__name__):
+                    c = creator['class'](outputdir)
+                    c.build(configuration)
 
     @classmethod
-    def build(cls, outputdir: str, configuration: Configuration) -> None:
-        cls._init()
+    def _build_parallel(cls, outputdir: str,
+                        configuration: Configuration,
+                        jobs: int) -> None:
+        creators = cls.creators(configuration)
+        context = BuildContext.current()
+
+        with multiprocessing.get_context('fork')\
+                .Pool(jobs, cls._init_worker, (outputdir, configuration, creators)) as pool:
+            results = pool.imap(cls._build_deferred, range(len(creators)))
+
+            for creator, (deferred, registries) in zip(creators, results):
+                logger.info(
+                    f'Item creator: {creator["class"].__name__} ({creator["order"]})')
+                with Profiler.stage(creator['class'].__name__):
+                    c = creator['class'](outputdir)
+                    c.write_deferred(deferred)
+                    context.merge(registries)
 
-        for creator in sorted(cls.pipeline, key=lambda x: x['order']):
-            logger.info(
-                f'Item creator: {creator["class"].__name__} ({creator["order"]})')
+    @classmethod
+    def _init_worker(cls, outputdir: str, configuration: Configuration,
+                     creators: List[Dict[str, Union[int, Type[BaseItemsCreator]]]]) -> None:
+        cls.running = (outputdir, configuration, creators)
+
+    @classmethod
+    def _build_deferred(cls, index: int) -> Tuple[List[Tuple[str, str]], Dict[str, Dict]]:
+        outputdir, configuration, creators = cls.running
+        creator = creators[index]
+
+        with BuildContext.activate(BuildContext()) as context:
             c = creator['class'](outputdir)
+            c.defer()
             c.build(configuration)
+
+        return c.deferred, context.registries()
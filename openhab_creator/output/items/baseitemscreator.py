@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from openhab_creator.output.basecreator import BaseCreator
 
@@ -10,21 +10,13 @@ if TYPE_CHECKING:
 
 
 class BaseItemsCreator(BaseCreator):
+    needed_equipment: Optional[Tuple[str, bool]] = None
+
     def __init__(self, outputdir: str):
         super().__init__('items', outputdir)
 
-        self.items: List[BaseItem] = []
-
     def build(self, configuration: Configuration) -> None:
         raise NotImplementedError("Must override build")
 
     def append_item(self, item: BaseItem) -> None:
-        self.items.append(item)
-
-    def write_file(self, filename: str) -> None:
-        for item in self.items:
-            item.build_item(self)
-
-        super().write_file(filename)
-
-        self.items.clear()
+        item.build_item(self)
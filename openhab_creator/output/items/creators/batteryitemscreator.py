@@ -47,8 +47,13 @@ class BatteryItemsCreator(BaseItemsCreator):
                     .semantic(PointType.LOWBATTERY)\
                     .scripting({
                         'message': _('Battery low {name}').format(name=equipment.name_with_type)
-                    })\
-                    .append_to(self)
+                    })
+
+                if equipment.points.has_battery_low:
+                    low_battery_item.channel(
+                        equipment.points.channel('battery_low'))
+
+                low_battery_item.append_to(self)
 
                 if equipment.points.has_battery_level:
                     level_item = Number(equipment.item_ids.levelbattery)\
@@ -59,17 +64,15 @@ class BatteryItemsCreator(BaseItemsCreator):
                         .sensor('batteries', equipment.influxdb_tags)\
                         .channel(equipment.points.channel('battery_level'))\
                         .semantic(PointType.MEASUREMENT, PropertyType.LEVEL)\
-                        .unit('%')\
-                        .append_to(self)
+                        .unit('%')
 
-                if equipment.points.has_battery_low:
-                    low_battery_item.channel(
-                        equipment.points.channel('battery_low'))
-                elif equipment.points.has_battery_level:
-                    level_item\
-                        .groups('CalcLowBattery')\
-                        .scripting({
-                            'low_item': equipment.item_ids.lowbattery
-                        })
+                    if not equipment.points.has_battery_low:
+                        level_item\
+                            .groups('CalcLowBattery')\
+                            .scripting({
+                                'low_item': equipment.item_ids.lowbattery
+                            })
+
+                    level_item.append_to(self)
 
             self.write_file('battery')
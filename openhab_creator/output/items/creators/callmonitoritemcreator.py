@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from openhab_creator import _
 from openhab_creator.models.common import MapTransformation
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
 @ItemsCreatorPipeline(8)
 class CallMonitorItemsCreator(BaseItemsCreator):
+    needed_equipment = ('callmonitor', True)
+
     def build(self, configuration: Configuration) -> None:
         has_callmonitors, callmonitors = configuration.equipment.has(
             'callmonitor')
@@ -24,14 +26,14 @@ class CallMonitorItemsCreator(BaseItemsCreator):
             Group('CallState')\
                 .append_to(self)
 
+            phonebook = self._phonebook(configuration)
+
             for callmonitor in callmonitors:
-                callstate_item = self.build_callmonitor(callmonitor)
-                self._connect_channel_with_phonebook(
-                    callmonitor, callstate_item, configuration)
+                self.build_callmonitor(callmonitor, phonebook)
 
             self.write_file('callmonitor')
 
-    def build_callmonitor(self, callmonitor: CallMonitor) -> Call:
+    def build_callmonitor(self, callmonitor: CallMonitor, phonebook: Optional[str]) -> None:
         Group(callmonitor.item_ids.callmonitor)\
             .label(_('Call monitor {name}').format(name=callmonitor.blankname))\
             .semantic(callmonitor)\
@@ -49,8 +51,13 @@ class CallMonitorItemsCreator(BaseItemsCreator):
                 'lastincoming_item': callmonitor.item_ids.lastincoming,
                 'message': _('Missed call from {caller}')
             })\
-            .channel(callmonitor.points.channel('callstate'))\
-            .append_to(self)
+            .channel(callmonitor.points.channel('callstate'))
+
+        if phonebook is not None:
+            callstate_item.scripting(
+                {'resolved_item': callmonitor.item_ids.incoming_resolved})
+
+        callstate_item.append_to(self)
 
         String(callmonitor.item_ids.laststate)\
             .label(_('Last call state'))\
@@ -73,27 +80,26 @@ class CallMonitorItemsCreator(BaseItemsCreator):
             .semantic(PointType.STATUS)\
             .append_to(self)
 
-        return callstate_item
+        if phonebook is not None:
+            String(callmonitor.item_ids.incoming_resolved)\
+                .label(_('Incoming call name'))\
+                .equipment(callmonitor)\
+                .semantic(PointType.STATUS)\
+                .channel(callmonitor.points.channel('incoming'), ProfileType.PHONEBOOK, {
+                    'phonebook': phonebook,
+                    'phoneNumberIndex': '1',
+                    'matchCount': '5'
+                })\
+                .append_to(self)
+
+    @staticmethod
+    def _phonebook(configuration: Configuration) -> Optional[str]:
+        phonebook = None
 
-    def _connect_channel_with_phonebook(self,
-                                        callmonitor: CallMonitor,
-                                        callstate_item: String,
-                                        configuration: Configuration) -> None:
         if configuration.equipment.has_bridge('tr064'):
             phonebook_bridge = configuration.equipment.bridge('tr064')
             if phonebook_bridge.thing.has_property('phonebookInterval'):
                 phonebook = phonebook_bridge.thing.channelprefix.replace(
                     ':', '_3A')
-                String(callmonitor.item_ids.incoming_resolved)\
-                    .label(_('Incoming call name'))\
-                    .equipment(callmonitor)\
-                    .semantic(PointType.STATUS)\
-                    .channel(callmonitor.points.channel('incoming'), ProfileType.PHONEBOOK, {
-                        'phonebook': phonebook,
-                        'phoneNumberIndex': '1',
-                        'matchCount': '5'
-                    })\
-                    .append_to(self)
-
-                callstate_item.scripting(
-                    {'resolved_item': callmonitor.item_ids.incoming_resolved})
+
+        return phonebook
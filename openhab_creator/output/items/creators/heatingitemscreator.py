@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 from openhab_creator import _
 from openhab_creator.models.items import (Group, GroupType, Number, NumberType,
@@ -25,10 +25,10 @@ class HeatingItemsCreator(BaseItemsCreator):
         self.__build_pumps(configuration)
 
         for heating in configuration.equipment.equipment('heating'):
-            heating_item = self.__build_parent(heating)
+            self.__build_parent(heating)
 
-            if not self.__build_subequipment(heating, heating_item):
-                self.__build_thing(heating, heating_item)
+            if not self.__build_subequipment(heating):
+                self.__build_thing(heating)
 
         self.write_file('heating')
 
@@ -131,7 +131,7 @@ class HeatingItemsCreator(BaseItemsCreator):
                 .semantic(PointType.SETPOINT)\
                 .append_to(self)
 
-    def __build_parent(self, heating: Heating) -> Group:
+    def __build_parent(self, heating: Heating) -> None:
         heating_item = Group(heating.item_ids.heating)\
             .label(_('Heating {blankname}').format(blankname=heating.blankname))\
             .icon('heating')\
@@ -143,8 +143,18 @@ class HeatingItemsCreator(BaseItemsCreator):
                 'presences_item': heating.item_ids.autoabsence,
                 'comfort_item': heating.item_ids.comforttemperature,
                 'eco_item': heating.item_ids.ecotemperature
-            })\
-            .append_to(self)
+            })
+
+        if heating.has_subequipment:
+            heating_item.scripting({
+                'is_thing': False,
+                'subequipment': ','.join(subheating.item_ids.heating
+                                         for subheating in heating.subequipment)
+            })
+        else:
+            heating_item.scripting(self.__thing_scripting(heating))
+
+        heating_item.append_to(self)
 
         String(heating.item_ids.heatcontrol)\
             .label(_('Heatcontrol'))\
@@ -230,9 +240,7 @@ class HeatingItemsCreator(BaseItemsCreator):
             })\
             .append_to(self)
 
-        return heating_item
-
-    def __build_subequipment(self, parent_heating: Heating, parent_heating_item: Group) -> bool:
+    def __build_subequipment(self, parent_heating: Heating) -> bool:
         if parent_heating.has_subequipment:
             Group(parent_heating.item_ids.heatsetpoint)\
                 .typed(GroupType.NUMBER_AVG)\
@@ -243,23 +251,23 @@ class HeatingItemsCreator(BaseItemsCreator):
                 .semantic(PointType.SETPOINT, PropertyType.TEMPERATURE)\
                 .append_to(self)
 
-            subheatings = []
-
             for subheating in parent_heating.subequipment:
-                subheatings.append(subheating.item_ids.heating)
-                self.__build_thing(subheating, parent_heating_item)
-
-            parent_heating_item.scripting({
-                'is_thing': False,
-                'subequipment': ','.join(subheatings)
-
-            })
+                self.__build_thing(subheating)
 
         return parent_heating.has_subequipment
 
-    def __build_thing(self, heating: Heating, heating_item: Group) -> None:
+    @staticmethod
+    def __thing_scripting(heating: Heating) -> Dict:
+        return {
+            'is_thing': True,
+            'setpoint_item': heating.item_ids.heatsetpoint,
+            'heatmode_item': heating.item_ids.heatmode,
+            'boost_temp': heating.boost_temp
+        }
+
+    def __build_thing(self, heating: Heating) -> None:
         if heating.is_child:
-            heating_item = Group(heating.item_ids.heating)\
+            Group(heating.item_ids.heating)\
                 .label(_('Heating {name}').format(name=heating.name))\
                 .icon('heating')\
                 .equipment(heating.parent)\
@@ -268,15 +276,9 @@ class HeatingItemsCreator(BaseItemsCreator):
                     'comfort_item': heating.parent.item_ids.comforttemperature,
                     'eco_item': heating.parent.item_ids.ecotemperature
                 })\
+                .scripting(self.__thing_scripting(heating))\
                 .append_to(self)
 
-        heating_item.scripting({
-            'is_thing': True,
-            'setpoint_item': heating.item_ids.heatsetpoint,
-            'heatmode_item': heating.item_ids.heatmode,
-            'boost_temp': heating.boost_temp
-        })
-
         heatsetpoint = Number(heating.item_ids.heatsetpoint)\
             .label(_('Target temperature'))\
             .temperature()\
@@ -286,12 +288,13 @@ class HeatingItemsCreator(BaseItemsCreator):
             .scripting({
                 'boost_temp': heating.boost_temp
             })\
-            .channel(heating.points.channel('heatsetpoint'))\
-            .append_to(self)
+            .channel(heating.points.channel('heatsetpoint'))
 
         if heating.is_child:
             heatsetpoint.groups(heating.parent.item_ids.heatsetpoint)
 
+        heatsetpoint.append_to(self)
+
         scripting = dict(
             map(lambda x: (f'heatmode_{x[0]}', x[1]), heating.heatmode.items()))
 
@@ -11,10 +11,10 @@ from openhab_creator.output.items import ItemsCreatorPipeline
 from openhab_creator.output.items.baseitemscreator import BaseItemsCreator
 
 if TYPE_CHECKING:
-    from openhab_creator.models.configuration import Configuration
+    from openhab_creator.models.configuration import (ButtonAssignment,
+                                                      Configuration)
     from openhab_creator.models.configuration.equipment.types.lightbulb import Lightbulb
     from openhab_creator.models.configuration.equipment.types.motiondetector import MotionDetector
-    from openhab_creator.models.configuration.equipment.types.wallswitch import WallSwitch
 
 
 @ItemsCreatorPipeline(4)
@@ -23,24 +23,22 @@ class LightbulbItemsCreator(BaseItemsCreator):
         self.__build_general_groups()
 
         for lightbulb in configuration.equipment.equipment('lightbulb'):
-            lightbulb_item = self.__build_parent(lightbulb)
+            self.__build_parent(lightbulb)
 
-            if not self.__build_subequipment(lightbulb, lightbulb_item):
-                self.__build_thing(lightbulb, lightbulb_item)
+            if not self.__build_subequipment(lightbulb):
+                self.__build_thing(lightbulb)
 
         self.write_file('lightbulb')
 
         for lightbulb in configuration.equipment.equipment('lightbulb'):
-            if configuration.equipment.has('wallswitch'):
-                self.__build_buttons_assignment(
-                    lightbulb, configuration.equipment.equipment('wallswitch'))
+            self.__build_buttons_assignment(
+                lightbulb, configuration.assignments.lightbulb_buttons(lightbulb))
 
         self.write_file('lightbulb_wallswitch')
 
         for lightbulb in configuration.equipment.equipment('lightbulb'):
-            if configuration.equipment.has('motiondetector'):
-                self.__build_motion_assignment(
-                    lightbulb, configuration.equipment.equipment('motiondetector'))
+            self.__build_motion_assignment(
+                lightbulb, configuration.assignments.lightbulb_motiondetectors(lightbulb))
 
         self.write_file('lightbulb_motiondetector')
 
@@ -101,7 +99,7 @@ class LightbulbItemsCreator(BaseItemsCreator):
         Group('RGBLight')\
             .append_to(self)
 
-    def __build_parent(self, lightbulb: Lightbulb) -> Group:
+    def __build_parent(self, lightbulb: Lightbulb) -> None:
         lightbulb_item = Group(lightbulb.item_ids.lightbulb)\
             .label(_('Lightbulb {blankname}').format(blankname=lightbulb.blankname))\
             .icon('light')\
@@ -116,12 +114,33 @@ class LightbulbItemsCreator(BaseItemsCreator):
                 'motionperiod_item': lightbulb.item_ids.motiondetectorperiod,
                 'motionblocked_item': lightbulb.item_ids.motiondetectorblocked,
                 'motiondetectors_group': lightbulb.item_ids.motiondetectors
-            })\
-            .append_to(self)
+            })
 
         if lightbulb.points.has_rgb:
             lightbulb_item.groups('RGBLight')
 
+        if lightbulb.nightmode:
+            lightbulb_item.scripting({
+                'nightmode_item': lightbulb.item_ids.nightmode
+            })
+
+        if lightbulb.has_subequipment:
+            if lightbulb.points.has_brightness and lightbulb.is_thing:
+                lightbulb_item.scripting({
+                    'brightness_item': lightbulb.item_ids.brightness,
+                    'brightnessgroup_item': lightbulb.item_ids.brightnessgroup
+                })
+
+            lightbulb_item.scripting({
+                'is_thing': lightbulb.is_thing,
+                'subequipment': ','.join(sublightbulb.item_ids.lightbulb
+                                         for sublightbulb in lightbulb.subequipment)
+            })
+        else:
+            lightbulb_item.scripting(self.__thing_scripting(lightbulb))
+
+        lightbulb_item.append_to(self)
+
         String(lightbulb.item_ids.lightcontrol)\
             .label(_('Lightcontrol'))\
             .icon('lightcontrol')\
@@ -216,15 +235,7 @@ class LightbulbItemsCreator(BaseItemsCreator):
                 .semantic(PointType.SETPOINT)\
                 .append_to(self)
 
-            lightbulb_item.scripting({
-                'nightmode_item': lightbulb.item_ids.nightmode
-            })
-
-        return lightbulb_item
-
-    def __build_subequipment(self,
-                             parent_lightbulb: Lightbulb,
-                             parent_lightbulb_item: Group) -> bool:
+    def __build_subequipment(self, parent_lightbulb: Lightbulb) -> bool:
         if parent_lightbulb.has_subequipment:
             if parent_lightbulb.points.has_brightness:
 
@@ -245,12 +256,6 @@ class LightbulbItemsCreator(BaseItemsCreator):
                         .channel(parent_lightbulb.points.channel('brightness'))\
                         .append_to(self)
 
-                    parent_lightbulb_item.scripting({
-
-                        'brightness_item': parent_lightbulb.item_ids.brightness,
-                        'brightnessgroup_item': parent_lightbulb.item_ids.brightnessgroup
-                    })
-
             if parent_lightbulb.points.has_colortemperature:
                 Group(parent_lightbulb.item_ids.colortemperature)\
                     .typed(GroupType.NUMBER_AVG)\
@@ -275,37 +280,46 @@ class LightbulbItemsCreator(BaseItemsCreator):
                     .semantic(PointType.CONTROL)\
                     .append_to(self)
 
-            sublightbulbs = []
-
             for sublightbulb in parent_lightbulb.subequipment:
-                sublightbulbs.append(sublightbulb.item_ids.lightbulb)
-                self.__build_thing(sublightbulb, parent_lightbulb_item)
-
-            parent_lightbulb_item.scripting({
-                'is_thing': parent_lightbulb.is_thing,
-                'subequipment': ','.join(sublightbulbs)
-            })
+                self.__build_thing(sublightbulb)
 
         return parent_lightbulb.has_subequipment
 
-    def __build_thing(self, lightbulb: Lightbulb, lightbulb_item: Group) -> None:
+    @staticmethod
+    def __thing_scripting(lightbulb: Lightbulb) -> Dict:
+        scripting = {
+            'is_thing': True,
+            'cycles_item': lightbulb.item_ids.switchingcycles
+        }
+
+        if lightbulb.points.has_brightness:
+            scripting['brightness_item'] = lightbulb.item_ids.brightness
+
+        if lightbulb.points.has_colortemperature:
+            scripting['colortemperature_item'] = lightbulb.item_ids.colortemperature
+
+        if lightbulb.points.has_onoff:
+            scripting['onoff_item'] = lightbulb.item_ids.onoff
+
+        if lightbulb.points.has_rgb:
+            scripting['rgb_item'] = lightbulb.item_ids.rgb
+
+        return scripting
+
+    def __build_thing(self, lightbulb: Lightbulb) -> None:
         if lightbulb.is_child:
-            lightbulb_item = Group(lightbulb.item_ids.lightbulb)\
+            Group(lightbulb.item_ids.lightbulb)\
                 .label(_('Lightbulb {name}').format(name=lightbulb.name))\
                 .icon('light')\
                 .equipment(lightbulb.parent)\
                 .semantic(lightbulb)\
+                .scripting(self.__thing_scripting(lightbulb))\
                 .append_to(self)
 
-        scripting = {
-            'is_thing': True,
-            'cycles_item': lightbulb.item_ids.switchingcycles
-        }
-
         self._build_switching_cycles(lightbulb)
 
         if lightbulb.points.has_brightness:
-            scripting = self._build_thing_brightness(lightbulb, scripting)
+            self._build_thing_brightness(lightbulb)
 
         if lightbulb.points.has_colortemperature:
             colortemperature = Number(lightbulb.item_ids.colortemperature)\
@@ -321,8 +335,6 @@ class LightbulbItemsCreator(BaseItemsCreator):
 
             colortemperature.append_to(self)
 
-            scripting['colortemperature_item'] = lightbulb.item_ids.colortemperature
-
         if lightbulb.points.has_onoff:
             onoff = Switch(lightbulb.item_ids.onoff)\
                 .label(_('On/Off'))\
@@ -336,8 +348,6 @@ class LightbulbItemsCreator(BaseItemsCreator):
 
             onoff.append_to(self)
 
-            scripting['onoff_item'] = lightbulb.item_ids.onoff
-
         if lightbulb.points.has_rgb:
             rgb = Color(lightbulb.item_ids.rgb)\
                 .label(_('RGB Color'))\
@@ -351,10 +361,6 @@ class LightbulbItemsCreator(BaseItemsCreator):
 
             rgb.append_to(self)
 
-            scripting['rgb_item'] = lightbulb.item_ids.rgb
-
-        lightbulb_item.scripting(scripting)
-
     def _build_switching_cycles(self, lightbulb):
         Number(lightbulb.item_ids.switchingcycles)\
             .typed(NumberType.DIMENSIONLESS)\
@@ -379,39 +385,38 @@ class LightbulbItemsCreator(BaseItemsCreator):
             .expire('10s', state='OFF')\
             .append_to(self)
 
-    def _build_thing_brightness(self, lightbulb: Lightbulb, scripting: Dict) -> Dict:
+    def _build_thing_brightness(self, lightbulb: Lightbulb) -> None:
         dimmmer_item = Dimmer(lightbulb.item_ids.brightness)\
             .label(_('Brightness'))\
             .icon('light')\
             .equipment(lightbulb)\
             .semantic(PointType.CONTROL, PropertyType.LIGHT)\
-            .channel(lightbulb.points.channel('brightness'))\
-            .append_to(self)
-
-        scripting['brightness_item'] = lightbulb.item_ids.brightness
+            .channel(lightbulb.points.channel('brightness'))
 
         if lightbulb.is_child:
             dimmmer_item.groups(lightbulb.parent.item_ids.brightness)
 
-        return scripting
+        dimmmer_item.append_to(self)
 
     def __build_buttons_assignment(self,
                                    lightbulb: Lightbulb,
-                                   wallswitches: List[WallSwitch]) -> None:
-        for wallswitch in wallswitches:
-            for button_key in range(0, wallswitch.buttons_count):
-                String(wallswitch.item_ids.buttonassignment(button_key, lightbulb))\
-                    .label(wallswitch.buttonassignment_name(button_key))\
-                    .icon('configuration')\
-                    .groups(wallswitch.item_ids.buttonassignment(button_key))\
-                    .scripting({
-                        'lightbulb_item': lightbulb.item_ids.lightbulb
-                    })\
-                    .append_to(self)
+                                   buttons: List[ButtonAssignment]) -> None:
+        for button in buttons:
+            String(button.item_id(lightbulb))\
+                .label(button.name)\
+                .icon('configuration')\
+                .groups(button.group)\
+                .scripting({
+                    'lightbulb_item': lightbulb.item_ids.lightbulb
+                })\
+                .append_to(self)
 
     def __build_motion_assignment(self,
                                   lightbulb: Lightbulb,
                                   motiondetectors: List[MotionDetector]) -> None:
+        if len(motiondetectors) == 0:
+            return
+
         Group(lightbulb.item_ids.motiondetectors)\
             .typed(GroupType.ONOFF)\
             .label(_('Motiondetector {lightbulb}').format(lightbulb=lightbulb.name))\
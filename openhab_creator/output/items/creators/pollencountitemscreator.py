@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 @ItemsCreatorPipeline(8)
 class PollenCountItemsCreator(BaseItemsCreator):
+    needed_equipment = ('pollencount', True)
+
     def build(self, configuration: Configuration) -> None:
         has_pollencount, pollencounts = configuration.equipment.has(
             'pollencount')
@@ -52,19 +54,22 @@ class PollenCountItemsCreator(BaseItemsCreator):
                                        pollencount.points.channel(f'{pollentype}_today'))\
                     .equipment(pollencount)\
                     .groups('pollenCountToday')\
-                    .sensor('pollencountindex', influxdb_tags)
+                    .sensor('pollencountindex', influxdb_tags)\
+                    .append_to(self)
 
             if pollencount.points.has_tomorrow(pollentype):
                 self._build_pollentype(pollentype, _(
                     '{pollentype} tomorrow'), pollencount.item_ids.tomorrow(pollentype),
                     pollencount.points.channel(f'{pollentype}_tomorrow'))\
-                    .equipment(pollencount)
+                    .equipment(pollencount)\
+                    .append_to(self)
 
             if pollencount.points.has_day_after_tomorrow(pollentype):
                 self._build_pollentype(pollentype, _(
                     '{pollentype} day after tomorrow'), pollencount.item_ids.day_after_tomorrow(pollentype),
                     pollencount.points.channel(f'{pollentype}_dayafter'))\
-                    .equipment(pollencount)
+                    .equipment(pollencount)\
+                    .append_to(self)
 
     def _build_pollentype(self, pollentype: PollenType, label: str,
                           item: str, channel: str) -> Number:
@@ -74,5 +79,4 @@ class PollenCountItemsCreator(BaseItemsCreator):
             .icon('pollencount')\
             .typed(NumberType.DIMENSIONLESS)\
             .semantic(PointType.MEASUREMENT)\
-            .channel(channel, ProfileType.MAP, 'pollencountapi.map')\
-            .append_to(self)
+            .channel(channel, ProfileType.MAP, 'pollencountapi.map')
@@ -28,17 +28,18 @@ class PowerOutletItemsCreator(BaseItemsCreator):
 
         for poweroutlet in configuration.equipment.equipment('poweroutlet'):
             poweroutlet_item = Group(poweroutlet.item_ids.poweroutlet)\
-                .semantic('PowerOutlet')\
-                .append_to(self)
+                .semantic('PowerOutlet')
 
             if poweroutlet.poweroutlet_is_subequipment:
                 poweroutlet_item\
                     .label(_('Power outlet'))\
-                    .equipment(poweroutlet)
+                    .equipment(poweroutlet)\
+                    .append_to(self)
             else:
                 poweroutlet_item\
                     .label(poweroutlet.name_with_type)\
-                    .location(poweroutlet.location)
+                    .location(poweroutlet.location)\
+                    .append_to(self)
 
                 if poweroutlet.points.has_onoff and has_wallswitches:
                     self.__build_buttons_assignment(poweroutlet, wallswitches)
@@ -73,12 +74,13 @@ class PowerOutletItemsCreator(BaseItemsCreator):
                 .config()\
                 .semantic(PointType.SWITCH)\
                 .channel(poweroutlet.points.channel('onoff'))\
-                .scripting(poweroutlet.scripting)\
-                .append_to(self)
+                .scripting(poweroutlet.scripting)
 
             if poweroutlet.onoff_group is not None:
                 onoff_item.groups(poweroutlet.onoff_group)
 
+            onoff_item.append_to(self)
+
         if poweroutlet.points.has_power:
             Number(poweroutlet.item_ids.power)\
                 .typed(NumberType.POWER)\
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List
 
 from openhab_creator import _
 from openhab_creator.models.common import MapTransformation
@@ -14,8 +14,6 @@ from openhab_creator.output.items.baseitemscreator import BaseItemsCreator
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
-    from openhab_creator.models.configuration.equipment.types.personstate import \
-        PersonState
     from openhab_creator.models.configuration.equipment.types.smartphone import \
         Smartphone
     from openhab_creator.models.configuration.person import Person
@@ -177,36 +175,30 @@ class PresenceItemsCreator(BaseItemsCreator):
                 .append_to(self)
 
     def build_personstates(self, person: Person) -> None:
-        homeoffice_state, homeoffice_item = self.build_personstate(
-            person, PersonStateType.HOMEOFFICE)
-        holidays_state, holidays_item = self.build_personstate(
-            person, PersonStateType.HOLIDAYS)
-        sickness_state, sickness_item = self.build_personstate(
-            person, PersonStateType.SICKNESS)
+        for statetype in (PersonStateType.HOMEOFFICE,
+                          PersonStateType.HOLIDAYS,
+                          PersonStateType.SICKNESS):
+            self.build_personstate(person, statetype)
 
-        if homeoffice_state:
-            if holidays_state:
-                homeoffice_item.scripting({
-                    'holidays_item': holidays_state.item_ids.personstate
-                })
-
-                holidays_item.scripting({
-                    'homeoffice_item': homeoffice_state.item_ids.personstate
-                })
-
-            if sickness_state:
-                homeoffice_item.scripting({
-                    'sickness_item': sickness_state.item_ids.personstate
-                })
-
-                sickness_item.scripting({
-                    'homeoffice_item': homeoffice_state.item_ids.personstate
-                })
+    @staticmethod
+    def _related_personstates(person: Person, statetype: PersonStateType) -> Dict[str, str]:
+        related = {}
+        homeoffice_state = person.get_state(PersonStateType.HOMEOFFICE)
 
-    def build_personstate(self, person: Person, statetype: PersonStateType) \
-            -> Tuple[Union[PersonState, None], Union[Switch, None]]:
+        if homeoffice_state:
+            if statetype == PersonStateType.HOMEOFFICE:
+                for related_type, key in ((PersonStateType.HOLIDAYS, 'holidays_item'),
+                                          (PersonStateType.SICKNESS, 'sickness_item')):
+                    related_state = person.get_state(related_type)
+                    if related_state:
+                        related[key] = related_state.item_ids.personstate
+            elif statetype in (PersonStateType.HOLIDAYS, PersonStateType.SICKNESS):
+                related['homeoffice_item'] = homeoffice_state.item_ids.personstate
+
+        return related
+
+    def build_personstate(self, person: Person, statetype: PersonStateType) -> None:
         personstate = person.get_state(statetype)
-        state_item = None
         if personstate:
             DateTime(personstate.item_ids.begin)\
                 .label(_('Begin'))\
@@ -230,12 +222,17 @@ class PresenceItemsCreator(BaseItemsCreator):
                     'statetype': statetype.identifier,
                     'begin_item': personstate.item_ids.begin,
                     'person': person.name
-                })\
-                .append_to(self)
+                })
 
             if statetype.is_freeday:
                 state_item.groups('PersonStateFreeday')
 
+            related = self._related_personstates(person, statetype)
+            if related:
+                state_item.scripting(related)
+
+            state_item.append_to(self)
+
             if statetype.has_next and personstate.points.has('begin_next'):
                 DateTime(personstate.item_ids.begin_next)\
                     .dateonly_weekday()\
@@ -249,10 +246,9 @@ class PresenceItemsCreator(BaseItemsCreator):
                     .append_to(self)
 
                 tomorrow_item = Switch(personstate.item_ids.personstate_tomorrow)\
-                    .groups(statetype.group_tomorrow)\
-                    .append_to(self)
+                    .groups(statetype.group_tomorrow)
 
                 if statetype.is_freeday:
                     tomorrow_item.groups('PersonStateFreedayTomorrow')
 
-        return personstate, state_item
+                tomorrow_item.append_to(self)
@@ -53,6 +53,9 @@ class SensorItemsCreator(BaseItemsCreator):
         Group('Average7d')\
             .append_to(self)
 
+        Group('Aggregate')\
+            .append_to(self)
+
         Group('PressureSealevel')\
             .append_to(self)
 
@@ -61,12 +64,13 @@ class SensorItemsCreator(BaseItemsCreator):
                 .typed(GroupType.NUMBER_AVG)\
                 .label(sensortype.labels.page)\
                 .format(sensortype.labels.format_str)\
-                .icon(f'{sensortype}')\
-                .append_to(self)
+                .icon(f'{sensortype}')
 
             if sensortype.typed.unit:
                 group_item.unit(sensortype.typed.unit)
 
+            group_item.append_to(self)
+
             if sensortype.labels.has_gui_factor:
                 Group(f'gui{sensortype}All')\
                     .typed(GroupType.NUMBER_AVG)\
@@ -102,12 +106,13 @@ class SensorItemsCreator(BaseItemsCreator):
                         .label(sensortype.labels.item)\
                         .format(sensortype.labels.format_str)\
                         .icon(f'{sensortype}{area.lower()}')\
-                        .groups(f'{sensortype}All')\
-                        .append_to(self)
+                        .groups(f'{sensortype}All')
 
                     if sensortype.typed.unit:
                         group_item.unit(sensortype.typed.unit)
 
+                    group_item.append_to(self)
+
                     if sensortype.labels.has_gui_factor:
                         Group(f'gui{sensortype}{area}')\
                             .typed(GroupType.NUMBER_AVG)\
@@ -132,12 +137,13 @@ class SensorItemsCreator(BaseItemsCreator):
                 .icon(f'{sensortype}{area.lower()}')\
                 .groups(f'{sensortype}{area}')\
                 .location(location)\
-                .semantic(PointType.MEASUREMENT, sensortype.typed.property)\
-                .append_to(self)
+                .semantic(PointType.MEASUREMENT, sensortype.typed.property)
 
             if sensortype.typed.unit:
                 group_item.unit(sensortype.typed.unit)
 
+            group_item.append_to(self)
+
             if sensortype.labels.has_gui_factor:
                 Group(f'gui{sensortype}{location}')\
                     .typed(GroupType.NUMBER_AVG)\
@@ -159,18 +165,20 @@ class SensorItemsCreator(BaseItemsCreator):
             .sensor(sensortype.point, sensor.influxdb_tags)\
             .semantic(PointType.MEASUREMENT, sensortype.typed.property)\
             .channel(sensor.points.channel(sensortype.point))\
-            .aisensor(AISensorDataType.NUMERICAL)\
-            .append_to(self)
+            .aisensor(AISensorDataType.NUMERICAL)
 
         if sensortype.typed.unit:
             sensor_item.unit(sensortype.typed.unit)
 
-        sensor_item = self.moisture_items(sensortype, sensor_item, sensor)
+        self.moisture_sensor(sensortype, sensor_item, sensor)
+        self.pressure_sealevel_sensor(sensortype, sensor_item, sensor)
+        self.trend_sensor(sensortype, sensor_item, sensor)
 
-        sensor_item = self.pressure_sealevel_items(
-            sensortype, sensor_item, sensor)
+        sensor_item.append_to(self)
 
-        sensor_item = self.trend_items(sensortype, sensor_item, sensor)
+        self.moisture_items(sensortype, sensor)
+        self.pressure_sealevel_items(sensortype, sensor)
+        self.trend_items(sensortype, sensor)
 
         if sensortype.labels.has_gui_factor:
             String(f'gui{sensortype}{sensor.item_ids.sensor}')\
@@ -183,7 +191,8 @@ class SensorItemsCreator(BaseItemsCreator):
                          ProfileType.JS, f'togui{sensortype.labels.gui_factor}.js')\
                 .append_to(self)
 
-    def moisture_items(self, sensortype: SensorType, sensor_item: BaseItem, sensor: Sensor) -> BaseItem:
+    @staticmethod
+    def moisture_sensor(sensortype: SensorType, sensor_item: BaseItem, sensor: Sensor) -> None:
         if sensortype == SensorType.MOISTURE:
             sensor_item\
                 .scripting({
@@ -191,6 +200,8 @@ class SensorItemsCreator(BaseItemsCreator):
                     'watered_item': sensor.item_ids.moisturelastwatered
                 })
 
+    def moisture_items(self, sensortype: SensorType, sensor: Sensor) -> None:
+        if sensortype == SensorType.MOISTURE:
             DateTime(sensor.item_ids.moisturelastreminder)\
                 .label(_('Last watering reminder'))\
                 .datetime()\
@@ -216,25 +227,25 @@ class SensorItemsCreator(BaseItemsCreator):
                 })\
                 .append_to(self)
 
-        return sensor_item
-
-    def pressure_sealevel_items(self,
-                                sensortype: SensorType,
-                                sensor_item: BaseItem,
-                                sensor: Sensor) -> BaseItem:
+    @staticmethod
+    def pressure_sealevel_sensor(sensortype: SensorType,
+                                 sensor_item: BaseItem,
+                                 sensor: Sensor) -> None:
         if sensortype == SensorType.PRESSURE and sensor.has_altitude:
-            location = sensor.location
-            area = location.area
-
             sensor_item\
                 .scripting({
                     'pressure_sealevel_item': sensor.item_ids.pressure_sealevel,
                     'altitude': sensor.altitude
                 })\
                 .groups('PressureSealevel')\
-                .remove_group(f'{sensortype}{location}')\
+                .remove_group(f'{sensortype}{sensor.location}')\
                 .remove_sensor()
 
+    def pressure_sealevel_items(self, sensortype: SensorType, sensor: Sensor) -> None:
+        if sensortype == SensorType.PRESSURE and sensor.has_altitude:
+            location = sensor.location
+            area = location.area
+
             Number(f'pressureSeaLevel{sensor.item_ids.merged_sensor}')\
                 .typed(sensortype.typed.number)\
                 .label(sensortype.labels.item)\
@@ -245,9 +256,25 @@ class SensorItemsCreator(BaseItemsCreator):
                 .sensor(sensortype.point, sensor.influxdb_tags)\
                 .append_to(self)
 
-        return sensor_item
+    @staticmethod
+    def trend_sensor(sensortype: SensorType, sensor_item: BaseItem, sensor: Sensor) -> None:
+        if sensor.location.area == 'Outdoor' or sensortype == SensorType.PRESSURE:
+            sensor_item\
+                .groups('Trend', 'Aggregate')\
+                .scripting({
+                    'trend_item': f'trend{sensortype}{sensor.item_ids.merged_sensor}',
+                    'aggregate_delta': '1h'
+                })
+
+            if sensortype == SensorType.TEMPERATURE:
+                sensor_item\
+                    .groups('Average7d')\
+                    .scripting({
+                        'average_item': f'average7d{sensortype}{sensor.item_ids.merged_sensor}',
+                        'aggregate_average': '7d'
+                    })
 
-    def trend_items(self, sensortype: SensorType, sensor_item: BaseItem, sensor: Sensor) -> BaseItem:
+    def trend_items(self, sensortype: SensorType, sensor: Sensor) -> None:
         if sensor.location.area == 'Outdoor' or sensortype == SensorType.PRESSURE:
             String(f'trend{sensortype}{sensor.item_ids.merged_sensor}')\
                 .label(_('Trend {label}').format(label=sensortype.labels.item))\
@@ -258,12 +285,6 @@ class SensorItemsCreator(BaseItemsCreator):
                 .aisensor(AISensorDataType.CATEGORICAL)\
                 .append_to(self)
 
-            sensor_item\
-                .groups('Trend')\
-                .scripting({
-                    'trend_item': f'trend{sensortype}{sensor.item_ids.merged_sensor}'
-                })
-
             if sensortype == SensorType.TEMPERATURE:
                 Number(f'average7d{sensortype}{sensor.item_ids.merged_sensor}')\
                     .label(_('7 days average {label}').format(label=sensortype.labels.item))\
@@ -272,11 +293,3 @@ class SensorItemsCreator(BaseItemsCreator):
                     .semantic(PointType.STATUS)\
                     .aisensor(AISensorDataType.NUMERICAL)\
                     .append_to(self)
-
-                sensor_item\
-                    .groups('Average7d')\
-                    .scripting({
-                        'average_item': f'average7d{sensortype}{sensor.item_ids.merged_sensor}'
-                    })
-
-        return sensor_item
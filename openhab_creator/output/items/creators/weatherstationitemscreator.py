@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 from openhab_creator import _
 from openhab_creator.models.common import MapTransformation
@@ -106,26 +106,26 @@ class WeatherStationItemsCreator(BaseItemsCreator):
 
         for weathertype in WeatherStationType:
             if station.points.has(weathertype.point):
-                sensor_item = self._build_station_weathertype(
-                    weathertype, station)
+                self._build_station_weathertype(weathertype, station)
 
                 if weathertype == WeatherStationType.UVINDEX:
-                    self._build_uvindex(station, sensor_item)
+                    self._build_uvindex(station)
 
     def _build_station_weathertype(self,
                                    weathertype: WeatherStationType,
-                                   station: WeatherStation) -> Number:
+                                   station: WeatherStation) -> None:
         if weathertype not in self.groups:
             group_item = Group(f'{weathertype}WeatherStation')\
                 .typed(GroupType.NUMBER_AVG)\
                 .label(weathertype.labels.page)\
                 .format(weathertype.labels.format_str)\
-                .icon(f'{weathertype}')\
-                .append_to(self)
-            
+                .icon(f'{weathertype}')
+
             if weathertype.typed.unit:
                 group_item.unit(weathertype.typed.unit)
 
+            group_item.append_to(self)
+
             if weathertype.labels.has_gui_factor:
                 Group(f'gui{weathertype}WeatherStation')\
                     .typed(GroupType.NUMBER_AVG)\
@@ -145,12 +145,18 @@ class WeatherStationItemsCreator(BaseItemsCreator):
             .semantic(PointType.MEASUREMENT, weathertype.typed.property)\
             .channel(station.points.channel(weathertype.point))\
             .sensor(weathertype.point, station.influxdb_tags)\
-            .aisensor(AISensorDataType.NUMERICAL)\
-            .append_to(self)
-        
+            .aisensor(AISensorDataType.NUMERICAL)
+
         if weathertype.typed.unit:
             sensor_item.unit(weathertype.typed.unit)
 
+        if weathertype == WeatherStationType.UVINDEX:
+            sensor_item\
+                .groups('UVIndex')\
+                .scripting(self._exposure_calcs(station))
+
+        sensor_item.append_to(self)
+
         if weathertype.labels.has_gui_factor:
             Number(f'gui{weathertype}{station.identifier}')\
                 .typed(weathertype.typed.number)\
@@ -163,11 +169,18 @@ class WeatherStationItemsCreator(BaseItemsCreator):
                          ProfileType.JS, f'togui{weathertype.labels.gui_factor}.js')\
                 .append_to(self)
 
-        return sensor_item
-
-    def _build_uvindex(self, station: WeatherStation, uvindex_item: Number) -> None:
+    @staticmethod
+    def _exposure_calcs(station: WeatherStation) -> Dict[str, str]:
         exposure_calcs = {}
 
+        for index in range(1, 7):
+            if not station.points.has(f'safeexposure{index}'):
+                exposure_calcs[f'safe{index}'] = station.item_ids.safeexposure(
+                    index)
+
+        return exposure_calcs
+
+    def _build_uvindex(self, station: WeatherStation) -> None:
         for index in range(1, 7):
             safeexposure_item = Number(station.item_ids.safeexposure(index))\
                 .typed(NumberType.TIME)\
@@ -175,19 +188,13 @@ class WeatherStationItemsCreator(BaseItemsCreator):
                 .format('%d min')\
                 .icon('safeexposure')\
                 .groups(station.item_ids.merged_sensor)\
-                .semantic(PointType.MEASUREMENT)\
-                .append_to(self)
+                .semantic(PointType.MEASUREMENT)
 
             if station.points.has(f'safeexposure{index}'):
                 safeexposure_item.channel(
                     station.points.channel(f'safeexposure{index}'))
-            else:
-                exposure_calcs[f'safe{index}'] = station.item_ids.safeexposure(
-                    index)
 
-        uvindex_item\
-            .groups('UVIndex')\
-            .scripting(exposure_calcs)
+            safeexposure_item.append_to(self)
 
     def _build_warning(self, station: WeatherStation) -> None:
         weatheritems = {}
@@ -91,8 +91,26 @@ class WindowItemsCreator(BaseItemsCreator):
                 'absence_message': _('Window {name} still open.').format(name=window.name),
                 'reminder_message': _('Please close the window {name}.').format(name=window.name)
             })\
-            .aisensor(AISensorDataType.CATEGORICAL)\
-            .append_to(self)
+            .aisensor(AISensorDataType.CATEGORICAL)
+
+        if window.remindertime:
+            contact.scripting({
+                'remindertime_item': window.item_ids.remindertime,
+                'sendreminder_item': window.item_ids.sendreminder
+            })
+
+        heating = heatings.get(window.location)
+        if heating is not None:
+            contact.scripting(
+                {
+                    'heating_item': heating.item_ids.heating,
+                    'heating_control_save': heating.item_ids.heatcontrol_save
+                })
+
+        if window.is_child:
+            contact.groups(window.parent.item_ids.windowopen)
+
+        contact.append_to(self)
 
         if window.remindertime:
             Number(window.item_ids.remindertime)\
@@ -113,21 +131,6 @@ class WindowItemsCreator(BaseItemsCreator):
                 .config()\
                 .append_to(self)
 
-            contact.scripting({
-                'remindertime_item': window.item_ids.remindertime,
-                'sendreminder_item': window.item_ids.sendreminder
-            })
-
-        if window.location in heatings:
-            heating = heatings[window.location]
+        if heating is not None:
             String(heating.item_ids.heatcontrol_save)\
                 .append_to(self)
-
-            contact.scripting(
-                {
-                    'heating_item': heating.item_ids.heating,
-                    'heating_control_save': heating.item_ids.heatcontrol_save
-                })
-
-        if window.is_child:
-            contact.groups(window.parent.item_ids.windowopen)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.output.buildcache import BuildCache
+
+
+class OutputStream():
+    BUFFER_SIZE = 65536
+
+    def __init__(self, directory: Union[str, Path],
+                 separator: Optional[str] = '\n',
+                 encoding: Optional[str] = 'utf-8'):
+        self.directory: Path = Path(directory)
+        self.separator: str = separator
+        self.encoding: str = encoding
+        self.sink = BuildContext.current().sink
+        self.tmpfile: Optional[str] = None
+
+        if self.sink is None:
+            os.makedirs(self.directory, exist_ok=True)
+
+            filedescriptor, self.tmpfile = tempfile.mkstemp(
+                dir=self.directory, prefix='.', suffix='.partial')
+            os.chmod(self.tmpfile, 0o666 & ~self.umask())
+
+            self.fobj = open(filedescriptor, 'w', encoding=encoding,
+                             buffering=self.BUFFER_SIZE)
+            BuildContext.current().streams.append(self)
+        else:
+            self.fobj = io.StringIO()
+        self.sha = hashlib.sha256()
+        self.empty: bool = True
+
+    @staticmethod
+    def umask() -> int:
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
+
+    def write(self, lines: str) -> None:
+        if self.empty:
+            self.empty = False
+        else:
+            lines = self.separator + lines
+
+        self.fobj.write(lines)
+        self.sha.update(lines.encode(self.encoding))
+
+    def commit(self, destination: Union[str, Path]) -> bool:
+        if self.sink is not None:
+            self.sink.write(destination, self.fobj.getvalue().encode(self.encoding))
+            self.fobj.close()
+            return True
+
+        self._close()
+        return BuildCache.commit(self.tmpfile, destination, self.sha.hexdigest())
+
+    def discard(self) -> None:
+        self._close()
+        if self.tmpfile is not None and os.path.exists(self.tmpfile):
+            os.remove(self.tmpfile)
+
+    def _close(self) -> None:
+        self.fobj.close()
+
+        streams = BuildContext.current().streams
+        if self in streams:
+            streams.remove(self)
+
+    @classmethod
+    def discard_open(cls) -> None:
+        for stream in list(BuildContext.current().streams):
+            stream.discard()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from openhab_creator import logger
+
+
+class Placeholders():
+    PATTERN = re.compile('__([A-Z0-9_]*)__')
+
+    def __init__(self,
+                 values: Optional[Dict[str, str]] = None,
+                 resolver: Optional[Callable[[str], Optional[str]]] = None):
+        self.values: Dict[str, str] = values or {}
+        self.resolver: Optional[Callable[[str], Optional[str]]] = resolver
+
+        self.used: Set[str] = set()
+        self.unknown: Dict[str, List[str]] = {}
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def tokens(content: str) -> Tuple[str, ...]:
+        return tuple(Placeholders.PATTERN.split(content))
+
+    def render(self, content: str, source: Optional[str] = '') -> str:
+        parts = list(self.tokens(content))
+
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            value = self.value(name)
+
+            if value is None:
+                parts[index] = f'__{name}__'
+                sources = self.unknown.setdefault(name, [])
+                if source not in sources:
+                    sources.append(source)
+            else:
+                parts[index] = value
+                self.used.add(name)
+
+        return ''.join(parts)
+
+    def value(self, name: str) -> Optional[str]:
+        if name in self.values:
+            return self.values[name]
+
+        if self.resolver is not None:
+            return self.resolver(name)
+
+        return None
+
+    @property
+    def unused(self) -> List[str]:
+        return sorted(set(self.values) - self.used)
+
+    def report(self, label: str) -> None:
+        for name, sources in sorted(self.unknown.items()):
+            logger.warning('Unknown %s placeholder __%s__ in %s',
+                           label, name, ', '.join(sources))
+
+        if self.unused:
+            logger.info('Unused %s placeholders: %s',
+                        label, ', '.join(self.unused))
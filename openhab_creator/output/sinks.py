@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import os
+import tarfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from openhab_creator.exception import BuildException
+
+
+class OutputSink(ABC):
+    def __init__(self):
+        self.roots: List[Tuple[str, str]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def mount(self, directory: Union[str, Path], prefix: Optional[str] = '') -> None:
+        self.roots.append((os.path.abspath(directory), prefix))
+        self.roots.sort(key=lambda x: len(x[0]), reverse=True)
+
+    def relpath(self, destination: Union[str, Path]) -> str:
+        destination = os.path.abspath(destination)
+
+        for root, prefix in self.roots:
+            if destination == root or destination.startswith(root + os.sep):
+                return prefix + Path(os.path.relpath(destination, root)).as_posix()
+
+        raise BuildException(f'No output root for {destination}')
+
+    def write(self, destination: Union[str, Path], data: bytes) -> None:
+        relpath = self.relpath(destination)
+
+        with self._lock:
+            self.store(relpath, data)
+
+    @abstractmethod
+    def store(self, relpath: str, data: bytes) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySink(OutputSink):
+    def __init__(self):
+        super().__init__()
+        self.files: Dict[str, bytes] = {}
+
+    def store(self, relpath: str, data: bytes) -> None:
+        self.files[relpath] = data
+
+
+class DirectorySink(OutputSink):
+    def __init__(self, directory: Union[str, Path]):
+        super().__init__()
+        self.directory: Path = Path(directory)
+
+    def store(self, relpath: str, data: bytes) -> None:
+        destination = self.directory / relpath
+        os.makedirs(destination.parent, exist_ok=True)
+        destination.write_bytes(data)
+
+
+class TarballSink(OutputSink):
+    def __init__(self, tarball: Union[str, Path]):
+        super().__init__()
+        mode = 'w:gz' if str(tarball).endswith(('.tar.gz', '.tgz')) else 'w'
+        self.tarfile: tarfile.TarFile = tarfile.open(tarball, mode)
+        self.created: int = int(time.time())
+
+    def store(self, relpath: str, data: bytes) -> None:
+        tarinfo = tarfile.TarInfo(relpath)
+        tarinfo.size = len(data)
+        tarinfo.mtime = self.created
+        tarinfo.mode = 0o644
+        self.tarfile.addfile(tarinfo, io.BytesIO(data))
+
+    def close(self) -> None:
+        self.tarfile.close()
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from importlib import import_module
 from typing import TYPE_CHECKING, List, Optional, Type, Dict, Union
 
 from openhab_creator import _, logger
 from openhab_creator.models.sitemap import Page, Sitemap, Text
 from openhab_creator.output.basecreator import BaseCreator
+from openhab_creator.plugins import PluginManifest
+from openhab_creator.profiler import Profiler
 
 if TYPE_CHECKING:
     from openhab_creator.models.configuration import Configuration
@@ -21,27 +22,33 @@ class SitemapCreator(BaseCreator):
 
         second_frame = sitemap.second_frame
 
-        SitemapCreatorPipeline.build_mainpage(sitemap, configuration)
+        with Profiler.stage('mainpage'):
+            SitemapCreatorPipeline.build_mainpage(sitemap, configuration)
 
         statuspage = Page(label=_('State')).icon('status')
-        SitemapCreatorPipeline.build_statuspage(statuspage, configuration)
+        with Profiler.stage('statuspage'):
+            SitemapCreatorPipeline.build_statuspage(statuspage, configuration)
 
         configpage = Page(label=_('Configuration')).icon('configuration')
-        SitemapCreatorPipeline.build_configpage(configpage, configuration)
+        with Profiler.stage('configpage'):
+            SitemapCreatorPipeline.build_configpage(configpage, configuration)
 
         second_frame\
             .element(statuspage)\
             .element(configpage)
 
-        self.append(sitemap.dump())
-        self.write_file('default')
+        with Profiler.stage('dump'):
+            for line in sitemap.dump_lines():
+                self.append(line)
+            self.write_file('default')
 
 
 class SitemapCreatorPipeline():
     mainpage_pipeline: List[Dict[str, Union[int, BaseSitemapCreator]]] = []
     statuspage_pipeline: List[Dict[str, Union[int, BaseSitemapCreator]]] = []
     configpage_pipeline: List[Dict[str, Union[int, BaseSitemapCreator]]] = []
-    initialized: bool = False
+
+    PAGES = ('mainpage', 'statuspage', 'configpage')
 
     def __init__(self,
                  mainpage: Optional[int] = -1,
@@ -67,42 +74,37 @@ class SitemapCreatorPipeline():
         return sitemapcreator_cls
 
     @classmethod
-    def _init(cls):
-        if not cls.initialized:
-            import_module(
-                'openhab_creator.output.sitemap.creators')
+    def creators(cls, page: str,
+                 configuration: Optional[Configuration] = None) -> List[Type[BaseSitemapCreator]]:
+        creators = filter(lambda x: x[page] > -1,
+                          PluginManifest.sitemap_creators())
 
-            cls.initialized = True
+        return [x['class'] for x in sorted(creators, key=lambda x: x[page])
+                if configuration is None or x['class'].has_needed_equipment(configuration)]
 
     @classmethod
     def build_mainpage(cls, sitemap: Sitemap, configuration: Configuration) -> None:
-        cls._init()
-        for creator in sorted(cls.mainpage_pipeline, key=lambda x: x['order']):
-            creator_cls = creator['class']
-            if creator_cls.has_needed_equipment(configuration):
-                logger.info('Sitemap creator (mainpage): %s',
-                            creator_cls.__name__)
+        for creator_cls in cls.creators('mainpage', configuration):
+            logger.info('Sitemap creator (mainpage): %s',
+                        creator_cls.__name__)
+            with Profiler.stage(creator_cls.__name__):
                 creator = creator_cls()
                 creator.build_mainpage(sitemap, configuration)
 
     @classmethod
     def build_statuspage(cls, statuspage: Page, configuration: Configuration) -> None:
-        cls._init()
-        for creator in sorted(cls.statuspage_pipeline, key=lambda x: x['order']):
-            creator_cls = creator['class']
-            if creator_cls.has_needed_equipment(configuration):
-                logger.info('Sitemap creator (statuspage): %s',
-                            creator_cls.__name__)
+        for creator_cls in cls.creators('statuspage', configuration):
+            logger.info('Sitemap creator (statuspage): %s',
+                        creator_cls.__name__)
+            with Profiler.stage(creator_cls.__name__):
                 creator = creator_cls()
                 creator.build_statuspage(statuspage, configuration)
 
     @classmethod
     def build_configpage(cls, configpage: Page, configuration: Configuration) -> None:
-        cls._init()
-        for creator in sorted(cls.configpage_pipeline, key=lambda x: x['order']):
-            creator_cls = creator['class']
-            if creator_cls.has_needed_equipment(configuration):
-                logger.info('Sitemap creator (configpage): %s',
-                            creator_cls.__name__)
+        for creator_cls in cls.creators('configpage', configuration):
+            logger.info('Sitemap creator (configpage): %s',
+                        creator_cls.__name__)
+            with Profiler.stage(creator_cls.__name__):
                 creator = creator_cls()
                 creator.build_configpage(configpage, configuration)
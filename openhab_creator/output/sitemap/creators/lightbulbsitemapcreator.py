@@ -172,7 +172,10 @@ class LightbulbSitemapCreator(BaseSitemapCreator):
                                   lightbulb: Lightbulb,
                                   configuration: Configuration,
                                   lightpage: Page) -> None:
-        if configuration.equipment.has('wallswitch'):
+        wallswitches = configuration.assignments.lightbulb_wallswitches(
+            lightbulb)
+
+        if len(wallswitches) > 0:
             page = Page(label=_('Wallswitch assignments {lightbulb}').format(
                 lightbulb=lightbulb.name))\
                 .icon('configuration')\
@@ -184,7 +187,7 @@ class LightbulbSitemapCreator(BaseSitemapCreator):
             mappings.append(('OFFUNBLOCK', _('Off & unblock')))
             mappings.append(('TRIGGERMOTION', _('Trigger motion')))
 
-            for wallswitch in configuration.equipment.equipment('wallswitch'):
+            for wallswitch in wallswitches:
                 self._create_wallswitch_page(
                     page, lightbulb, wallswitch, mappings)
 
@@ -231,7 +234,10 @@ class LightbulbSitemapCreator(BaseSitemapCreator):
     def _create_motiondetector_page(lightbulb: Lightbulb,
                                     configuration: Configuration,
                                     lightpage: Page) -> None:
-        if configuration.equipment.has('motiondetector'):
+        motiondetectors = configuration.assignments.lightbulb_motiondetectors(
+            lightbulb)
+
+        if len(motiondetectors) > 0:
             page = Page(lightbulb.item_ids.motiondetectors)\
                 .append_to(lightpage)
 
@@ -242,7 +248,7 @@ class LightbulbSitemapCreator(BaseSitemapCreator):
                 .visibility((lightbulb.item_ids.motiondetectorblocked, '==', 'ON'))\
                 .append_to(page)
 
-            for motiondetector in configuration.equipment.equipment('motiondetector'):
+            for motiondetector in motiondetectors:
                 location = motiondetector.location.toplevel
                 frame = page.frame(location.identifier, location.name)
 
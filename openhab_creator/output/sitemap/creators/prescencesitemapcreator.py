@@ -31,10 +31,10 @@ class PresenceSitemapCreator(BaseSitemapCreator):
         for person in configuration.persons:
             self.build_person(page, person)
 
-        Switch('wayhome', {
+        Switch('wayhome', [
             ('OFF', _('Away')),
             ('ON', _('On the way'))
-        })\
+        ])\
             .visibility(
                 ('Presences', '==', '0'),
                 ('wayhome', '==', 'ON')
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import filecmp
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+from openhab_creator import logger
+
+
+class StagedOutput():
+    STAGING_DIR = '.openhab_creator_staging'
+    MANIFEST = '.openhab_creator_manifest.json'
+    ORDER = ('things', 'items', 'sitemaps')
+
+    def __init__(self, outputdir: str):
+        self.outputdir: Path = Path(outputdir)
+        self.stagedir: Path = self.outputdir / self.STAGING_DIR
+        self.manifestfile: Path = self.outputdir / self.MANIFEST
+
+    def prepare(self) -> str:
+        self.discard()
+        os.makedirs(self.stagedir)
+
+        return str(self.stagedir)
+
+    def discard(self) -> None:
+        shutil.rmtree(self.stagedir, ignore_errors=True)
+
+    def deploy(self, keep: Optional[Iterable[str]] = ()) -> None:
+        staged = self._staged_files()
+        previous = self._read_manifest()
+
+        kept = {relpath for relpath in previous
+                if relpath.startswith(tuple(keep))}
+
+        changed = sorted((relpath for relpath in staged if self._changed(relpath)),
+                         key=self._order)
+
+        for relpath in changed:
+            destination = self.outputdir / relpath
+            os.makedirs(destination.parent, exist_ok=True)
+            os.replace(self.stagedir / relpath, destination)
+            logger.info('Deploy %s', relpath)
+
+        stale = sorted(previous - kept - set(staged),
+                       key=self._order, reverse=True)
+
+        for relpath in stale:
+            destination = self.outputdir / relpath
+            if destination.is_file():
+                os.remove(destination)
+                logger.info('Remove stale %s', relpath)
+
+        self._write_manifest(kept.union(staged))
+        self.discard()
+
+        logger.info('Staged output: %d files deployed, %d unchanged, %d removed',
+                    len(changed), len(staged) - len(changed), len(stale))
+
+    def _staged_files(self) -> List[str]:
+        staged = []
+
+        for root, _dirs, files in os.walk(self.stagedir):
+            for filename in files:
+                staged.append(Path(os.path.relpath(
+                    os.path.join(root, filename), self.stagedir)).as_posix())
+
+        return staged
+
+    def _changed(self, relpath: str) -> bool:
+        destination = self.outputdir / relpath
+        return not (destination.is_file()
+                    and filecmp.cmp(self.stagedir / relpath, destination, shallow=False))
+
+    def _order(self, relpath: str) -> Tuple[int, str]:
+        toplevel = relpath.split('/')[0]
+        order = self.ORDER.index(toplevel) if toplevel in self.ORDER\
+            else len(self.ORDER)
+
+        return (order, relpath)
+
+    def _read_manifest(self) -> Set[str]:
+        manifest = set()
+
+        if self.manifestfile.exists():
+            try:
+                with open(self.manifestfile, encoding='utf-8') as fobj:
+                    manifest = set(json.load(fobj))
+            except (OSError, ValueError):
+                logger.warning('Ignoring unreadable manifest %s',
+                               self.manifestfile)
+
+        return manifest
+
+    def _write_manifest(self, manifest: Set[str]) -> None:
+        with open(self.manifestfile, 'w', encoding='utf-8') as fobj:
+            json.dump(sorted(manifest), fobj, indent=1)
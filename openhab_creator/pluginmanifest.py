@@ -0,0 +1,1062 @@
+# Generated by python -m openhab_creator.plugins, do not edit
+MANIFEST = {
+    'equipment': {
+        'astro': 'openhab_creator.models.configuration.equipment.types.astro:Astro',
+        'callmonitor': 'openhab_creator.models.configuration.equipment.types.callmonitor:CallMonitor',
+        'car': 'openhab_creator.models.configuration.equipment.types.car:Car',
+        'dishwasher': 'openhab_creator.models.configuration.equipment.types.whitegood:Dishwasher',
+        'dryer': 'openhab_creator.models.configuration.equipment.types.whitegood:Dryer',
+        'garbagecan': 'openhab_creator.models.configuration.equipment.types.garbagecan:GarbageCan',
+        'gasstation': 'openhab_creator.models.configuration.equipment.types.gasstation:GasStation',
+        'heating': 'openhab_creator.models.configuration.equipment.types.heating:Heating',
+        'learninghouse': 'openhab_creator.models.configuration.equipment.types.learninghouse:LearningHouse',
+        'lightbulb': 'openhab_creator.models.configuration.equipment.types.lightbulb:Lightbulb',
+        'motiondetector': 'openhab_creator.models.configuration.equipment.types.motiondetector:MotionDetector',
+        'networkappliance': 'openhab_creator.models.configuration.equipment.types.networkappliance:NetworkAppliance',
+        'personstate': 'openhab_creator.models.configuration.equipment.types.personstate:PersonState',
+        'pollencount': 'openhab_creator.models.configuration.equipment.types.pollencount:PollenCount',
+        'poweroutlet': 'openhab_creator.models.configuration.equipment.types.poweroutlet:PowerOutlet',
+        'pvsystem': 'openhab_creator.models.configuration.equipment.types.pvsystem:PVSystem',
+        'reminder': 'openhab_creator.models.configuration.equipment.types.reminder:Reminder',
+        'sensor': 'openhab_creator.models.configuration.equipment.types.sensor:Sensor',
+        'smartmeter': 'openhab_creator.models.configuration.equipment.types.smartmeter:SmartMeter',
+        'smartphone': 'openhab_creator.models.configuration.equipment.types.smartphone:Smartphone',
+        'wallswitch': 'openhab_creator.models.configuration.equipment.types.wallswitch:WallSwitch',
+        'warmwaterpump': 'openhab_creator.models.configuration.equipment.types.warmwaterpump:WarmWaterPump',
+        'washingmachine': 'openhab_creator.models.configuration.equipment.types.whitegood:WashingMachine',
+        'washingmachinedryer': 'openhab_creator.models.configuration.equipment.types.whitegood:WashingMachineDryer',
+        'weatherstation': 'openhab_creator.models.configuration.equipment.types.weatherstation:WeatherStation',
+        'whitegood': 'openhab_creator.models.configuration.equipment.types.whitegood:WhiteGood',
+        'window': 'openhab_creator.models.configuration.equipment.types.window:Window'
+    },
+    'locations': {
+        'attic': 'openhab_creator.models.configuration.location.indoor.floors:Attic',
+        'basement': 'openhab_creator.models.configuration.location.indoor.floors:Basement',
+        'bathroom': 'openhab_creator.models.configuration.location.indoor.rooms:Bathroom',
+        'bedroom': 'openhab_creator.models.configuration.location.indoor.rooms:Bedroom',
+        'boilerroom': 'openhab_creator.models.configuration.location.indoor.rooms:BoilerRoom',
+        'building': 'openhab_creator.models.configuration.location.indoor.buildings:Building',
+        'carport': 'openhab_creator.models.configuration.location.outdoors:Carport',
+        'cars': 'openhab_creator.models.configuration.location:Cars',
+        'cellar': 'openhab_creator.models.configuration.location.indoor.rooms:Cellar',
+        'christmas': 'openhab_creator.models.configuration.location:Christmas',
+        'corridor': 'openhab_creator.models.configuration.location.indoor:Corridor',
+        'diningroom': 'openhab_creator.models.configuration.location.indoor.rooms:DiningRoom',
+        'driveway': 'openhab_creator.models.configuration.location.outdoors:Driveway',
+        'energymanagement': 'openhab_creator.models.configuration.location:EnergyManagement',
+        'entry': 'openhab_creator.models.configuration.location.indoor.rooms:Entry',
+        'familyroom': 'openhab_creator.models.configuration.location.indoor.rooms:FamilyRoom',
+        'firstfloor': 'openhab_creator.models.configuration.location.indoor.floors:FirstFloor',
+        'floor': 'openhab_creator.models.configuration.location.indoor.floors:Floor',
+        'garage': 'openhab_creator.models.configuration.location.indoor.buildings:Garage',
+        'garden': 'openhab_creator.models.configuration.location.outdoors:Garden',
+        'groundfloor': 'openhab_creator.models.configuration.location.indoor.floors:GroundFloor',
+        'guestroom': 'openhab_creator.models.configuration.location.indoor.rooms:GuestRoom',
+        'house': 'openhab_creator.models.configuration.location.indoor.buildings:House',
+        'indoor': 'openhab_creator.models.configuration.location.indoor:Indoor',
+        'kitchen': 'openhab_creator.models.configuration.location.indoor.rooms:Kitchen',
+        'laundryroom': 'openhab_creator.models.configuration.location.indoor.rooms:LaundryRoom',
+        'livingroom': 'openhab_creator.models.configuration.location.indoor.rooms:LivingRoom',
+        'office': 'openhab_creator.models.configuration.location.indoor.rooms:Office',
+        'outdoor': 'openhab_creator.models.configuration.location.outdoors:Outdoor',
+        'patio': 'openhab_creator.models.configuration.location.outdoors:Patio',
+        'porch': 'openhab_creator.models.configuration.location.outdoors:Porch',
+        'room': 'openhab_creator.models.configuration.location.indoor.rooms:Room',
+        'secondfloor': 'openhab_creator.models.configuration.location.indoor.floors:SecondFloor',
+        'shed': 'openhab_creator.models.configuration.location.indoor.buildings:Shed',
+        'summerhouse': 'openhab_creator.models.configuration.location.indoor.buildings:SummerHouse',
+        'terrace': 'openhab_creator.models.configuration.location.outdoors:Terrace',
+        'thirdfloor': 'openhab_creator.models.configuration.location.indoor.floors:ThirdFloor',
+        'veranda': 'openhab_creator.models.configuration.location.indoor.rooms:Veranda'
+    },
+    'items': [
+        {
+            'class': 'openhab_creator.output.items.creators.generalitemscreator:GeneralItemsCreator',
+            'order': 0,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.sceneitemscreator:SceneItemsCreator',
+            'order': 1,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.calendaritemscreator:CalendarItemsCreator',
+            'order': 1,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.locationitemscreator:LocationItemsCreator',
+            'order': 2,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.wallswitchitemscreator:WallSwitchItemsCreator',
+            'order': 3,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.presenceitemscreator:PresenceItemsCreator',
+            'order': 3,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.motiondetectoritemscreator:MotionDetectorItemsCreator',
+            'order': 3,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.windowitemscreator:WindowItemsCreator',
+            'order': 4,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.pvsystemitemscreator:PVSystemItemsCreator',
+            'order': 4,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.lightbulbitemscreator:LightbulbItemsCreator',
+            'order': 4,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.heatingitemscreator:HeatingItemsCreator',
+            'order': 4,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.whitegooditemscreator:WhiteGoodItemsCreator',
+            'order': 5,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.smartmeteritemscreator:SmartMeterItemsCreator',
+            'order': 5,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.caritemscreator:CarItemsCreator',
+            'order': 5,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.learninghouseitemscreator:LearningHouseItemsCreator',
+            'order': 6,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.astroitemscreator:AstroItemsCreator',
+            'order': 7,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.poweroutletitemscreator:PowerOutletItemsCreator',
+            'order': 7,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.pollencountitemscreator:PollenCountItemsCreator',
+            'order': 8,
+            'needed_equipment': (
+                'pollencount',
+                True
+            )
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.callmonitoritemcreator:CallMonitorItemsCreator',
+            'order': 8,
+            'needed_equipment': (
+                'callmonitor',
+                True
+            )
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.gasstationitemscreator:GasStationItemsCreator',
+            'order': 8,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.sensoritemscreator:SensorItemsCreator',
+            'order': 9,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.networkitemscreator:NetworkItemsCreator',
+            'order': 10,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.weatherstationitemscreator:WeatherStationItemsCreator',
+            'order': 11,
+            'needed_equipment': None
+        },
+        {
+            'class': 'openhab_creator.output.items.creators.batteryitemscreator:BatteryItemsCreator',
+            'order': 20,
+            'needed_equipment': None
+        }
+    ],
+    'sitemap': [
+        {
+            'class': 'openhab_creator.output.sitemap.creators.batterysitemapcreator:BatterySitemapCreator',
+            'mainpage': -1,
+            'statuspage': 20,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.calendarsitemapcreator:CalendarSitemapCreator',
+            'mainpage': 10,
+            'statuspage': -1,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.energymanagementsitemapcreator:EnergyManagementSitemapCreator',
+            'mainpage': 0,
+            'statuspage': -1,
+            'configpage': 0
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.gasstationsitemapcreator:GasStationSitemapCreator',
+            'mainpage': 80,
+            'statuspage': -1,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.indoorsensorssitemapcreator:IndoorSensorsSitemapCreator',
+            'mainpage': 60,
+            'statuspage': -1,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.learninghousesitemapcreator:LearningHouseSitemapCreator',
+            'mainpage': -1,
+            'statuspage': 30,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.lightbulbsitemapcreator:LightbulbSitemapCreator',
+            'mainpage': 40,
+            'statuspage': 50,
+            'configpage': 10
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.networksitemapcreator:NetworkSitemapCreator',
+            'mainpage': -1,
+            'statuspage': 40,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.pollencountsitemapcreator:PollenCountSitemapCreator',
+            'mainpage': 70,
+            'statuspage': -1,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.poweroutletsitemapcreator:PowerOutletSitemapCreator',
+            'mainpage': 75,
+            'statuspage': -1,
+            'configpage': 15
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.prescencesitemapcreator:PresenceSitemapCreator',
+            'mainpage': -1,
+            'statuspage': 0,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.scenesitemapcreator:SceneSitemapCreator',
+            'mainpage': 20,
+            'statuspage': -1,
+            'configpage': 0
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.temperaturesitemapcreator:TemperatureSitemapCreator',
+            'mainpage': 50,
+            'statuspage': -1,
+            'configpage': 40
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.weatherstationsitemapcreator:WeatherStationSitemapCreator',
+            'mainpage': 30,
+            'statuspage': -1,
+            'configpage': 50
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.whitegoodsitemapcreator:WhiteGoodSitemapCreator',
+            'mainpage': 0,
+            'statuspage': 10,
+            'configpage': -1
+        },
+        {
+            'class': 'openhab_creator.output.sitemap.creators.windowsitemapcreator:WindowSitemapCreator',
+            'mainpage': -1,
+            'statuspage': 60,
+            'configpage': 20
+        }
+    ],
+    'schemas': {
+        'equipment': {
+            'astro': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'callmonitor': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'car': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'dishwasher': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'powerlimits',
+                    'reminder',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'dishwasher'
+            },
+            'dryer': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'powerlimits',
+                    'reminder',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'dryer'
+            },
+            'garbagecan': {
+                'required': [
+                    'message'
+                ],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'gasstation': {
+                'required': [
+                    'points'
+                ],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'heating': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'boost',
+                    'boost_temp',
+                    'heatmode',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'hvac'
+            },
+            'learninghouse': {
+                'required': [
+                    'model_name'
+                ],
+                'optional': [
+                    'icon',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'lightbulb': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'max_colortemp',
+                    'min_colortemp',
+                    'name',
+                    'nightmode',
+                    'points',
+                    'secrets',
+                    'singlebulb',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'lightbulb'
+            },
+            'motiondetector': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'lightbulbs',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'motiondetector'
+            },
+            'networkappliance': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing',
+                    'tr064'
+                ],
+                'category': 'networkappliance'
+            },
+            'personstate': {
+                'required': [
+                    'statetype'
+                ],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'pollencount': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'poweroutlet': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'poweroutlet'
+            },
+            'pvsystem': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'reminder': {
+                'required': [
+                    'message'
+                ],
+                'optional': [
+                    'counter',
+                    'icon',
+                    'identifier',
+                    'interval',
+                    'name',
+                    'points',
+                    'recipient',
+                    'secrets',
+                    'subequipment',
+                    'thing',
+                    'time'
+                ],
+                'category': 'equipment'
+            },
+            'sensor': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'sensor'
+            },
+            'smartmeter': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'equipment'
+            },
+            'smartphone': {
+                'required': [],
+                'optional': [
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'smartphone'
+            },
+            'wallswitch': {
+                'required': [
+                    'buttons'
+                ],
+                'optional': [
+                    'identifier',
+                    'lightbulbs',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'wallswitch'
+            },
+            'warmwaterpump': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'pump'
+            },
+            'washingmachine': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'powerlimits',
+                    'reminder',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'washingmachine'
+            },
+            'washingmachinedryer': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'powerlimits',
+                    'reminder',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'washingmachine'
+            },
+            'weatherstation': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'weatherstation'
+            },
+            'whitegood': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'powerlimits',
+                    'reminder',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'whitegood'
+            },
+            'window': {
+                'required': [],
+                'optional': [
+                    'altitude',
+                    'identifier',
+                    'name',
+                    'points',
+                    'remindertime',
+                    'secrets',
+                    'subequipment',
+                    'thing'
+                ],
+                'category': 'window'
+            }
+        },
+        'locations': {
+            'attic': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'basement': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'bathroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'bedroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'boilerroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'building': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'carport': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'cars': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'cellar': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'christmas': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'corridor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'diningroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'driveway': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'energymanagement': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'entry': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'familyroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'firstfloor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'floor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'garage': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'garden': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'groundfloor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'guestroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'house': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'indoor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'kitchen': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'laundryroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'livingroom': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'office': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'outdoor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'patio': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'porch': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'room': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'secondfloor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'shed': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'summerhouse': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'terrace': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            },
+            'thirdfloor': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier',
+                    'rooms'
+                ]
+            },
+            'veranda': {
+                'required': [
+                    'name'
+                ],
+                'optional': [
+                    'equipment',
+                    'identifier'
+                ]
+            }
+        },
+        'bridge': {
+            'required': [
+                'binding'
+            ],
+            'optional': [
+                'identifier',
+                'name',
+                'points',
+                'secrets',
+                'subequipment',
+                'thing'
+            ],
+            'category': 'bridge'
+        },
+        'thing': {
+            'required': [
+                'thingtype'
+            ],
+            'optional': [
+                'asbridge',
+                'bridge',
+                'channels',
+                'mac',
+                'nameprefix',
+                'properties',
+                'thinguid'
+            ]
+        },
+        'channel': {
+            'required': [
+                'name',
+                'properties',
+                'typed'
+            ],
+            'optional': []
+        }
+    }
+}
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import inspect
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+from pkgutil import iter_modules
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from openhab_creator import logger
+from openhab_creator.exception import RegistryException
+
+if TYPE_CHECKING:
+    from openhab_creator.models.configuration import Configuration
+
+
+class PluginManifest():
+    MANIFEST_MODULE = 'openhab_creator.pluginmanifest'
+
+    PACKAGES = {
+        'equipment': 'openhab_creator.models.configuration.equipment.types',
+        'items': 'openhab_creator.output.items.creators',
+        'sitemap': 'openhab_creator.output.sitemap.creators'
+    }
+
+    LOCATION_MODULES = [
+        'openhab_creator.models.configuration.location',
+        'openhab_creator.models.configuration.location.indoor',
+        'openhab_creator.models.configuration.location.indoor.floors',
+        'openhab_creator.models.configuration.location.indoor.rooms',
+        'openhab_creator.models.configuration.location.indoor.buildings',
+        'openhab_creator.models.configuration.location.outdoors'
+    ]
+
+    INJECTED_PARAMETERS = ('self', 'configuration', 'location', 'person',
+                           'parent', 'equipment_node', 'secrets_config')
+
+    _manifest: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def manifest(cls) -> Dict[str, Any]:
+        if cls._manifest is None:
+            cls._manifest = import_module(cls.MANIFEST_MODULE).MANIFEST
+
+        return cls._manifest
+
+    @classmethod
+    def load(cls, reference: str) -> type:
+        module_name, class_name = reference.split(':')
+        return getattr(import_module(module_name), class_name)
+
+    @classmethod
+    def equipment(cls, equipment_type: str) -> type:
+        return cls._lookup('equipment', equipment_type)
+
+    @classmethod
+    def location(cls, location_type: str) -> type:
+        return cls._lookup('locations', location_type)
+
+    @classmethod
+    def _lookup(cls, section: str, typed: str) -> type:
+        references = cls.manifest()[section]
+        if typed not in references:
+            raise RegistryException(
+                f'No class for {section} type: {typed}')
+
+        return cls.load(references[typed])
+
+    @classmethod
+    def preload(cls) -> None:
+        manifest = cls.manifest()
+
+        for section in ('equipment', 'locations'):
+            for reference in manifest[section].values():
+                cls.load(reference)
+
+        for section in ('items', 'sitemap'):
+            for entry in manifest[section]:
+                cls.load(entry['class'])
+
+    @classmethod
+    def items_creators(cls, configuration: Optional[Configuration] = None) -> List[Dict[str, Any]]:
+        return cls._creators('items', configuration)
+
+    @classmethod
+    def sitemap_creators(cls, configuration: Optional[Configuration] = None) -> List[Dict[str, Any]]:
+        return cls._creators('sitemap', configuration)
+
+    @classmethod
+    def _creators(cls, section: str,
+                  configuration: Optional[Configuration]) -> List[Dict[str, Any]]:
+        creators = []
+
+        for entry in cls.manifest()[section]:
+            needed_equipment = entry.get('needed_equipment')
+            if configuration is not None and needed_equipment is not None\
+                    and not configuration.equipment.has(*needed_equipment)[0]:
+                logger.debug('Skip creator without needed equipment: %s',
+                             entry['class'])
+                continue
+
+            creators.append({**entry, 'class': cls.load(entry['class'])})
+
+        return creators
+
+    @classmethod
+    def generate(cls) -> Dict[str, Any]:
+        #pylint: disable=import-outside-toplevel
+        from openhab_creator.models.configuration.equipment import \
+            EquipmentType
+        from openhab_creator.models.configuration.equipment.bridge import \
+            Bridge
+        from openhab_creator.models.configuration.equipment.thing import (
+            Channel, Thing)
+        from openhab_creator.models.configuration.location import \
+            LocationFactory
+        from openhab_creator.output.items import ItemsCreatorPipeline
+        from openhab_creator.output.sitemap import SitemapCreatorPipeline
+
+        for package in cls.PACKAGES.values():
+            cls._import_package(package)
+
+        for module_name in cls.LOCATION_MODULES:
+            import_module(module_name)
+
+        sitemap = {}
+        for page in SitemapCreatorPipeline.PAGES:
+            for creator in getattr(SitemapCreatorPipeline, f'{page}_pipeline'):
+                reference = cls.reference(creator['class'])
+                if reference not in sitemap:
+                    sitemap[reference] = {
+                        'class': reference,
+                        **{x: -1 for x in SitemapCreatorPipeline.PAGES}
+                    }
+                sitemap[reference][page] = creator['order']
+
+        return {
+            'equipment': {typed: cls.reference(equipment_cls)
+                          for typed, equipment_cls in sorted(EquipmentType.registry.items())},
+            'locations': {typed: cls.reference(location_cls)
+                          for typed, location_cls in sorted(LocationFactory.registry.items())},
+            'items': [{
+                'class': cls.reference(creator['class']),
+                'order': creator['order'],
+                'needed_equipment': creator['class'].needed_equipment
+            } for creator in sorted(ItemsCreatorPipeline.pipeline, key=lambda x: x['order'])],
+            'sitemap': sorted(sitemap.values(), key=lambda x: x['class']),
+            'schemas': {
+                'equipment': {typed: cls.equipment_schema(equipment_cls)
+                              for typed, equipment_cls in sorted(EquipmentType.registry.items())},
+                'locations': {typed: cls.schema(location_cls)
+                              for typed, location_cls in sorted(LocationFactory.registry.items())},
+                'bridge': cls.equipment_schema(Bridge),
+                'thing': cls.schema(Thing),
+                'channel': cls.schema(Channel, ('self', 'secrets', 'identifier'))
+            }
+        }
+
+    @classmethod
+    def schema(cls, plugin_cls: type,
+               injected: Optional[Tuple[str]] = None) -> Dict[str, List[str]]:
+        injected = cls.INJECTED_PARAMETERS if injected is None else injected
+        parameters = {}
+
+        for klass in plugin_cls.__mro__:
+            if '__init__' not in klass.__dict__:
+                continue
+
+            more_parameters = False
+            for parameter in inspect.signature(klass.__init__).parameters.values():
+                if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                    more_parameters = True
+                elif parameter.kind != inspect.Parameter.VAR_POSITIONAL\
+                        and parameter.name not in injected:
+                    parameters.setdefault(
+                        parameter.name, parameter.default is inspect.Parameter.empty)
+
+            if not more_parameters:
+                break
+
+        return {
+            'required': sorted(name for name, required in parameters.items() if required),
+            'optional': sorted(name for name, required in parameters.items() if not required)
+        }
+
+    @classmethod
+    def equipment_schema(cls, equipment_cls: type) -> Dict[str, Any]:
+        return {
+            **cls.schema(equipment_cls),
+            'category': equipment_cls.__new__(equipment_cls).category
+        }
+
+    @staticmethod
+    def _import_package(package: str) -> None:
+        package_dir = Path(import_module(package).__file__).resolve().parent
+        for (_, module_name, _) in iter_modules([os.fsdecode(package_dir)]):
+            import_module(f'{package}.{module_name}')
+
+    @staticmethod
+    def reference(plugin_cls: type) -> str:
+        return f'{plugin_cls.__module__}:{plugin_cls.__name__}'
+
+    @classmethod
+    def manifest_file(cls) -> Path:
+        return Path(__file__).resolve().parent / 'pluginmanifest.py'
+
+    @classmethod
+    def dump(cls, manifest: Dict[str, Any]) -> str:
+        return '# Generated by python -m openhab_creator.plugins, do not edit\n'\
+            f'MANIFEST = {cls._format(manifest)}\n'
+
+    @classmethod
+    def _format(cls, value: Any, indent: int = 0) -> str:
+        if isinstance(value, dict):
+            opening, closing = '{', '}'
+            entries = [f'{key!r}: {cls._format(entry, indent + 4)}'
+                       for key, entry in value.items()]
+        elif isinstance(value, list):
+            opening, closing = '[', ']'
+            entries = [cls._format(entry, indent + 4) for entry in value]
+        elif isinstance(value, tuple):
+            opening, closing = '(', ')'
+            entries = [cls._format(entry, indent + 4) for entry in value]
+            if len(entries) == 1:
+                entries[0] += ','
+        else:
+            return repr(value)
+
+        if len(entries) == 0:
+            return f'{opening}{closing}'
+
+        inner = ' ' * (indent + 4)
+        return f'{opening}\n{inner}' + f',\n{inner}'.join(entries)\
+            + f'\n{" " * indent}{closing}'
+
+    @classmethod
+    def write(cls) -> None:
+        with open(cls.manifest_file(), 'w', encoding='utf-8') as fobj:
+            fobj.write(cls.dump(cls.generate()))
+
+    @classmethod
+    def check(cls) -> bool:
+        up_to_date = cls.manifest() == cls.generate()
+        if not up_to_date:
+            logger.error('Plugin manifest %s is outdated',
+                         cls.manifest_file())
+
+        return up_to_date
+
+
+if __name__ == '__main__':
+    if '--check' in sys.argv[1:]:
+        sys.exit(0 if PluginManifest.check() else 1)
+
+    PluginManifest.write()
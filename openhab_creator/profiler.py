@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from openhab_creator import logger
+from openhab_creator.buildcontext import BuildContext
+
+
+class ProfileStage():
+    def __init__(self, name: str, parent: Optional[ProfileStage] = None):
+        self.name: str = name
+        self.parent: Optional[ProfileStage] = parent
+        self.path: str = name if parent is None or parent.parent is None\
+            else f'{parent.path};{name}'
+
+        self.children: List[ProfileStage] = []
+
+        self.wall: float = 0.0
+        self.cpu: float = 0.0
+        self.peak_memory: Optional[int] = 0
+
+    @property
+    def self_wall(self) -> float:
+        return max(self.wall - sum(child.wall for child in self.children), 0.0)
+
+    def flatten(self) -> List[ProfileStage]:
+        stages = [self]
+        for child in self.children:
+            stages.extend(child.flatten())
+
+        return stages
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'path': self.path,
+            'wall': round(self.wall, 6),
+            'cpu': round(self.cpu, 6),
+            'peak_memory': self.peak_memory
+        }
+
+
+class Profiler():
+    JSON_FILENAME = 'profile.json'
+    FOLDED_FILENAME = 'profile.folded'
+
+    _tracing: int = 0
+    _lock: threading.Lock = threading.Lock()
+
+    STAGE_PEAKS: bool = hasattr(tracemalloc, 'reset_peak')
+
+    def __init__(self):
+        self.root: ProfileStage = ProfileStage('build')
+        self.stack: List[ProfileStage] = [self.root]
+
+    @staticmethod
+    def current() -> Optional[Profiler]:
+        return BuildContext.current().profiler
+
+    @classmethod
+    def start(cls) -> None:
+        with cls._lock:
+            if cls._tracing == 0:
+                tracemalloc.start()
+            cls._tracing += 1
+
+    @classmethod
+    def stop(cls) -> None:
+        with cls._lock:
+            cls._tracing -= 1
+            if cls._tracing == 0:
+                tracemalloc.stop()
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name: str) -> Iterator[None]:
+        profiler = cls.current()
+
+        if profiler is None:
+            yield
+            return
+
+        parent = profiler.stack[-1]
+        stage = ProfileStage(name, parent)
+        parent.children.append(stage)
+
+        if cls.STAGE_PEAKS:
+            parent.peak_memory = max(parent.peak_memory,
+                                     tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        else:
+            stage.peak_memory = None
+
+        profiler.stack.append(stage)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield
+        finally:
+            stage.wall = time.perf_counter() - wall_start
+            stage.cpu = time.process_time() - cpu_start
+
+            profiler.stack.pop()
+            if cls.STAGE_PEAKS:
+                stage.peak_memory = max(stage.peak_memory,
+                                        tracemalloc.get_traced_memory()[1])
+                parent.peak_memory = max(parent.peak_memory, stage.peak_memory)
+            else:
+                profiler.root.peak_memory = tracemalloc.get_traced_memory()[1]
+
+    def save(self, configdir: str) -> None:
+        documentationdir = os.path.join(configdir, 'documentation')
+        os.makedirs(documentationdir, exist_ok=True)
+
+        self.root.wall = sum(child.wall for child in self.root.children)
+        self.root.cpu = sum(child.cpu for child in self.root.children)
+
+        stages = self.root.flatten()[1:]
+
+        if not self.STAGE_PEAKS:
+            logger.info('Peak memory per stage needs Python 3.9 or newer')
+
+        with open(os.path.join(documentationdir, self.JSON_FILENAME), 'w',
+                  encoding='utf-8') as fobj:
+            json.dump({
+                'wall': round(self.root.wall, 6),
+                'cpu': round(self.root.cpu, 6),
+                'peak_memory': self.root.peak_memory,
+                'stages': [stage.to_dict() for stage in stages]
+            }, fobj, indent=4)
+
+        with open(os.path.join(documentationdir, self.FOLDED_FILENAME), 'w',
+                  encoding='utf-8') as fobj:
+            for stage in stages:
+                fobj.write(f'{stage.path} {round(stage.self_wall * 1000000)}\n')
+
+        logger.info('Profile: %.2f s wall, %.2f s CPU, %.1f MiB peak memory',
+                    self.root.wall, self.root.cpu,
+                    self.root.peak_memory / (1024 * 1024))
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import bisect
+import json
+import json.decoder
+import json.scanner
+import multiprocessing
+import os
+import re
+import string
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+from openhab_creator import logger
+from openhab_creator.exception import ConfigurationException
+from openhab_creator.models.configuration import SecretsStorage
+from openhab_creator.models.configuration.baseobject import BaseObject
+from openhab_creator.models.configuration.equipment import EquipmentType
+from openhab_creator.plugins import PluginManifest
+
+
+class JsonObject(dict):
+    line: int = 0
+
+
+class JsonArray(list):
+    line: int = 0
+
+
+class JsonSource():
+    def __init__(self, configdir: str, relpath: str):
+        self.relpath: str = relpath
+
+        with open(os.path.join(configdir, relpath), encoding='utf-8') as fobj:
+            self.text: str = fobj.read()
+
+        self._newlines: List[int] = []
+
+    def line(self, offset: int) -> int:
+        return bisect.bisect_left(self._newlines, offset) + 1
+
+    def load(self) -> Any:
+        self._newlines = [match.start()
+                          for match in re.finditer('\n', self.text)]
+
+        decoder = json.JSONDecoder(object_pairs_hook=JsonObject)
+        decoder.parse_object = self._parse_object
+        decoder.parse_array = self._parse_array
+        decoder.scan_once = json.scanner.py_make_scanner(decoder)
+
+        return decoder.decode(self.text)
+
+    def _parse_object(self, s_and_end: Tuple[str, int], *args) -> Tuple[JsonObject, int]:
+        obj, end = json.decoder.JSONObject(s_and_end, *args)
+        obj.line = self.line(s_and_end[1] - 1)
+        return obj, end
+
+    def _parse_array(self, s_and_end: Tuple[str, int], scan_once) -> Tuple[JsonArray, int]:
+        values, end = json.decoder.JSONArray(s_and_end, scan_once)
+        array = JsonArray(values)
+        array.line = self.line(s_and_end[1] - 1)
+        return array, end
+
+
+class ValidationError():
+    def __init__(self, source: str, line: int, message: str):
+        self.source: str = source
+        self.line: int = line
+        self.message: str = message
+
+    def __str__(self) -> str:
+        return f'{self.source}:{self.line}: {self.message}'
+
+
+class ValidationReport():
+    def __init__(self, relpath: str):
+        self.relpath: str = relpath
+        self.errors: List[ValidationError] = []
+        self.missing_secrets: List[str] = []
+
+    def error(self, node: Any, message: str) -> None:
+        self.errors.append(ValidationError(
+            self.relpath, getattr(node, 'line', 1), message))
+
+
+class ConfigValidator():
+    LOCATION_FILES = ['energymanagement.json', 'christmas.json', 'cars.json',
+                      'indoor/buildings.json', 'outdoors.json']
+
+    EQUIPMENT_SECRETS = {
+        'learninghouse': [('learninghouse', '{model_name}', 'baseurl')]
+    }
+
+    PARALLEL_THRESHOLD = 64
+
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    running: Optional[ConfigValidator] = None
+
+    def __init__(self, configdir: str,
+                 anonym: Optional[bool] = False,
+                 jobs: Optional[int] = 1,
+                 templates: Optional[Dict[str, Dict]] = None):
+        self.configdir: str = configdir
+        self.anonym: bool = anonym
+        self.jobs: int = jobs
+
+        self.schemas: Dict[str, Any] = PluginManifest.manifest()['schemas']
+        self.secrets: Dict[str, Any] = {}
+        self.templates: Dict[str, Dict] = dict(templates or {})
+        self.bridges: Dict[str, Dict] = {}
+
+    def run(self) -> bool:
+        start = time.perf_counter()
+        reports = self.validate()
+
+        errors = [error for report in reports for error in report.errors]
+        for error in errors:
+            logger.error('%s', error)
+
+        logger.info('Checked %d configuration files in %.3f s: %d errors',
+                    len(reports), time.perf_counter() - start, len(errors))
+
+        return len(errors) == 0
+
+    def validate(self) -> List[ValidationReport]:
+        reports = [self._read_secrets()]
+
+        for relpath in self._listdir('templates'):
+            report, document = self._load(relpath)
+            reports.append(report)
+            if document is not None:
+                self.templates[self._key(relpath)] = document
+
+        bridges = []
+        for relpath in self._listdir('bridges'):
+            report, document = self._load(relpath)
+            bridges.append((report, document))
+            if isinstance(document, dict):
+                self.bridges[self._key(relpath)] = document
+
+        for report, document in bridges:
+            if document is not None:
+                self._check_bridge(report, document)
+            reports.append(report)
+
+        tasks = [('general', 'general.json')]\
+            if os.path.exists(os.path.join(self.configdir, 'general.json')) else []
+        tasks += [('floor', relpath)
+                  for relpath in self._listdir('locations/indoor/floors')]
+        tasks += [('locations', f'locations/{filename}')
+                  for filename in self.LOCATION_FILES
+                  if os.path.exists(os.path.join(self.configdir, 'locations', filename))]
+        tasks.append(('persons', 'persons.json'))
+
+        if self.jobs > 1 and len(tasks) >= self.PARALLEL_THRESHOLD:
+            with multiprocessing.Pool(min(self.jobs, len(tasks)),
+                                      self._init_worker, (self,)) as pool:
+                reports += pool.map(self._check_worker, tasks)
+        else:
+            reports += [self._check(task) for task in tasks]
+
+        return reports
+
+    @classmethod
+    def _init_worker(cls, validator: ConfigValidator) -> None:
+        cls.running = validator
+
+    @classmethod
+    def _check_worker(cls, task: Tuple[str, str]) -> ValidationReport:
+        #pylint: disable=protected-access
+        return cls.running._check(task)
+
+    def _check(self, task: Tuple[str, str]) -> ValidationReport:
+        check, relpath = task
+        report, document = self._load(relpath, lines=False)
+
+        if document is not None:
+            getattr(self, f'_check_{check}')(report, document)
+
+            if report.errors:
+                report, document = self._load(relpath)
+                getattr(self, f'_check_{check}')(report, document)
+
+        return report
+
+    def _listdir(self, subdir: str) -> List[str]:
+        srcdir = os.path.join(self.configdir, subdir)
+        if not os.path.isdir(srcdir):
+            return []
+
+        return [f'{subdir}/{name}' for name in sorted(os.listdir(srcdir))
+                if name.endswith('.json')]
+
+    @staticmethod
+    def _key(relpath: str) -> str:
+        return os.path.basename(relpath)[:-5].lower()
+
+    def _load(self, relpath: str, lines: Optional[bool] = True) -> Tuple[ValidationReport, Any]:
+        report = ValidationReport(relpath)
+        document = None
+
+        try:
+            source = JsonSource(self.configdir, relpath)
+            document = source.load() if lines else json.loads(source.text)
+        except json.JSONDecodeError as error:
+            report.errors.append(ValidationError(
+                relpath, error.lineno, f'Invalid JSON: {error.msg}'))
+        except OSError as error:
+            report.errors.append(ValidationError(
+                relpath, 0, f'Unreadable: {error.strerror}'))
+
+        return report, document
+
+    def _read_secrets(self) -> ValidationReport:
+        report = ValidationReport('secrets.yaml')
+
+        if not self.anonym:
+            try:
+                with open(os.path.join(self.configdir, 'secrets.yaml'), encoding='utf-8') as fobj:
+                    self.secrets = SecretsStorage.keys_to_lower(
+                        yaml.load(fobj, Loader=self.YAML_LOADER) or {})
+            except OSError as error:
+                report.errors.append(ValidationError(
+                    report.relpath, 0, f'Unreadable: {error.strerror}'))
+            except yaml.MarkedYAMLError as error:
+                report.errors.append(ValidationError(
+                    report.relpath, error.problem_mark.line + 1, f'Invalid YAML: {error.problem}'))
+
+        return report
+
+    def _secret(self, report: ValidationReport, node: Any, *args: str) -> None:
+        if self.anonym:
+            return
+
+        if SecretsStorage.lookup(self.secrets, *args) is None:
+            secret_key = SecretsStorage.secret_key(*args)
+            report.error(node, f'Missing secret {secret_key}')
+            report.missing_secrets.append(secret_key)
+
+    @staticmethod
+    def _list(report: ValidationReport, node: Any, value: Any, label: str) -> List[Any]:
+        if value is None:
+            return []
+
+        if not isinstance(value, list):
+            report.error(node, f'{label} has to be a list')
+            return []
+
+        return value
+
+    def _check_keys(self, report: ValidationReport, node: Any, label: str,
+                    definition: Dict[str, Any], schema: Dict[str, Any],
+                    allowed: Optional[Tuple[str]] = ()) -> None:
+        #pylint: disable=too-many-arguments
+        for key in schema['required']:
+            if key not in definition:
+                report.error(node, f'{label}: missing "{key}"')
+
+        known = {*schema['required'], *schema['optional'], *allowed}
+        for key in definition:
+            if key not in known:
+                report.error(node, f'{label}: unknown key "{key}"')
+
+    def _check_general(self, report: ValidationReport, document: Any) -> None:
+        for definition in self._list(report, document, document, 'general.json'):
+            self._equipment(report, definition)
+
+    def _check_persons(self, report: ValidationReport, document: Any) -> None:
+        for key, equipment in enumerate(self._list(report, document, document, 'persons.json')):
+            self._secret(report, equipment, f'person{key}', 'identifier')
+
+            name = SecretsStorage.lookup(self.secrets, f'person{key}', 'identifier')
+            owner = BaseObject.format_identifier(
+                str(name or f'__PERSON{key}_IDENTIFIER__'))
+
+            for definition in self._list(report, document, equipment, f'Person {key}'):
+                self._equipment(report, definition, owner, is_person=True)
+
+    def _check_floor(self, report: ValidationReport, document: Any) -> None:
+        self._location(report, document)
+
+    def _check_locations(self, report: ValidationReport, document: Any) -> None:
+        for definition in self._list(report, document, document, report.relpath):
+            self._location(report, definition)
+
+    def _check_bridge(self, report: ValidationReport, document: Any) -> None:
+        if not isinstance(document, dict):
+            report.error(document, 'Bridge definition has to be an object')
+            return
+
+        definition = {key: value for key, value in document.items()
+                      if key != 'typed'}
+        self._check_keys(report, document, 'Bridge', definition,
+                         self.schemas['bridge'])
+
+        identifier = BaseObject.format_identifier(str(definition.get('identifier')
+                                                      or definition.get('name', '')))
+
+        thing = definition.get('thing')
+        if thing:
+            self._thing(report, thing, identifier, self.schemas['bridge']['category'],
+                        definition.get('secrets') or [], binding=definition.get('binding'))
+
+        if 'typed' in document and isinstance(thing, dict):
+            equipment = JsonObject(definition, typed=document['typed'],
+                                   thing={**thing, 'bridge': self._key(report.relpath)})
+            equipment.pop('binding', None)
+            equipment.line = document.line
+            self._equipment(report, equipment)
+
+    def _location(self, report: ValidationReport, definition: Any) -> None:
+        if not isinstance(definition, dict):
+            report.error(definition, 'Location definition has to be an object')
+            return
+
+        typed = definition.get('typed')
+        if typed is None:
+            report.error(definition, 'Location without "typed"')
+            return
+
+        schema = self.schemas['locations'].get(str(typed).lower())
+        if schema is None:
+            report.error(definition, f'Unknown location type "{typed}"')
+            return
+
+        self._check_keys(report, definition, str(typed),
+                         definition, schema, ('typed',))
+
+        identifier = BaseObject.format_identifier(str(definition.get('identifier')
+                                                      or definition.get('name', '')))
+
+        for equipment in self._list(report, definition, definition.get('equipment'), '"equipment"'):
+            self._equipment(report, equipment, identifier)
+
+        for room in self._list(report, definition, definition.get('rooms'), '"rooms"'):
+            self._location(report, room)
+
+    def _equipment(self, report: ValidationReport, node: Any,
+                   owner: Optional[str] = None,
+                   parent_name: Optional[str] = None,
+                   is_person: Optional[bool] = False) -> None:
+        #pylint: disable=too-many-arguments,too-many-locals
+        if not isinstance(node, dict):
+            report.error(node, 'Equipment definition has to be an object')
+            return
+
+        definition = dict(node)
+
+        try:
+            definition = EquipmentType.merge_template(self.templates, definition)
+        except ConfigurationException as error:
+            report.error(node, str(error))
+
+        typed = definition.pop('typed', None)
+        if typed is None:
+            report.error(node, 'Equipment without "typed"')
+            return
+
+        schema = self.schemas['equipment'].get(str(typed).lower())
+        if schema is None:
+            report.error(node, f'Unknown equipment type "{typed}"')
+            return
+
+        self._check_keys(report, node, str(typed), definition, schema)
+
+        name = str(definition.get('name', ''))
+        if parent_name is not None:
+            if 'name' not in definition:
+                report.error(node, f'{typed}: subequipment without "name"')
+            name = f'{parent_name} {name}'.strip()
+
+        identifier = definition.get('identifier')
+        if not identifier:
+            identifier = name if owner is None else f'{owner}{name}'
+        identifier = BaseObject.format_identifier(str(identifier))
+
+        placeholders = None
+        thing = definition.get('thing')
+        if isinstance(thing, dict) and 'thing' not in node:
+            thing = JsonObject(thing)
+            thing.line = getattr(node, 'line', 1)
+        if thing:
+            placeholders = self._thing(report, thing, identifier, schema['category'],
+                                       definition.get('secrets') or [], is_person)
+
+        points = definition.get('points')
+        if placeholders is not None and isinstance(points, dict):
+            self._placeholders(report, points,
+                               points.values(), placeholders)
+
+        for args in self.EQUIPMENT_SECRETS.get(str(typed).lower(), []):
+            try:
+                self._secret(report, node,
+                             *[arg.format_map(definition) for arg in args])
+            except KeyError:
+                pass
+
+        for subequipment in self._list(report, node, definition.get('subequipment'), '"subequipment"'):
+            self._equipment(report, subequipment, owner, name, is_person)
+
+    def _thing(self, report: ValidationReport, thing: Any,
+               identifier: str, category: str, secrets: List[str],
+               is_person: Optional[bool] = False,
+               binding: Optional[str] = None) -> Optional[Set[str]]:
+        #pylint: disable=too-many-arguments
+        if not isinstance(thing, dict):
+            report.error(thing, 'Thing definition has to be an object')
+            return None
+
+        self._check_keys(report, thing, 'Thing', thing, self.schemas['thing'])
+
+        for key in ('bridge', 'asbridge'):
+            if key in thing and str(thing[key]).lower() not in self.bridges:
+                report.error(thing, f'Unknown bridge "{thing[key]}"')
+
+        if 'bridge' in thing:
+            binding = self.bridges.get(
+                str(thing['bridge']).lower(), {}).get('binding')
+        elif binding is None:
+            report.error(thing, 'Thing without "bridge"')
+
+        if binding is not None:
+            for key in secrets:
+                self._secret(report, thing, binding,
+                             category, identifier, str(key))
+
+        if thing.get('mac'):
+            self._secret(report, thing, 'tr064', 'lan',
+                         'mac', category, identifier)
+
+        placeholders = {'identifier', *secrets}
+        if is_person:
+            placeholders.add('person')
+
+        values = [thing.get('thinguid')]
+
+        properties = thing.get('properties') or {}
+        if isinstance(properties, dict):
+            values += properties.values()
+
+        channels = thing.get('channels') or {}
+        for channel_key, channel in (channels.items() if isinstance(channels, dict) else ()):
+            if not isinstance(channel, dict):
+                report.error(thing, f'Channel {channel_key} has to be an object')
+                continue
+
+            self._check_keys(report, channel, f'Channel {channel_key}',
+                             channel, self.schemas['channel'])
+            if isinstance(channel.get('properties'), dict):
+                values += channel['properties'].values()
+
+        self._placeholders(report, thing, values, placeholders)
+
+        return placeholders
+
+    @staticmethod
+    def _placeholders(report: ValidationReport, node: Any,
+                      values: List[Any], placeholders: Set[str]) -> None:
+        for value in values:
+            if not isinstance(value, str):
+                continue
+
+            try:
+                fields = [field for _, field, _, _ in string.Formatter().parse(value)
+                          if field is not None]
+            except ValueError:
+                report.error(node, f'Invalid placeholder in "{value}"')
+                continue
+
+            for field in fields:
+                if re.split(r'[.\[]', field)[0] not in placeholders:
+                    report.error(node, f'Unknown placeholder "{{{field}}}"')
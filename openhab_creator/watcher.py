@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from openhab_creator import __version__, logger
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.output.buildcache import BuildCache
+from openhab_creator.profiler import Profiler
+from openhab_creator.validator import ConfigValidator
+
+if TYPE_CHECKING:
+    from openhab_creator.creator import Creator
+    from openhab_creator.models.configuration import Configuration
+
+
+class Watcher():
+    CONFIGURATION_STAGES = {'basicconfig', 'things', 'items', 'sitemap',
+                            'ephemeris', 'automation', 'documentation'}
+
+    CONTENT_STAGES = {
+        'icons': {'icons'},
+        'html': {'basicconfig'},
+        'ephemeris': {'basicconfig'},
+        'configuration.py': {'automation'}
+    }
+
+    STAGE_DEPENDENCIES = {
+        'automation': {'items'}
+    }
+
+    def __init__(self, creator: Creator, interval: Optional[float] = 1.0):
+        self.creator: Creator = creator
+        self.interval: float = interval
+
+        self.configuration: Optional[Configuration] = None
+        self.build_cache: BuildCache = BuildCache(creator.outputdir)
+        self.context: BuildContext = BuildContext(build_cache=self.build_cache)
+
+    def run(self) -> None:
+        logger.info("openHAB Configuration Creator (%s)", __version__)
+        logger.info("Watching %s, output directory: %s",
+                    self.creator.configdir, self.creator.outputdir)
+
+        try:
+            snapshot = self._snapshot()
+            self._rebuild(None)
+
+            while True:
+                time.sleep(self.interval)
+                current = self._snapshot()
+
+                if current != snapshot:
+                    snapshot = self._wait_until_stable(current)
+                    self._rebuild(self.build_cache.update_inputs(
+                        self.creator.configdir))
+        except KeyboardInterrupt:
+            logger.info('Stop watching')
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        configdir = self.creator.configdir
+
+        for root, dirs, files in os.walk(configdir):
+            if os.path.samefile(root, configdir):
+                dirs[:] = [directory for directory in dirs
+                           if directory not in BuildCache.EXCLUDED_INPUTS]
+
+            for filename in files:
+                srcfile = os.path.join(root, filename)
+                try:
+                    stat = os.stat(srcfile)
+                    snapshot[srcfile] = (stat.st_mtime_ns, stat.st_size)
+                except FileNotFoundError:
+                    pass
+
+        return snapshot
+
+    def _wait_until_stable(self, snapshot: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int]]:
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            if current == snapshot:
+                return current
+
+            snapshot = current
+
+    @classmethod
+    def affected_stages(cls, changed: List[str]) -> Tuple[bool, Set[str]]:
+        reload_configuration = False
+        stages = set()
+
+        for path in changed:
+            toplevel = path.split('/')[0]
+            if toplevel in cls.CONTENT_STAGES:
+                stages.update(cls.CONTENT_STAGES[toplevel])
+            else:
+                reload_configuration = True
+                stages.update(cls.CONFIGURATION_STAGES)
+
+        for stage, dependencies in cls.STAGE_DEPENDENCIES.items():
+            if stage in stages:
+                stages.update(dependencies)
+
+        return reload_configuration, stages
+
+    def _rebuild(self, changed: Optional[List[str]]) -> None:
+        if changed is None:
+            self.build_cache.update_inputs(self.creator.configdir)
+            reload_configuration, stages = True, None
+        elif len(changed) == 0:
+            return
+        else:
+            reload_configuration, stages = self.affected_stages(changed)
+
+        if self.creator.check_only:
+            self._validate()
+            return
+
+        start = time.perf_counter()
+
+        profiler = Profiler() if self.creator.profile else None
+        if profiler is not None:
+            Profiler.start()
+
+        try:
+            if reload_configuration:
+                context = BuildContext(build_cache=self.build_cache,
+                                       profiler=profiler)
+
+                with BuildContext.activate(context), Profiler.stage('configuration'):
+                    configuration = self.creator.configure(
+                        self._reusable_dashboard(changed))
+
+                if configuration.secrets.handle_missing():
+                    return
+
+                self.configuration = configuration
+                self.context = context
+
+            if self.configuration is None:
+                return
+
+            self.context.profiler = profiler
+            with BuildContext.activate(self.context):
+                self.creator.rebuild(self.configuration, stages)
+            self.build_cache.save()
+        except Exception as error:  # pylint: disable=broad-except
+            logger.error('Rebuild failed: %s', error)
+            return
+        finally:
+            self.context.profiler = None
+            if profiler is not None:
+                Profiler.stop()
+
+        if profiler is not None:
+            profiler.save(self.creator.configdir)
+
+        logger.info('Rebuild (%s) finished in %.2f s',
+                    'all' if stages is None else ', '.join(sorted(stages)),
+                    time.perf_counter() - start)
+
+    def _validate(self) -> None:
+        start = time.perf_counter()
+
+        valid = ConfigValidator(self.creator.configdir, self.creator.anonym,
+                                self.creator.jobs, self.creator.templates).run()
+
+        logger.info('Check (%s) finished in %.2f s',
+                    'valid' if valid else 'invalid',
+                    time.perf_counter() - start)
+
+    def _reusable_dashboard(self, changed: Optional[List[str]]):
+        dashboard = None
+
+        if not (self.configuration is None
+                or changed is None
+                or 'secrets.yaml' in changed):
+            dashboard = self.configuration.dashboard
+
+        return dashboard
@@ -35,7 +35,8 @@ setuptools.setup(
     install_requires = requirements,
     entry_points={
         'console_scripts': [
-            'openhab_creator=openhab_creator.cli:cli'
+            'openhab_creator=openhab_creator.cli:cli',
+            'openhab_creator_batch=openhab_creator.cli:batch_cli'
         ]
     },
     project_urls={
@@ -0,0 +1,90 @@
+import unittest
+from types import SimpleNamespace
+
+from openhab_creator.exception import ConfigurationException
+from openhab_creator.models.configuration import AssignmentRegistry
+
+
+class FakeEquipmentRegistry():
+    def __init__(self, **equipment):
+        self._equipment = equipment
+
+    def equipment(self, typed):
+        return self._equipment.get(typed, [])
+
+
+def lightbulb(identifier):
+    return SimpleNamespace(identifier=identifier)
+
+
+def wallswitch(identifier, lightbulbs=None):
+    return SimpleNamespace(
+        identifier=identifier,
+        lightbulbs=lightbulbs,
+        buttons_count=2,
+        buttonassignment_name=lambda key: f'Button {key + 1}',
+        item_ids=SimpleNamespace(
+            buttonassignment=lambda key: f'{identifier}_{key}'))
+
+
+def motiondetector(identifier, lightbulbs=None):
+    return SimpleNamespace(identifier=identifier, lightbulbs=lightbulbs)
+
+
+class AssignmentRegistryTest(unittest.TestCase):
+    def _registry(self, **equipment):
+        configuration = SimpleNamespace(
+            equipment=FakeEquipmentRegistry(**equipment))
+        registry = AssignmentRegistry(configuration)
+        registry.read_configuration()
+        return registry
+
+    def test_without_lightbulbs_assigns_everywhere(self):
+        bulbs = [lightbulb('kitchen'), lightbulb('hall')]
+        switch = wallswitch('switch')
+        detector = motiondetector('detector')
+
+        registry = self._registry(lightbulb=bulbs, wallswitch=[switch],
+                                  motiondetector=[detector])
+
+        for bulb in bulbs:
+            self.assertEqual([switch], registry.lightbulb_wallswitches(bulb))
+            self.assertEqual(2, len(registry.lightbulb_buttons(bulb)))
+            self.assertEqual([detector],
+                             registry.lightbulb_motiondetectors(bulb))
+
+    def test_lightbulbs_restrict_assignment(self):
+        kitchen, hall = lightbulb('kitchen'), lightbulb('hall')
+        switch = wallswitch('switch', ['kitchen'])
+        detector = motiondetector('detector', ['hall'])
+
+        registry = self._registry(lightbulb=[kitchen, hall],
+                                  wallswitch=[switch],
+                                  motiondetector=[detector])
+
+        self.assertEqual([switch], registry.lightbulb_wallswitches(kitchen))
+        self.assertEqual([], registry.lightbulb_wallswitches(hall))
+        self.assertEqual([], registry.lightbulb_buttons(hall))
+        self.assertEqual([], registry.lightbulb_motiondetectors(kitchen))
+        self.assertEqual([detector], registry.lightbulb_motiondetectors(hall))
+
+    def test_duplicate_lightbulbs_assigned_once(self):
+        kitchen = lightbulb('kitchen')
+        switch = wallswitch('switch', ['kitchen', 'kitchen'])
+        detector = motiondetector('detector', ['kitchen', 'kitchen'])
+
+        registry = self._registry(lightbulb=[kitchen], wallswitch=[switch],
+                                  motiondetector=[detector])
+
+        self.assertEqual([switch], registry.lightbulb_wallswitches(kitchen))
+        self.assertEqual(2, len(registry.lightbulb_buttons(kitchen)))
+        self.assertEqual([detector],
+                         registry.lightbulb_motiondetectors(kitchen))
+
+    def test_unknown_lightbulb_raises(self):
+        for equipment in ({'wallswitch': [wallswitch('switch', ['nope'])]},
+                          {'motiondetector': [motiondetector('detector', ['nope'])]}):
+            with self.subTest(equipment=list(equipment)):
+                with self.assertRaisesRegex(ConfigurationException, 'nope'):
+                    self._registry(lightbulb=[lightbulb('kitchen')],
+                                   **equipment)
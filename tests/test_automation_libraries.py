@@ -0,0 +1,365 @@
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+import urllib
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+LIBRARIES = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                         'openhab_creator', 'content', 'automation', 'libraries')
+
+NULL = 'NULL'
+UNDEF = 'UNDEF'
+
+
+class State():
+    def __init__(self, value):
+        self.value = float(value)
+
+    def intValue(self):
+        return int(self.value)
+
+    def floatValue(self):
+        return self.value
+
+    def toFullString(self):
+        return str(self.value)
+
+    def __str__(self):
+        return str(self.value)
+
+
+class TypeParser():
+    @staticmethod
+    def parseState(_, value):
+        try:
+            return State(value)
+        except ValueError:
+            return None
+
+
+class ZonedDateTime():
+    def __init__(self, seconds=0):
+        self.seconds = seconds
+
+    @staticmethod
+    def now():
+        return ZonedDateTime()
+
+    def minusSeconds(self, seconds):
+        return ZonedDateTime(self.seconds - seconds)
+
+
+class RegistryItem():
+    def __init__(self, name):
+        self.name = name
+        self.state = NULL
+        self.members = []
+
+    def getAcceptedDataTypes(self):
+        return []
+
+
+class ItemRegistry():
+    def __init__(self):
+        self.items = {}
+        self.lookups = []
+
+    def getItem(self, name):
+        self.lookups.append(name)
+        return self.items.setdefault(name, RegistryItem(name))
+
+
+class Events():
+    def __init__(self):
+        self.updates = []
+
+    def postUpdate(self, item, value):
+        self.updates.append((item.name, value))
+        item.state = TypeParser.parseState(None, value)
+
+    def sendCommand(self, item, value):
+        self.updates.append((item.name, value))
+
+
+class Metadata():
+    def __init__(self):
+        self.scripting = {}
+        self.lookups = []
+
+    def get_metadata(self, item_name, namespace):
+        self.lookups.append((item_name, namespace))
+        if namespace == 'scripting' and item_name in self.scripting:
+            return types.SimpleNamespace(configuration=self.scripting[item_name])
+
+        return None
+
+
+class HTTP():
+    @staticmethod
+    def sendHttpPostRequest(url, content_type, content, headers, timeout):
+        request = urllib.request.Request(
+            url, content.encode('utf-8'),
+            dict(headers, **{'Content-Type': content_type}))
+        try:
+            with urllib.request.urlopen(request, timeout=timeout / 1000) as response:
+                return response.read().decode('utf-8')
+        except OSError:
+            return None
+
+
+item_registry = ItemRegistry()
+events = Events()
+metadata = Metadata()
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def _library(name):
+    spec = importlib.util.spec_from_file_location(
+        f'personal.{name}', os.path.join(LIBRARIES, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    module.basestring = str
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+with mock.patch.dict(sys.modules, {
+    'core': _module('core'),
+    'core.actions': _module('core.actions', HTTP=HTTP,
+                            PersistenceExtensions=None, Transformation=None),
+    'core.date': _module('core.date', format_date=str,
+                         to_java_zoneddatetime=lambda value: value),
+    'core.jsr223': _module('core.jsr223'),
+    'core.jsr223.scope': _module('core.jsr223.scope',
+                                 CLOSED='CLOSED', NULL=NULL, OFF='OFF', ON='ON',
+                                 OPEN='OPEN', UNDEF=UNDEF, StringType=str,
+                                 events=events, itemRegistry=item_registry),
+    'core.log': _module('core.log', LOG_PREFIX='jsr223', logging=logging),
+    'core.metadata': _module('core.metadata', get_metadata=metadata.get_metadata),
+    'java': _module('java'),
+    'java.time': _module('java.time', ZonedDateTime=ZonedDateTime,
+                         LocalTime=None),
+    'org': _module('org'),
+    'org.openhab': _module('org.openhab'),
+    'org.openhab.core': _module('org.openhab.core'),
+    'org.openhab.core.types': _module('org.openhab.core.types', State=State,
+                                      TypeParser=TypeParser),
+    'personal': _module('personal', __path__=[LIBRARIES])
+}), mock.patch.object(urllib, 'quote', urllib.parse.quote, create=True):
+    personal_item = _library('item')
+    _library('dateutils')
+    personal_influxdbquery = _library('influxdbquery')
+
+Item = personal_item.Item
+ItemCache = personal_item.ItemCache
+ItemTransaction = personal_item.ItemTransaction
+InfluxDBQuery = personal_influxdbquery.InfluxDBQuery
+
+
+class ItemCacheTest(unittest.TestCase):
+    def setUp(self):
+        ItemCache.invalidate()
+        item_registry.lookups.clear()
+        metadata.lookups.clear()
+        metadata.scripting = {'kitchen': {'location_item': 'location'}}
+
+    def test_entry_is_cached(self):
+        self.assertEqual('location', Item('kitchen').scripting('location_item'))
+        self.assertEqual('location', Item('kitchen').scripting('location_item'))
+
+        self.assertEqual(['kitchen'], item_registry.lookups)
+        self.assertEqual([('kitchen', 'scripting'), ('kitchen', 'expire')],
+                         metadata.lookups)
+
+    def test_invalidate_single_item(self):
+        Item('kitchen')
+        Item('hall')
+        metadata.scripting['kitchen'] = {'location_item': 'upstairs'}
+
+        ItemCache.invalidate('kitchen')
+
+        self.assertEqual('upstairs', Item('kitchen').scripting('location_item'))
+        Item('hall')
+        self.assertEqual(['kitchen', 'hall', 'kitchen'], item_registry.lookups)
+
+    def test_invalidate_all_items(self):
+        Item('kitchen')
+        Item('hall')
+
+        ItemCache.invalidate()
+
+        Item('kitchen')
+        Item('hall')
+        self.assertEqual(['kitchen', 'hall', 'kitchen', 'hall'],
+                         item_registry.lookups)
+
+
+class ItemTransactionTest(unittest.TestCase):
+    def setUp(self):
+        ItemCache.invalidate()
+        events.updates.clear()
+        item_registry.getItem('counter').state = State(5)
+
+    def test_updates_are_read_back_and_posted_once(self):
+        with ItemTransaction():
+            for _ in range(3):
+                counter = Item('counter')
+                counter.post_update(counter.get_int(0) + 1)
+
+            self.assertEqual(8, Item('counter').get_int())
+            self.assertEqual([], events.updates)
+
+        self.assertEqual([('counter', 8)], events.updates)
+        self.assertEqual(8, Item('counter').get_int())
+
+    def test_unchanged_updates_are_skipped(self):
+        with ItemTransaction():
+            Item('counter').post_update(5.0)
+
+        self.assertEqual([], events.updates)
+
+    def test_nested_transaction_flushes_with_outer(self):
+        with ItemTransaction():
+            with ItemTransaction():
+                Item('counter').post_update(6)
+
+            self.assertEqual([], events.updates)
+
+        self.assertEqual([('counter', 6)], events.updates)
+
+
+class InfluxDBHandler(BaseHTTPRequestHandler):
+    queries = []
+    responses = {}
+
+    def do_POST(self):  #pylint: disable=invalid-name
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.queries.append(body['query'])
+
+        kind = 'average' if 'mean()' in body['query'] else 'historic'
+        response = self.responses.get(kind)
+        if response is None:
+            self.send_response(500)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(response.encode('utf-8'))
+
+    def log_message(self, *_):
+        pass
+
+
+class PersistenceItem():
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def get_float(self, default_value=None):
+        return default_value if self.value is None else self.value
+
+    def delta_since(self, since):
+        return ('persistence', self.name, since.seconds)
+
+    def average_since(self, since):
+        return ('persistence', self.name, since.seconds)
+
+
+class InfluxDBQueryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), InfluxDBHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever,
+                                      daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        config_file = os.path.join(self.tmpdir.name, 'influxdb.cfg')
+        series_file = os.path.join(self.tmpdir.name, 'influxdbseries.json')
+
+        with open(config_file, 'w', encoding='utf-8') as fobj:
+            fobj.write('Version=V2\n'
+                       f'url=http://127.0.0.1:{self.server.server_port}\n'
+                       'token=secret\ndb=home\nretentionPolicy=openhab\n')
+
+        with open(series_file, 'w', encoding='utf-8') as fobj:
+            json.dump({'kitchen': {'measurement': 'temperature'},
+                       'hall': {'measurement': 'temperature'}}, fobj)
+
+        patcher = mock.patch.multiple(InfluxDBQuery, CONFIG_FILE=config_file,
+                                      SERIES_FILE=series_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        InfluxDBHandler.queries = []
+        InfluxDBHandler.responses = {}
+
+        self.query = InfluxDBQuery.instance()
+        self.query.invalidate()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_historic_range_is_bounded(self):
+        InfluxDBHandler.responses['historic'] = \
+            ',result,table,_value,item\r\n,_result,0,19.5,kitchen\r\n'
+
+        deltas = self.query.delta_since([PersistenceItem('kitchen', 21.0)], 3600)
+
+        self.assertEqual({'kitchen': 1.5}, deltas)
+        self.assertEqual(1, len(InfluxDBHandler.queries))
+        self.assertIn(
+            f'range(start: -{InfluxDBQuery.HISTORIC_LOOKBACK * 3600}s, stop: -3600s)',
+            InfluxDBHandler.queries[0])
+
+    def test_results_are_cached(self):
+        InfluxDBHandler.responses['average'] = \
+            ',result,table,_value,item\r\n,_result,0,20.0,kitchen\r\n'
+        items = [PersistenceItem('kitchen', 21.0)]
+
+        self.assertEqual({'kitchen': 20.0}, self.query.average_since(items, 600))
+        self.assertEqual({'kitchen': 20.0}, self.query.average_since(items, 600))
+        self.assertEqual(1, len(InfluxDBHandler.queries))
+
+    def test_missing_items_fall_back_to_persistence(self):
+        InfluxDBHandler.responses['average'] = \
+            ',result,table,_value,item\r\n,_result,0,20.0,kitchen\r\n\r\n' \
+            ',result,table,_value,item\r\n,_result,1,,hall\r\n'
+        items = [PersistenceItem('kitchen', 21.0),
+                 PersistenceItem('hall', 18.0),
+                 PersistenceItem('cellar', 12.0)]
+
+        averages = self.query.average_since(items, 600)
+
+        self.assertEqual(20.0, averages['kitchen'])
+        self.assertEqual(('persistence', 'hall', -600), averages['hall'])
+        self.assertEqual(('persistence', 'cellar', -600), averages['cellar'])
+        self.assertNotIn('cellar', InfluxDBHandler.queries[0])
+
+    def test_failed_query_falls_back_to_persistence(self):
+        items = [PersistenceItem('kitchen', 21.0)]
+
+        deltas = self.query.delta_since(items, 3600)
+
+        self.assertEqual({'kitchen': ('persistence', 'kitchen', -3600)}, deltas)
+        self.assertEqual(1, len(InfluxDBHandler.queries))
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmark.generator import ConfigGenerator
+from openhab_creator.creator import Creator
+from openhab_creator.output.content.automationcreator import AutomationCreator
+
+
+class IncrementalBuildTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.configdir = os.path.join(self.tmpdir.name, 'config')
+        self.outputdir = os.path.join(self.tmpdir.name, 'output')
+        os.makedirs(self.outputdir)
+
+        ConfigGenerator(self.configdir, 20).generate()
+        self._write_configuration('INFLUXDB_HOST = "__INFLUXDB_HOST__"\n')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write_configuration(self, content):
+        with open(os.path.join(self.configdir, 'configuration.py'), 'w',
+                  encoding='utf-8') as fobj:
+            fobj.write(content)
+
+    def _build(self):
+        creator = Creator('Test', self.configdir, self.outputdir,
+                          anonym=False, check_only=False, icons=False,
+                          incremental=True, jobs=1, profile=False, staged=False,
+                          offline=True, icon_sizes=(), icon_sprite=False)
+        self.assertTrue(creator.run())
+
+    def _influxdb_series(self):
+        with open(os.path.join(self.outputdir, AutomationCreator.INFLUXDBSERIES),
+                  encoding='utf-8') as fobj:
+            return json.load(fobj)
+
+    def test_configuration_only_change_keeps_influxdb_series(self):
+        self._build()
+        series = self._influxdb_series()
+        self.assertGreater(len(series), 0)
+
+        self._write_configuration('INFLUXDB_HOST = "__INFLUXDB_HOST__"\n'
+                                  'CHANGED = True\n')
+        self._build()
+
+        self.assertEqual(series, self._influxdb_series())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+
+from openhab_creator.exception import BuildException
+from openhab_creator.models.configuration import SecretsStorage
+from openhab_creator.output.content.basecontentcreator import \
+    BaseContentCreator
+from openhab_creator.output.placeholders import Placeholders
+
+
+class PlaceholdersTest(unittest.TestCase):
+    def test_names_keep_original_character_class(self):
+        placeholders = Placeholders({'MQTT_USER': 'user', 'MQTT__PORT': '1883',
+                                     'RED____BLUE': 'purple'})
+
+        self.assertEqual('user:1883 purple',
+                         placeholders.render('__MQTT_USER__:__MQTT__PORT__ __RED____BLUE__'))
+
+    def test_lower_case_is_not_a_placeholder(self):
+        placeholders = Placeholders({'RED': '#f00'})
+
+        self.assertEqual('__red__ #f00', placeholders.render('__red__ __RED__'))
+
+    def test_unknown_and_unused_are_reported(self):
+        placeholders = Placeholders({'RED': '#f00', 'BLUE': '#00f'})
+
+        content = placeholders.render('__RED__ __GREEN__', 'icon.svg')
+        placeholders.render('__GREEN__', 'other.svg')
+
+        self.assertEqual('#f00 __GREEN__', content)
+        self.assertEqual({'GREEN': ['icon.svg', 'other.svg']},
+                         placeholders.unknown)
+        self.assertEqual(['BLUE'], placeholders.unused)
+
+        with self.assertLogs('openhab_creator', 'INFO') as logs:
+            placeholders.report('icon')
+
+        self.assertEqual(2, len(logs.records))
+        self.assertIn('__GREEN__', logs.output[0])
+        self.assertIn('icon.svg, other.svg', logs.output[0])
+        self.assertIn('BLUE', logs.output[1])
+
+    def test_resolver(self):
+        placeholders = Placeholders(
+            resolver=lambda name: name.lower() if name != 'NONE' else None)
+
+        self.assertEqual('mqtt_user __NONE__',
+                         placeholders.render('__MQTT_USER__ __NONE__'))
+
+
+class SecretsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.configdir = os.path.join(self.tmpdir.name, 'config')
+        self.outputdir = os.path.join(self.tmpdir.name, 'output')
+        os.makedirs(self.configdir)
+        os.makedirs(self.outputdir)
+
+        with open(os.path.join(self.configdir, 'secrets.yaml'), 'w',
+                  encoding='utf-8') as fobj:
+            fobj.write('mqtt:\n  user: openhab\n')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _copy(self, content, anonym=False):
+        with open(os.path.join(self.configdir, 'services.cfg'), 'w',
+                  encoding='utf-8') as fobj:
+            fobj.write(content)
+
+        secrets = SecretsStorage(self.configdir, anonym)
+        #pylint: disable=protected-access
+        BaseContentCreator(self.outputdir)._copy_file_with_secrets(
+            self.configdir, 'services.cfg', secrets)
+
+        with open(os.path.join(self.outputdir, 'services.cfg'),
+                  encoding='utf-8') as fobj:
+            return fobj.read()
+
+    def test_secrets_are_replaced(self):
+        self.assertEqual('user=openhab', self._copy('user=__MQTT_USER__'))
+
+    def test_missing_secret_is_reported(self):
+        with self.assertLogs('openhab_creator', 'WARNING') as logs:
+            with self.assertRaises(BuildException):
+                self._copy('password=__MQTT_PASSWORD__')
+
+        self.assertIn('Unknown secret placeholder __MQTT_PASSWORD__ in services.cfg',
+                      logs.output[0])
+
+    def test_anonym_keeps_placeholders(self):
+        self.assertEqual('user=__MQTT_USER__',
+                         self._copy('user=__MQTT_USER__', anonym=True))
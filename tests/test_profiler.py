@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+from openhab_creator.buildcontext import BuildContext
+from openhab_creator.profiler import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+    def _profile(self):
+        profiler = Profiler()
+        Profiler.start()
+        try:
+            with BuildContext.activate(BuildContext(profiler=profiler)):
+                with Profiler.stage('items'):
+                    with Profiler.stage('large'):
+                        large = bytearray(4 * 1024 * 1024)
+                        del large
+                    with Profiler.stage('small'):
+                        small = bytearray(1024)
+                        del small
+        finally:
+            Profiler.stop()
+
+        return profiler
+
+    def _saved(self, profiler):
+        with tempfile.TemporaryDirectory() as configdir:
+            profiler.save(configdir)
+            with open(os.path.join(configdir, 'documentation',
+                                   Profiler.JSON_FILENAME),
+                      encoding='utf-8') as fobj:
+                return json.load(fobj)
+
+    @unittest.skipUnless(Profiler.STAGE_PEAKS, 'needs tracemalloc.reset_peak')
+    def test_stage_peaks(self):
+        profile = self._saved(self._profile())
+        stages = {stage['path']: stage for stage in profile['stages']}
+
+        self.assertGreater(stages['items;large']['peak_memory'], 4 * 1024 * 1024)
+        self.assertLess(stages['items;small']['peak_memory'], 4 * 1024 * 1024)
+        self.assertEqual(stages['items;large']['peak_memory'],
+                         stages['items']['peak_memory'])
+        self.assertEqual(stages['items']['peak_memory'], profile['peak_memory'])
+
+    def test_without_reset_peak_keeps_tracing(self):
+        with mock.patch.object(Profiler, 'STAGE_PEAKS', False),\
+                mock.patch.object(tracemalloc, 'stop',
+                                  wraps=tracemalloc.stop) as stop:
+            profiler = self._profile()
+
+            self.assertEqual(1, stop.call_count)
+            profile = self._saved(profiler)
+
+        self.assertTrue(all(stage['peak_memory'] is None
+                            for stage in profile['stages']))
+        self.assertGreater(profile['peak_memory'], 4 * 1024 * 1024)
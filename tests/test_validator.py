@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+
+import yaml
+
+from benchmark.generator import ConfigGenerator
+from openhab_creator.models.configuration import SecretsStorage
+from openhab_creator.validator import ConfigValidator
+
+
+class ConfigValidatorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.configdir = self.tmpdir.name
+
+        ConfigGenerator(self.configdir, 5).generate()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _update(self, filename, update):
+        path = os.path.join(self.configdir, filename)
+        loader, dumper = (yaml.safe_load, yaml.safe_dump)\
+            if filename.endswith('.yaml') else (json.load, json.dump)
+
+        with open(path, encoding='utf-8') as fobj:
+            document = loader(fobj)
+
+        update(document)
+
+        with open(path, 'w', encoding='utf-8') as fobj:
+            dumper(document, fobj)
+
+    def _errors(self):
+        return [error.message for report in ConfigValidator(self.configdir).validate()
+                for error in report.errors]
+
+    def test_generated_configuration_is_valid(self):
+        self.assertEqual([], self._errors())
+
+    def test_unknown_template(self):
+        self._update('general.json', lambda general: general.append(
+            {'typed': 'reminder', 'name': 'Nope', 'message': 'Nope',
+             'template': 'Nope'}))
+
+        self.assertEqual(['No template "nope" in configuration'], self._errors())
+
+    def test_template_is_merged(self):
+        self._update('general.json', lambda general: general.append(
+            {'name': 'Templated', 'template': 'ColorTemperatureLight'}))
+
+        self.assertEqual(['Missing secret deconz_lightbulb_templated_uid'],
+                         self._errors())
+
+    def test_empty_secret_is_missing(self):
+        def clear_baseurl(secrets):
+            secrets['learninghouse']['windowopen']['baseurl'] = None
+
+        self._update('secrets.yaml', clear_baseurl)
+
+        self.assertEqual(['Missing secret learninghouse_windowopen_baseurl'],
+                         self._errors())
+
+
+class SecretsLookupTest(unittest.TestCase):
+    def test_lookup(self):
+        tree = SecretsStorage.keys_to_lower({'MQTT': {'User': 'openhab', 'Port': None},
+                                             1: 'one'})
+
+        self.assertEqual('openhab', SecretsStorage.lookup(tree, 'mqtt', 'USER'))
+        self.assertEqual('one', SecretsStorage.lookup(tree, '1'))
+        self.assertIsNone(SecretsStorage.lookup(tree, 'mqtt', 'port'))
+        self.assertIsNone(SecretsStorage.lookup(tree, 'mqtt', 'user', 'name'))
+        self.assertIsNone(SecretsStorage.lookup(tree, 'missing', 'user'))